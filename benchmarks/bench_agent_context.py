@@ -0,0 +1,65 @@
+"""Benchmark the per-call overhead of the agent functions.
+
+Compares what every agent function used to do before sending a request
+(read and validate the environment, build a MoonrakerClient and a tools
+object, close the client afterwards) with the shared AgentContext lookup.
+No request is sent, so only the overhead around it is measured. Run with:
+
+    uv run python benchmarks/bench_agent_context.py [--calls N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from moonraker_tools.agent.context import AgentContext, get_context
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.tools.printer import PrinterTools
+
+
+async def per_call(calls: int) -> float:
+    """Time the environment parsing and client setup done on every call."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        host = os.getenv("MOONRAKER_HOST")
+        port = os.getenv("MOONRAKER_PORT")
+        api_key = os.getenv("MOONRAKER_API_KEY")
+        if not host or not port:
+            raise ValueError("MOONRAKER_HOST and MOONRAKER_PORT must be set.")
+        client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
+        PrinterTools(client)
+        await client.close()
+    return (time.perf_counter() - start) / calls
+
+
+async def shared(calls: int) -> float:
+    """Time the lookup of the tools object in the shared context."""
+    context: AgentContext = get_context()
+    start = time.perf_counter()
+    for _ in range(calls):
+        get_context().tools(PrinterTools)
+    elapsed = (time.perf_counter() - start) / calls
+    await context.close()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+    os.environ.setdefault("MOONRAKER_HOST", "localhost")
+    os.environ.setdefault("MOONRAKER_PORT", "7125")
+
+    before = asyncio.run(per_call(args.calls))
+    after = asyncio.run(shared(args.calls))
+
+    print(f"{'per-call setup:':<22} {before * 1e6:10.2f} us")
+    print(f"{'shared context:':<22} {after * 1e6:10.2f} us")
+    print(f"{'speedup:':<22} {before / after:10.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Benchmark the cold start of the MCP server.
+
+Each sample runs in a fresh interpreter and measures:
+
+* sdk: importing the ``mcp`` SDK, which this package does not control;
+* import: importing ``moonraker_mcp.server`` once the SDK is loaded;
+* list_tools: answering the first ``list_tools`` request.
+
+The startup budget applies to ``import + list_tools``, this package's share
+of the cold start. The total including the SDK is reported alongside. The
+packages are byte-compiled first, as they are when installed, so that stale
+bytecode is not timed as startup. Run with:
+
+    uv run python benchmarks/bench_startup.py [--samples N] [--budget-ms MS]
+"""
+
+import argparse
+import compileall
+import importlib.util
+import json
+import statistics
+import subprocess
+import sys
+
+BUDGET_MS = 50.0
+
+_SAMPLE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+import mcp.types as types
+t1 = time.perf_counter()
+import moonraker_mcp.server as server
+t2 = time.perf_counter()
+handler = server.server.request_handlers[types.ListToolsRequest]
+result = asyncio.run(handler(None))
+t3 = time.perf_counter()
+print(json.dumps({
+    "sdk": (t1 - t0) * 1e3,
+    "import": (t2 - t1) * 1e3,
+    "list_tools": (t3 - t2) * 1e3,
+    "tools": len(result.root.tools),
+}))
+"""
+
+
+def sample() -> dict:
+    """Measure one cold start in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", _SAMPLE],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    args = parser.parse_args()
+
+    for package in ("moonraker_mcp", "moonraker_tools"):
+        spec = importlib.util.find_spec(package)
+        for path in spec.submodule_search_locations:
+            compileall.compile_dir(path, quiet=1)
+    samples = [sample() for _ in range(args.samples)]
+    medians = {
+        key: statistics.median(s[key] for s in samples)
+        for key in ("sdk", "import", "list_tools")
+    }
+    startup = medians["import"] + medians["list_tools"]
+    total = statistics.median(
+        s["sdk"] + s["import"] + s["list_tools"] for s in samples
+    )
+
+    print(f"tools registered:      {samples[0]['tools']}")
+    for key, value in medians.items():
+        print(f"{key + ' (median):':<22} {value:8.1f} ms")
+    print(f"{'startup (median):':<22} {startup:8.1f} ms (budget {args.budget_ms} ms)")
+    print(f"{'total with sdk:':<22} {total:8.1f} ms")
+    return 0 if startup <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,24 @@
-from . import server
+"""An MCP server for Moonraker.
+
+The server module is imported on first use so that the console script starts
+without paying for it up front.
+"""
+
 import asyncio
+import importlib
+
 
 def main():
     """Main entry point for the package."""
+    server = importlib.import_module(f"{__name__}.server")
     asyncio.run(server.main())
 
+
+def __getattr__(name):
+    if name == "server":
+        return importlib.import_module(f"{__name__}.server")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Optionally expose other important items at package level
-__all__ = ['main', 'server']
\ No newline at end of file
+__all__ = ['main', 'server']
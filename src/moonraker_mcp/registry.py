@@ -0,0 +1,363 @@
+"""A registry that exposes the Moonraker tools as MCP tools."""
+
+import importlib
+import inspect
+import typing
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import mcp.types as types
+
+from moonraker_tools.client import MoonrakerClient
+
+# Tools classes exposed through MCP, keyed by the prefix used for tool names.
+# Modules are referenced by path and only imported when the registry loads.
+TOOL_CLASSES: List[Tuple[str, str]] = [
+    ("announcements", "moonraker_tools.tools.announcements:AnnouncementsTools"),
+    ("authorization", "moonraker_tools.tools.authorization:AuthorizationTools"),
+    ("database", "moonraker_tools.tools.database:DatabaseTools"),
+    ("devices", "moonraker_tools.tools.devices:DevicesTools"),
+    ("extensions", "moonraker_tools.tools.extensions:ExtensionsTools"),
+    ("file_manager", "moonraker_tools.tools.file_manager:FileManagerTools"),
+    ("history", "moonraker_tools.tools.history:HistoryTools"),
+    ("job_queue", "moonraker_tools.tools.job_queue:JobQueueTools"),
+    ("machine", "moonraker_tools.tools.machine:MachineTools"),
+    ("printer", "moonraker_tools.tools.printer:PrinterTools"),
+    ("server", "moonraker_tools.tools.server:ServerTools"),
+    ("update_manager", "moonraker_tools.tools.update_manager:UpdateManagerTools"),
+    ("webcams", "moonraker_tools.tools.webcams:WebcamsTools"),
+]
+
+# Agent functions exposed under their own names, as the server always has.
+AGENT_TOOLS: List[str] = [
+    "moonraker_tools.agent.printer_status:get_printer_status",
+    "moonraker_tools.agent.file_manager:list_files",
+    "moonraker_tools.agent.job_queue:get_job_queue_status",
+    "moonraker_tools.agent.printer_operations:list_objects",
+    "moonraker_tools.agent.webcam:download_snapshot",
+]
+
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean"}
+
+# Parameters for Python callers only, left out of the tool schemas. Typed
+# models are not JSON serializable, so MCP clients always get dictionaries.
+_HIDDEN_PARAMETERS = frozenset({"typed"})
+
+
+@dataclass(frozen=True)
+class ToolEntry:
+    """A single registered tool and how to dispatch it."""
+
+    tool: types.Tool
+    owner: Optional[type]
+    function: Callable[..., Awaitable[Any]]
+
+
+def _import(path: str) -> Any:
+    """
+    Import an object from a "module:attribute" path.
+
+    Args:
+        path: The path of the object.
+
+    Returns:
+        The imported object.
+    """
+    module, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+def _schema_for(annotation: Any) -> Dict[str, Any]:
+    """
+    Build a JSON schema fragment for a type annotation.
+
+    Args:
+        annotation: The annotation of a parameter.
+
+    Returns:
+        A JSON schema dictionary. Unknown types map to an empty schema.
+    """
+    if annotation in _JSON_TYPES:
+        return {"type": _JSON_TYPES[annotation]}
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return _schema_for(members[0])
+        return {"anyOf": [_schema_for(member) for member in members]}
+    if origin in (list, tuple, set) or annotation in (list, tuple, set):
+        schema: Dict[str, Any] = {"type": "array"}
+        if args:
+            schema["items"] = _schema_for(args[0])
+        return schema
+    if origin is dict or annotation is dict:
+        return {"type": "object"}
+    return {}
+
+
+def _parse_docstring(func: Callable[..., Any]) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a Google style docstring into a summary and argument descriptions.
+
+    Args:
+        func: The documented function.
+
+    Returns:
+        A tuple of the summary and a dictionary of argument descriptions.
+    """
+    doc = inspect.getdoc(func) or ""
+    summary, _, body = doc.partition("\n\n")
+    arguments: Dict[str, str] = {}
+    current: Optional[str] = None
+    in_args = False
+    for line in body.splitlines():
+        stripped = line.strip()
+        if stripped == "Args:":
+            in_args = True
+            continue
+        if not in_args:
+            continue
+        if not line.startswith(" ") and stripped:
+            break
+        indent = len(line) - len(line.lstrip())
+        if indent <= 4 and ":" in stripped:
+            current, _, text = stripped.partition(":")
+            arguments[current] = text.strip()
+        elif current and stripped:
+            arguments[current] = f"{arguments[current]} {stripped}"
+    return " ".join(summary.split()), arguments
+
+
+def build_input_schema(func: Callable[..., Any]) -> Dict[str, Any]:
+    """
+    Build the JSON input schema for a tool function from its signature.
+
+    Args:
+        func: The function or bound method backing the tool.
+
+    Returns:
+        A JSON schema describing the function's keyword arguments.
+    """
+    hints = typing.get_type_hints(func)
+    _, descriptions = _parse_docstring(func)
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    additional = False
+
+    for name, param in inspect.signature(func).parameters.items():
+        if name == "self" or name in _HIDDEN_PARAMETERS:
+            continue
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            additional = True
+            continue
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            continue
+        prop = _schema_for(hints.get(name, Any))
+        if name in descriptions:
+            prop["description"] = descriptions[name]
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+        elif param.default is not None:
+            prop["default"] = param.default
+        properties[name] = prop
+
+    schema: Dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = required
+    if additional:
+        schema["additionalProperties"] = True
+    return schema
+
+
+def _make_tool(name: str, func: Callable[..., Any]) -> types.Tool:
+    """
+    Create the MCP tool definition for a function.
+
+    Args:
+        name: The name of the tool.
+        func: The function backing the tool.
+
+    Returns:
+        The MCP tool definition.
+    """
+    summary, _ = _parse_docstring(func)
+    return types.Tool(
+        name=name, description=summary, inputSchema=build_input_schema(func)
+    )
+
+
+class ToolRegistry:
+    """A table of MCP tools with dictionary based dispatch."""
+
+    def __init__(self, client_factory: Callable[[], MoonrakerClient]) -> None:
+        """
+        Initialize an empty ToolRegistry.
+
+        Args:
+            client_factory: A callable returning the MoonrakerClient that tools
+                            classes are bound to on first use.
+        """
+        self._client_factory = client_factory
+        self._entries: Dict[str, ToolEntry] = {}
+        self._bound: Dict[str, Callable[..., Awaitable[Any]]] = {}
+        self._instances: Dict[type, Any] = {}
+        self._validators: Dict[str, Any] = {}
+        self._tools: Optional[List[types.Tool]] = None
+        self._pending: List[Tuple[Optional[str], str]] = []
+
+    @classmethod
+    def build(
+        cls, client_factory: Callable[[], MoonrakerClient]
+    ) -> "ToolRegistry":
+        """
+        Build a registry covering the agent tools and every tools class.
+
+        Nothing is imported until the registry is first used, so that the
+        server can start without loading the tools modules.
+
+        Args:
+            client_factory: A callable returning the MoonrakerClient to use.
+
+        Returns:
+            A ToolRegistry that loads its entries on first use.
+        """
+        registry = cls(client_factory)
+        registry._pending = [(None, path) for path in AGENT_TOOLS]
+        registry._pending.extend(TOOL_CLASSES)
+        return registry
+
+    def _load(self) -> None:
+        """Import and register the deferred agent functions and classes."""
+        pending, self._pending = self._pending, []
+        for prefix, path in pending:
+            if prefix is None:
+                self.add_function(path.partition(":")[2], _import(path))
+            else:
+                self.add_class(prefix, _import(path))
+
+    def add_function(self, name: str, function: Callable[..., Awaitable[Any]]) -> None:
+        """
+        Register a standalone async function as a tool.
+
+        Args:
+            name: The name of the tool.
+            function: The async function to call.
+        """
+        self._add(ToolEntry(_make_tool(name, function), None, function))
+
+    def add_class(self, prefix: str, tools_class: type) -> None:
+        """
+        Register every public async method of a tools class.
+
+        Args:
+            prefix: The prefix for the generated tool names.
+            tools_class: A class taking a MoonrakerClient in its constructor.
+        """
+        for attr, function in inspect.getmembers(
+            tools_class, inspect.iscoroutinefunction
+        ):
+            if attr.startswith("_"):
+                continue
+            name = f"{prefix}_{attr}"
+            self._add(ToolEntry(_make_tool(name, function), tools_class, function))
+
+    def _add(self, entry: ToolEntry) -> None:
+        """
+        Add an entry to the registry.
+
+        Args:
+            entry: The entry to add.
+        """
+        if entry.tool.name in self._entries:
+            raise ValueError(f"Duplicate tool: {entry.tool.name}")
+        self._entries[entry.tool.name] = entry
+        self._tools = None
+
+    @property
+    def tools(self) -> List[types.Tool]:
+        """The MCP tool definitions, built once and cached."""
+        if self._pending:
+            self._load()
+        if self._tools is None:
+            self._tools = [entry.tool for entry in self._entries.values()]
+        return self._tools
+
+    def __contains__(self, name: str) -> bool:
+        if self._pending:
+            self._load()
+        return name in self._entries
+
+    def __len__(self) -> int:
+        if self._pending:
+            self._load()
+        return len(self._entries)
+
+    def _resolve(self, name: str) -> Callable[..., Awaitable[Any]]:
+        """
+        Get the callable for a tool, binding tools classes on first use.
+
+        Args:
+            name: The name of the tool.
+
+        Returns:
+            An awaitable callable taking the tool arguments.
+        """
+        bound = self._bound.get(name)
+        if bound is not None:
+            return bound
+
+        if self._pending:
+            self._load()
+        try:
+            entry = self._entries[name]
+        except KeyError:
+            raise ValueError(f"Unknown tool: {name}") from None
+
+        if entry.owner is None:
+            bound = entry.function
+        else:
+            instance = self._instances.get(entry.owner)
+            if instance is None:
+                instance = entry.owner(self._client_factory())
+                self._instances[entry.owner] = instance
+            bound = getattr(instance, entry.function.__name__)
+        self._bound[name] = bound
+        return bound
+
+    def validate(self, name: str, arguments: Dict[str, Any]) -> None:
+        """
+        Validate tool arguments against the tool's input schema.
+
+        Args:
+            name: The name of the tool.
+            arguments: The arguments to validate.
+        """
+        validator = self._validators.get(name)
+        if validator is None:
+            import jsonschema
+
+            schema = self._entries[name].tool.inputSchema
+            validator = jsonschema.validators.validator_for(schema)(schema)
+            self._validators[name] = validator
+        error = next(iter(validator.iter_errors(arguments)), None)
+        if error is not None:
+            raise ValueError(f"Input validation error: {error.message}")
+
+    async def call(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call a tool by name.
+
+        Args:
+            name: The name of the tool.
+            arguments: The arguments for the tool.
+
+        Returns:
+            The result of the tool.
+        """
+        if arguments is None:
+            arguments = {}
+        function = self._resolve(name)
+        self.validate(name, arguments)
+        return await function(**arguments)
@@ -0,0 +1,273 @@
+"""MCP resources for printer state, updated from the Moonraker websocket."""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import mcp.types as types
+from pydantic import AnyUrl
+
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.websocket import (
+    NOTIFY_CONNECTED,
+    NOTIFY_DISCONNECTED,
+    MoonrakerWebsocket,
+)
+
+logger = logging.getLogger(__name__)
+
+PRINTER_STATUS_URI = "moonraker://printer/status"
+JOB_QUEUE_URI = "moonraker://job_queue/status"
+FILES_URI = "moonraker://files/gcodes"
+
+# Printer objects kept in the printer status resource.
+STATUS_OBJECTS: Dict[str, Any] = {
+    "webhooks": None,
+    "print_stats": None,
+    "virtual_sdcard": None,
+    "display_status": None,
+    "extruder": None,
+    "heater_bed": None,
+}
+
+_KLIPPY_EVENTS = frozenset(
+    {"notify_klippy_ready", "notify_klippy_shutdown", "notify_klippy_disconnected"}
+)
+
+RESOURCES = [
+    types.Resource(
+        uri=PRINTER_STATUS_URI,
+        name="printer_status",
+        description="Klippy state, print progress and temperatures.",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=JOB_QUEUE_URI,
+        name="job_queue_status",
+        description="The current state of the job queue.",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=FILES_URI,
+        name="gcode_files",
+        description="The files available in the gcodes root.",
+        mimeType="application/json",
+    ),
+]
+
+
+class ResourceHub:
+    """Serve printer state as MCP resources and push change notifications."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[], MoonrakerClient],
+        feed_factory: Optional[Callable[[], MoonrakerWebsocket]] = None,
+        min_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize the ResourceHub.
+
+        Args:
+            client_factory: A callable returning the MoonrakerClient to use.
+            feed_factory: A callable returning the websocket that drives
+                          updates. Without one, every read is fetched.
+            min_interval: The minimum number of seconds between two updated
+                          notifications for the same resource.
+        """
+        self._client_factory = client_factory
+        self._feed_factory = feed_factory
+        self._feed: Optional[MoonrakerWebsocket] = None
+        self._min_interval = min_interval
+        self._fetchers: Dict[str, Callable[[], Awaitable[Any]]] = {
+            PRINTER_STATUS_URI: self._fetch_status,
+            JOB_QUEUE_URI: self._fetch_job_queue,
+            FILES_URI: self._fetch_files,
+        }
+        self._cache: Dict[str, Any] = {}
+        # Bumped by every notification touching a resource, so a fetch that
+        # raced with one is not cached.
+        self._generations: Dict[str, int] = {}
+        self._live = False
+        self._subscribers: Dict[str, Set[Any]] = {}
+        self._dirty: Set[str] = set()
+        self._last_sent: Dict[str, float] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def resources(self) -> List[types.Resource]:
+        """The resources served by the hub."""
+        return RESOURCES
+
+    async def read(self, uri: str) -> str:
+        """
+        Read a resource.
+
+        While the websocket feed is connected, reads are served from memory.
+
+        Args:
+            uri: The URI of the resource.
+
+        Returns:
+            The resource serialized as JSON.
+        """
+        try:
+            fetch = self._fetchers[uri]
+        except KeyError:
+            raise ValueError(f"Unknown resource: {uri}") from None
+        if self._live and uri in self._cache:
+            value = self._cache[uri]
+        else:
+            generation = self._generations.get(uri, 0)
+            value = await fetch()
+            if self._live and self._generations.get(uri, 0) == generation:
+                self._cache[uri] = value
+        return json.dumps(value)
+
+    async def subscribe(self, uri: str, session: Any) -> None:
+        """
+        Subscribe a session to updates of a resource.
+
+        The websocket feed is started with the first subscription.
+
+        Args:
+            uri: The URI of the resource.
+            session: The MCP session to notify.
+        """
+        if uri not in self._fetchers:
+            raise ValueError(f"Unknown resource: {uri}")
+        self._subscribers.setdefault(uri, set()).add(session)
+        if self._feed is None and self._feed_factory is not None:
+            self._feed = self._feed_factory()
+            self._feed.add_handler(self.handle_notification)
+            await self._feed.start()
+
+    async def unsubscribe(self, uri: str, session: Any) -> None:
+        """
+        Unsubscribe a session from a resource.
+
+        Args:
+            uri: The URI of the resource.
+            session: The MCP session.
+        """
+        self._subscribers.get(uri, set()).discard(session)
+
+    async def handle_notification(self, method: str, params: List[Any]) -> None:
+        """
+        Update the cached state from a Moonraker notification.
+
+        Args:
+            method: The notification method.
+            params: The notification parameters.
+        """
+        if method == NOTIFY_CONNECTED:
+            # Anything may have changed while disconnected.
+            self._invalidate(*self._fetchers)
+            self._live = True
+            await self._subscribe_status()
+            self._mark_dirty(*self._fetchers)
+        elif method == NOTIFY_DISCONNECTED:
+            self._live = False
+            self._invalidate(*self._fetchers)
+        elif method == "notify_status_update":
+            self._bump(PRINTER_STATUS_URI)
+            status = self._cache.get(PRINTER_STATUS_URI)
+            if status is not None and params:
+                for name, fields in params[0].items():
+                    status["status"].setdefault(name, {}).update(fields)
+            self._mark_dirty(PRINTER_STATUS_URI)
+        elif method in _KLIPPY_EVENTS:
+            self._invalidate(PRINTER_STATUS_URI)
+            if method == "notify_klippy_ready":
+                await self._subscribe_status()
+            self._mark_dirty(PRINTER_STATUS_URI)
+        elif method == "notify_job_queue_changed":
+            self._invalidate(JOB_QUEUE_URI)
+            self._mark_dirty(JOB_QUEUE_URI)
+        elif method == "notify_filelist_changed":
+            item = params[0].get("item", {}) if params else {}
+            if item.get("root", "gcodes") == "gcodes":
+                self._invalidate(FILES_URI)
+                self._mark_dirty(FILES_URI)
+
+    async def close(self) -> None:
+        """Stop the websocket feed and pending notifications."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        if self._feed is not None:
+            await self._feed.close()
+            self._feed = None
+        self._live = False
+
+    def _bump(self, uri: str) -> None:
+        self._generations[uri] = self._generations.get(uri, 0) + 1
+
+    def _invalidate(self, *uris: str) -> None:
+        for uri in uris:
+            self._bump(uri)
+            self._cache.pop(uri, None)
+
+    async def _subscribe_status(self) -> None:
+        if self._feed is None:
+            return
+        try:
+            result = await self._feed.call(
+                "printer.objects.subscribe", {"objects": STATUS_OBJECTS}
+            )
+        except Exception as exc:
+            logger.warning("Printer object subscription failed: %s", exc)
+            return
+        self._bump(PRINTER_STATUS_URI)
+        self._cache[PRINTER_STATUS_URI] = {"status": result.get("status", {})}
+
+    async def _fetch_status(self) -> Dict[str, Any]:
+        from moonraker_tools.tools.printer import PrinterTools
+
+        response = await PrinterTools(self._client_factory()).query_objects(
+            STATUS_OBJECTS
+        )
+        return {"status": response.get("result", {}).get("status", {})}
+
+    async def _fetch_job_queue(self) -> Dict[str, Any]:
+        from moonraker_tools.tools.job_queue import JobQueueTools
+
+        return await JobQueueTools(self._client_factory()).get_status()
+
+    async def _fetch_files(self) -> Any:
+        from moonraker_tools.tools.file_manager import FileManagerTools
+
+        return await FileManagerTools(self._client_factory()).list_files()
+
+    def _mark_dirty(self, *uris: str) -> None:
+        self._dirty.update(uri for uri in uris if self._subscribers.get(uri))
+        if self._dirty and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._dirty:
+            now = time.monotonic()
+            due = [
+                uri
+                for uri in self._dirty
+                if now - self._last_sent.get(uri, 0.0) >= self._min_interval
+            ]
+            if not due:
+                wait = min(
+                    self._min_interval - (now - self._last_sent.get(uri, 0.0))
+                    for uri in self._dirty
+                )
+                await asyncio.sleep(wait)
+                continue
+            for uri in due:
+                self._dirty.discard(uri)
+                self._last_sent[uri] = now
+                for session in list(self._subscribers.get(uri, ())):
+                    try:
+                        await session.send_resource_updated(AnyUrl(uri))
+                    except Exception:
+                        # The session is gone; stop notifying it.
+                        self._subscribers[uri].discard(session)
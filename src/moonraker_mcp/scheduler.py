@@ -0,0 +1,139 @@
+"""Prioritised, per-printer scheduling of concurrent MCP tool calls."""
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List
+
+URGENT = 0
+NORMAL = 1
+BULK = 2
+
+# Safety commands that must never queue behind other work.
+URGENT_METHODS = frozenset(
+    {"emergency_stop", "pause_print", "cancel_print", "firmware_restart"}
+)
+
+# Calls that can return large payloads or take a long time.
+BULK_TOOLS = frozenset(
+    {
+        "download_snapshot",
+        "file_manager_get_directory_info",
+        "server_get_gcode_store",
+        "server_get_temperature_store",
+    }
+)
+
+
+def classify(name: str) -> int:
+    """
+    Get the scheduling priority of a tool.
+
+    Args:
+        name: The name of the tool.
+
+    Returns:
+        URGENT, NORMAL or BULK. Lower values are scheduled first.
+    """
+    if any(name.endswith(method) for method in URGENT_METHODS):
+        return URGENT
+    if name in BULK_TOOLS or "list" in name.split("_"):
+        return BULK
+    return NORMAL
+
+
+class _Lane:
+    """The concurrency state of a single printer."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self.waiters: List[list] = []
+
+
+class ToolScheduler:
+    """Run tool calls concurrently with per-printer caps and priorities."""
+
+    def __init__(self, max_concurrency: int = 4) -> None:
+        """
+        Initialize the ToolScheduler.
+
+        Args:
+            max_concurrency: The maximum number of non-urgent calls running
+                             against a single printer at once.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._max_concurrency = max_concurrency
+        self._lanes: Dict[str, _Lane] = {}
+        self._counter = itertools.count()
+
+    def _lane(self, printer: str) -> _Lane:
+        lane = self._lanes.get(printer)
+        if lane is None:
+            lane = self._lanes[printer] = _Lane(self._max_concurrency)
+        return lane
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the number of running and waiting calls per printer.
+
+        Returns:
+            A dictionary keyed by printer with active and waiting counts.
+        """
+        return {
+            printer: {"active": lane.active, "waiting": len(lane.waiters)}
+            for printer, lane in self._lanes.items()
+        }
+
+    @asynccontextmanager
+    async def slot(self, printer: str, priority: int = NORMAL) -> AsyncIterator[None]:
+        """
+        Hold an execution slot for a printer while the context is active.
+
+        Urgent calls run immediately without taking a slot. Other calls wait
+        in priority order, and a cancelled waiter gives up its place.
+
+        Args:
+            printer: The key of the printer the call targets.
+            priority: The priority returned by classify().
+        """
+        if priority == URGENT:
+            yield
+            return
+
+        lane = self._lane(printer)
+        await self._acquire(lane, priority)
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    async def _acquire(self, lane: _Lane, priority: int) -> None:
+        if lane.active < lane.limit and not lane.waiters:
+            lane.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._counter), future]
+        heapq.heappush(lane.waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over as the call was cancelled.
+                self._release(lane)
+            elif entry in lane.waiters:
+                lane.waiters.remove(entry)
+                heapq.heapify(lane.waiters)
+            raise
+
+    def _release(self, lane: _Lane) -> None:
+        while lane.waiters:
+            _, _, future = heapq.heappop(lane.waiters)
+            if not future.done():
+                # Hand the slot straight to the next waiter.
+                future.set_result(None)
+                return
+        lane.active -= 1
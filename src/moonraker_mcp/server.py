@@ -1,108 +1,153 @@
 """An MCP server for interacting with a Moonraker instance."""
 
 import asyncio
+import importlib.util
 import os
+from typing import Optional
 
-from dotenv import load_dotenv
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from pydantic import AnyUrl
 
-from moonraker_tools.agent.file_manager import list_files
-from moonraker_tools.agent.job_queue import get_job_queue_status
-from moonraker_tools.agent.printer_operations import list_objects
-from moonraker_tools.agent.printer_status import get_printer_status
-from moonraker_tools.agent.webcam import download_snapshot
+from moonraker_tools import tracing
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.websocket import MoonrakerWebsocket
 
-load_dotenv()
+from .registry import ToolRegistry
+from .resources import ResourceHub
+from .scheduler import ToolScheduler, classify
 
 server = Server("moonraker-mcp")
 
+_client: Optional[MoonrakerClient] = None
+
+
+def _get_client() -> MoonrakerClient:
+    """
+    Get the MoonrakerClient shared by the agent tools and tools classes.
+
+    Returns:
+        The client of the agent context, configured from the environment.
+    """
+    global _client
+    if _client is None:
+        # Imported on first use to keep the agent modules out of the cold start.
+        from moonraker_tools.agent.context import get_context
+
+        _client = get_context().client
+    return _client
+
+
+def _printer_key() -> str:
+    """
+    Get the key used to cap concurrent calls; the server talks to one printer.
+
+    Returns:
+        The configured printer host.
+    """
+    return os.getenv("MOONRAKER_HOST") or "default"
+
+
+def _load_dotenv() -> None:
+    """Load the .env file if python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+def _make_feed() -> MoonrakerWebsocket:
+    """
+    Create the websocket feed that drives resource updates.
+
+    Returns:
+        A MoonrakerWebsocket configured from the environment.
+    """
+    from moonraker_tools.agent.context import connection_settings
+
+    host, port, api_key = connection_settings()
+    return MoonrakerWebsocket(host=host, port=port, api_key=api_key)
+
+
+registry = ToolRegistry.build(client_factory=_get_client)
+scheduler = ToolScheduler()
+hub = ResourceHub(client_factory=_get_client, feed_factory=_make_feed)
+
 
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools."""
-    return [
-        types.Tool(
-            name="get_printer_status",
-            description="Get the current status of the printer.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="list_files",
-            description="List available files in a root.",
-            inputSchema={
-                "type": "object",
-                "properties": {"root": {"type": "string", "default": "gcodes"}},
-            },
-        ),
-        types.Tool(
-            name="get_job_queue_status",
-            description="Get the current status of the job queue.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="list_objects",
-            description="List loaded printer objects.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="download_snapshot",
-            description="Download a snapshot from the webcam.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "webcam_name": {"type": "string"},
-                    "output_path": {
-                        "type": "string",
-                        "default": "snapshot.jpg",
-                    },
-                },
-            },
-        ),
-    ]
-
-
-@server.call_tool()
+    return registry.tools
+
+
+@server.call_tool(validate_input=False)
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution requests."""
-    if arguments is None:
-        arguments = {}
-
-    if name == "get_printer_status":
-        result = await get_printer_status()
-    elif name == "list_files":
-        result = await list_files(**arguments)
-    elif name == "get_job_queue_status":
-        result = await get_job_queue_status()
-    elif name == "list_objects":
-        result = await list_objects()
-    elif name == "download_snapshot":
-        result = await download_snapshot(**arguments)
-    else:
-        raise ValueError(f"Unknown tool: {name}")
-
+    # The registry validates against its own precompiled schemas.
+    with tracing.span(f"tool {name}", tracing.TOOL, tool=name, printer=_printer_key()):
+        async with scheduler.slot(_printer_key(), classify(name)):
+            result = await registry.call(name, arguments)
     return [types.TextContent(type="text", text=str(result))]
 
 
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """List available resources."""
+    return hub.resources
+
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+    """Read a resource."""
+    content = await hub.read(str(uri))
+    return [ReadResourceContents(content=content, mime_type="application/json")]
+
+
+@server.subscribe_resource()
+async def handle_subscribe_resource(uri: AnyUrl) -> None:
+    """Subscribe the requesting session to resource updates."""
+    await hub.subscribe(str(uri), server.request_context.session)
+
+
+@server.unsubscribe_resource()
+async def handle_unsubscribe_resource(uri: AnyUrl) -> None:
+    """Unsubscribe the requesting session from resource updates."""
+    await hub.unsubscribe(str(uri), server.request_context.session)
+
+
 async def main():
     """Run the MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="moonraker-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    _load_dotenv()
+    capabilities = server.get_capabilities(
+        notification_options=NotificationOptions(),
+        experimental_capabilities={},
+    )
+    # The SDK never advertises subscriptions, even with the handlers set.
+    # Updates are pushed from the websocket feed, which needs websockets.
+    capabilities.resources.subscribe = (
+        importlib.util.find_spec("websockets") is not None
+    )
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="moonraker-mcp",
+                    server_version="0.1.0",
+                    capabilities=capabilities,
                 ),
-            ),
-        )
+            )
+    finally:
+        await hub.close()
+        if _client is not None:
+            await _client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""The connection shared by the agent tools."""
+
+import asyncio
+import os
+import weakref
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+import httpx
+
+from ..client import MoonrakerClient
+
+T = TypeVar("T")
+
+
+def connection_settings() -> Tuple[str, int, Optional[str]]:
+    """
+    Read the printer connection settings from the environment.
+
+    Returns:
+        A tuple of the host, port and API key.
+    """
+    host = os.getenv("MOONRAKER_HOST")
+    port = os.getenv("MOONRAKER_PORT")
+    api_key = os.getenv("MOONRAKER_API_KEY")
+
+    if not host or not port:
+        raise ValueError(
+            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
+        )
+    return host, int(port), api_key
+
+
+class AgentContext:
+    """A MoonrakerClient and the tools instances bound to it."""
+
+    def __init__(self, client: MoonrakerClient) -> None:
+        """
+        Initialize the AgentContext.
+
+        Args:
+            client: The client used by every agent tool.
+        """
+        self.client = client
+        self._tools: Dict[type, Any] = {}
+        self._snapshot_client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_env(cls) -> "AgentContext":
+        """
+        Create a context from MOONRAKER_HOST, MOONRAKER_PORT and
+        MOONRAKER_API_KEY.
+
+        Returns:
+            A new AgentContext.
+        """
+        host, port, api_key = connection_settings()
+        return cls(MoonrakerClient(host=host, port=port, api_key=api_key))
+
+    def tools(self, tools_class: Type[T]) -> T:
+        """
+        Get the instance of a tools class bound to the context's client.
+
+        Args:
+            tools_class: A *Tools class, such as PrinterTools.
+
+        Returns:
+            The instance, created on first use.
+        """
+        tools = self._tools.get(tools_class)
+        if tools is None:
+            tools = self._tools[tools_class] = tools_class(self.client)
+        return tools
+
+    @property
+    def snapshot_client(self) -> httpx.AsyncClient:
+        """
+        The HTTP client used to download webcam snapshots.
+
+        It is kept apart from the Moonraker client, since snapshot URLs may
+        point at other hosts that must not receive the API key.
+        """
+        if self._snapshot_client is None:
+            self._snapshot_client = httpx.AsyncClient()
+        return self._snapshot_client
+
+    async def close(self) -> None:
+        """Close the client and the snapshot client."""
+        await self.client.close()
+        if self._snapshot_client is not None:
+            await self._snapshot_client.aclose()
+            self._snapshot_client = None
+
+
+_explicit: Optional[AgentContext] = None
+# Contexts created from the environment, one per event loop, since a client's
+# connections cannot be reused once the loop that opened them is closed.
+_contexts: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AgentContext]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_context() -> AgentContext:
+    """
+    Get the context used by the agent tools.
+
+    Unless one was set with set_context, it is created from the environment
+    on first use in the running event loop.
+
+    Returns:
+        The AgentContext.
+    """
+    if _explicit is not None:
+        return _explicit
+    loop = asyncio.get_running_loop()
+    context = _contexts.get(loop)
+    if context is None:
+        context = _contexts[loop] = AgentContext.from_env()
+    return context
+
+
+def set_context(context: Optional[AgentContext]) -> None:
+    """
+    Use an explicitly configured context for every agent tool.
+
+    Args:
+        context: The context to use, or None to go back to the environment.
+    """
+    global _explicit
+    _explicit = context
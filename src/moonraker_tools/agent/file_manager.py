@@ -1,12 +1,23 @@
 """Agent tools for interacting with the Moonraker file_manager API."""
 
-import os
 from typing import Any, Dict, List
 
-from ..client import MoonrakerClient
 from ..tools.file_manager import FileManagerTools
+from ..tracing import traced
+from .context import get_context
 
 
+def _tools() -> FileManagerTools:
+    """
+    Get the FileManagerTools of the shared agent context.
+
+    Returns:
+        The FileManagerTools instance.
+    """
+    return get_context().tools(FileManagerTools)
+
+
+@traced
 async def list_files(root: str = "gcodes") -> List[Dict[str, Any]]:
     """
     List available files in a root.
@@ -17,26 +28,10 @@ async def list_files(root: str = "gcodes") -> List[Dict[str, Any]]:
     Returns:
         A list of file information dictionaries.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        files = await file_manager_tools.list_files(root=root)
-    finally:
-        await client.close()
-
-    return files
+    return await _tools().list_files(root=root)
 
 
+@traced
 async def get_directory_info(
     path: str = "gcodes", extended: bool = False
 ) -> Dict[str, Any]:
@@ -50,26 +45,10 @@ async def get_directory_info(
     Returns:
         A dictionary containing directory information.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        info = await file_manager_tools.get_directory_info(path=path, extended=extended)
-    finally:
-        await client.close()
-
-    return info
+    return await _tools().get_directory_info(path=path, extended=extended)
 
 
+@traced
 async def create_directory(path: str) -> Dict[str, Any]:
     """
     Create a directory.
@@ -80,26 +59,10 @@ async def create_directory(path: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing information about the created directory.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        result = await file_manager_tools.create_directory(path=path)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().create_directory(path=path)
 
 
+@traced
 async def delete_directory(path: str, force: bool = False) -> Dict[str, Any]:
     """
     Delete a directory.
@@ -111,26 +74,10 @@ async def delete_directory(path: str, force: bool = False) -> Dict[str, Any]:
     Returns:
         A dictionary containing information about the deleted directory.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        result = await file_manager_tools.delete_directory(path=path, force=force)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().delete_directory(path=path, force=force)
 
 
+@traced
 async def move_item(source: str, dest: str) -> Dict[str, Any]:
     """
     Move a file or directory.
@@ -142,26 +89,10 @@ async def move_item(source: str, dest: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing information about the moved item.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        result = await file_manager_tools.move_item(source=source, dest=dest)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().move_item(source=source, dest=dest)
 
 
+@traced
 async def copy_item(source: str, dest: str) -> Dict[str, Any]:
     """
     Copy a file or directory.
@@ -173,26 +104,10 @@ async def copy_item(source: str, dest: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing information about the copied item.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        result = await file_manager_tools.copy_item(source=source, dest=dest)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().copy_item(source=source, dest=dest)
 
 
+@traced
 async def delete_file(path: str) -> Dict[str, Any]:
     """
     Delete a file.
@@ -203,21 +118,4 @@ async def delete_file(path: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing information about the deleted file.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    file_manager_tools = FileManagerTools(client)
-
-    try:
-        result = await file_manager_tools.delete_file(path=path)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().delete_file(path=path)
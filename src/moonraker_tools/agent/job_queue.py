@@ -1,39 +1,34 @@
 """Agent tools for interacting with the Moonraker job_queue API."""
 
-import os
 from typing import Any, Dict, List
 
-from ..client import MoonrakerClient
 from ..tools.job_queue import JobQueueTools
+from ..tracing import traced
+from .context import get_context
 
 
-async def get_job_queue_status() -> Dict[str, Any]:
+def _tools() -> JobQueueTools:
     """
-    Get the current status of the job queue.
+    Get the JobQueueTools of the shared agent context.
 
     Returns:
-        A dictionary containing the job queue status.
+        The JobQueueTools instance.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
+    return get_context().tools(JobQueueTools)
 
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
 
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    job_queue_tools = JobQueueTools(client)
-
-    try:
-        status = await job_queue_tools.get_status()
-    finally:
-        await client.close()
+@traced
+async def get_job_queue_status() -> Dict[str, Any]:
+    """
+    Get the current status of the job queue.
 
-    return status
+    Returns:
+        A dictionary containing the job queue status.
+    """
+    return await _tools().get_status()
 
 
+@traced
 async def enqueue_job(filenames: List[str], reset: bool = False) -> Dict[str, Any]:
     """
     Enqueue one or more jobs.
@@ -45,26 +40,10 @@ async def enqueue_job(filenames: List[str], reset: bool = False) -> Dict[str, An
     Returns:
         A dictionary containing the updated job queue status.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    job_queue_tools = JobQueueTools(client)
-
-    try:
-        result = await job_queue_tools.enqueue_job(filenames=filenames, reset=reset)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().enqueue_job(filenames=filenames, reset=reset)
 
 
+@traced
 async def remove_job(
     job_ids: List[str] = None, all_jobs: bool = False
 ) -> Dict[str, Any]:
@@ -78,26 +57,10 @@ async def remove_job(
     Returns:
         A dictionary containing the updated job queue status.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    job_queue_tools = JobQueueTools(client)
-
-    try:
-        result = await job_queue_tools.remove_job(job_ids=job_ids, all_jobs=all_jobs)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().remove_job(job_ids=job_ids, all_jobs=all_jobs)
 
 
+@traced
 async def pause_queue() -> Dict[str, Any]:
     """
     Pause the job queue.
@@ -105,78 +68,73 @@ async def pause_queue() -> Dict[str, Any]:
     Returns:
         A dictionary containing the updated job queue status.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
+    return await _tools().pause_queue()
 
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
 
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    job_queue_tools = JobQueueTools(client)
-
-    try:
-        result = await job_queue_tools.pause_queue()
-    finally:
-        await client.close()
+@traced
+async def start_queue() -> Dict[str, Any]:
+    """
+    Start the job queue.
 
-    return result
+    Returns:
+        A dictionary containing the updated job queue status.
+    """
+    return await _tools().start_queue()
 
 
-async def start_queue() -> Dict[str, Any]:
+@traced
+async def jump_to_job(job_id: str) -> Dict[str, Any]:
     """
-    Start the job queue.
+    Jump a job to the front of the queue.
+
+    Args:
+        job_id: The ID of the job to jump.
 
     Returns:
         A dictionary containing the updated job queue status.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
+    return await _tools().jump_to_job(job_id=job_id)
 
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
 
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    job_queue_tools = JobQueueTools(client)
+@traced
+async def enqueue_jobs(filenames: List[str], reset: bool = False) -> Dict[str, Any]:
+    """
+    Enqueue an ordered batch of jobs in a single request.
 
-    try:
-        result = await job_queue_tools.start_queue()
-    finally:
-        await client.close()
+    Args:
+        filenames: The filenames to enqueue, in print order.
+        reset: Whether to clear the queue before adding the new jobs.
 
-    return result
+    Returns:
+        A dictionary with the queue state, the job ID of each new job and the
+        filenames whose jobs were no longer queued.
+    """
+    return await _tools().enqueue_jobs(filenames=filenames, reset=reset)
 
 
-async def jump_to_job(job_id: str) -> Dict[str, Any]:
+@traced
+async def remove_jobs(job_ids: List[str]) -> Dict[str, Any]:
     """
-    Jump a job to the front of the queue.
+    Remove a batch of jobs, skipping those no longer queued.
 
     Args:
-        job_id: The ID of the job to jump.
+        job_ids: The IDs of the jobs to remove.
 
     Returns:
-        A dictionary containing the updated job queue status.
+        A dictionary with the queue state and the removed and missing job IDs.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
+    return await _tools().remove_jobs(job_ids=job_ids)
 
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
 
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    job_queue_tools = JobQueueTools(client)
+@traced
+async def reorder_jobs(job_ids: List[str]) -> Dict[str, Any]:
+    """
+    Move jobs to the front of the queue in the given order.
 
-    try:
-        result = await job_queue_tools.jump_to_job(job_id=job_id)
-    finally:
-        await client.close()
+    Args:
+        job_ids: The IDs of the jobs to move, in their new order.
 
-    return result
+    Returns:
+        A dictionary with the queue state and each old job ID's new one.
+    """
+    return await _tools().reorder_jobs(job_ids=job_ids)
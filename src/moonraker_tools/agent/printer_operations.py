@@ -1,39 +1,34 @@
 """Agent tools for interacting with the Moonraker printer API."""
 
-import os
 from typing import Any, Dict, List
 
-from ..client import MoonrakerClient
 from ..tools.printer import PrinterTools
+from ..tracing import traced
+from .context import get_context
 
 
-async def emergency_stop() -> str:
+def _tools() -> PrinterTools:
     """
-    Issue an emergency stop to the printer.
+    Get the PrinterTools of the shared agent context.
 
     Returns:
-        A string confirming the action.
+        The PrinterTools instance.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
+    return get_context().tools(PrinterTools)
 
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
 
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.emergency_stop()
-    finally:
-        await client.close()
+@traced
+async def emergency_stop() -> str:
+    """
+    Issue an emergency stop to the printer.
 
-    return result
+    Returns:
+        A string confirming the action.
+    """
+    return await _tools().emergency_stop()
 
 
+@traced
 async def restart() -> str:
     """
     Request a Klipper "soft" restart.
@@ -41,26 +36,10 @@ async def restart() -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.restart()
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().restart()
 
 
+@traced
 async def firmware_restart() -> str:
     """
     Request a complete Klipper restart.
@@ -68,26 +47,10 @@ async def firmware_restart() -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.firmware_restart()
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().firmware_restart()
 
 
+@traced
 async def list_objects() -> Dict[str, List[str]]:
     """
     List loaded printer objects.
@@ -95,26 +58,10 @@ async def list_objects() -> Dict[str, List[str]]:
     Returns:
         A dictionary containing a list of printer objects.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.list_objects()
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().list_objects()
 
 
+@traced
 async def query_objects(objects: Dict[str, Any]) -> Dict[str, Any]:
     """
     Query the status of a provided set of printer objects.
@@ -125,26 +72,10 @@ async def query_objects(objects: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         A dictionary containing the status of the requested objects.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.query_objects(objects)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().query_objects(objects)
 
 
+@traced
 async def run_gcode_script(script: str) -> str:
     """
     Execute a gcode script.
@@ -155,26 +86,10 @@ async def run_gcode_script(script: str) -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.run_gcode_script(script)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().run_gcode_script(script)
 
 
+@traced
 async def start_print(filename: str) -> str:
     """
     Start a print job.
@@ -185,26 +100,10 @@ async def start_print(filename: str) -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.start_print(filename)
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().start_print(filename)
 
 
+@traced
 async def pause_print() -> str:
     """
     Pause a print job.
@@ -212,26 +111,10 @@ async def pause_print() -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.pause_print()
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().pause_print()
 
 
+@traced
 async def resume_print() -> str:
     """
     Resume a print job.
@@ -239,26 +122,10 @@ async def resume_print() -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.resume_print()
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().resume_print()
 
 
+@traced
 async def cancel_print() -> str:
     """
     Cancel a print job.
@@ -266,21 +133,4 @@ async def cancel_print() -> str:
     Returns:
         A string confirming the action.
     """
-    host = os.getenv("MOONRAKER_HOST")
-    port = os.getenv("MOONRAKER_PORT")
-    api_key = os.getenv("MOONRAKER_API_KEY")
-
-    if not host or not port:
-        raise ValueError(
-            "MOONRAKER_HOST and MOONRAKER_PORT must be set in the .env file."
-        )
-
-    client = MoonrakerClient(host=host, port=int(port), api_key=api_key)
-    printer_tools = PrinterTools(client)
-
-    try:
-        result = await printer_tools.cancel_print()
-    finally:
-        await client.close()
-
-    return result
+    return await _tools().cancel_print()
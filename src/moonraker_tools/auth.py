@@ -0,0 +1,322 @@
+"""Authentication helpers shared by MoonrakerClient instances."""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from .client import MoonrakerClient
+from .tools.authorization import AuthorizationTools
+
+logger = logging.getLogger(__name__)
+
+
+def _jwt_claims(token: str) -> Dict[str, Any]:
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, TypeError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the expiry time of a JSON Web Token without verifying it.
+
+    Args:
+        token: The encoded token.
+
+    Returns:
+        The "exp" claim as a Unix timestamp, or None if it cannot be read.
+    """
+    try:
+        return float(_jwt_claims(token)["exp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def jwt_lifetime(token: str) -> Optional[float]:
+    """
+    Read the lifetime of a JSON Web Token from its own claims.
+
+    The lifetime does not depend on the local clock, which may be skewed
+    against the printer's.
+
+    Args:
+        token: The encoded token.
+
+    Returns:
+        The difference between the "exp" and "iat" claims in seconds, or None
+        if either cannot be read.
+    """
+    claims = _jwt_claims(token)
+    try:
+        return float(claims["exp"]) - float(claims["iat"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenManager:
+    """Log in once and keep a JWT fresh for any number of clients."""
+
+    def __init__(
+        self,
+        client: MoonrakerClient,
+        username: str,
+        password: str,
+        source: Optional[str] = None,
+        refresh_margin: float = 60.0,
+        default_lifetime: float = 3600.0,
+        retry_delay: float = 5.0,
+    ) -> None:
+        """
+        Initialize the TokenManager.
+
+        Args:
+            client: The client used for the login and refresh requests. It
+                    must not use this TokenManager itself.
+            username: The user's login name.
+            password: The user's password.
+            source: The authentication source.
+            refresh_margin: The number of seconds before expiry at which the
+                            token is refreshed in the background.
+            default_lifetime: The lifetime assumed for tokens without "exp"
+                              and "iat" claims.
+            retry_delay: The number of seconds to wait after a failed
+                         background refresh.
+        """
+        self._auth = AuthorizationTools(client)
+        self._username = username
+        self._password = password
+        self._source = source
+        self.refresh_margin = refresh_margin
+        self.default_lifetime = default_lifetime
+        self.retry_delay = retry_delay
+        self._token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def token(self) -> Optional[str]:
+        """The current access token, if one is held and not expired."""
+        if self._token is not None and time.monotonic() < self._expires_at:
+            return self._token
+        return None
+
+    async def ensure_token(self) -> str:
+        """
+        Get a valid access token, logging in if none is held.
+
+        Concurrent callers share a single login.
+
+        Returns:
+            The access token.
+        """
+        token = self.token
+        if token is not None:
+            return token
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            token = self.token
+            if token is None:
+                await self._renew()
+                token = self._token
+        return token
+
+    def invalidate(self, token: str) -> None:
+        """
+        Drop a token the server rejected, unless it was already replaced.
+
+        Args:
+            token: The rejected token.
+        """
+        if self._token == token:
+            self._token = None
+            self._expires_at = 0.0
+
+    async def close(self) -> None:
+        """Stop refreshing the token in the background."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+    async def _renew(self) -> None:
+        if self._refresh_token is not None:
+            try:
+                response = await self._auth.refresh_jwt(self._refresh_token)
+                self._store(response["result"]["token"])
+                return
+            except Exception as exc:
+                logger.info("JWT refresh failed, logging in again: %s", exc)
+        response = await self._auth.login(
+            self._username, self._password, source=self._source
+        )
+        result = response["result"]
+        self._refresh_token = result.get("refresh_token")
+        self._store(result["token"])
+
+    def _store(self, token: str) -> None:
+        lifetime = jwt_lifetime(token)
+        if lifetime is None or lifetime <= 0:
+            lifetime = self.default_lifetime
+        self._token = token
+        self._expires_at = time.monotonic() + lifetime
+        self._schedule_refresh(
+            max(lifetime - self.refresh_margin, self.retry_delay)
+        )
+
+    def _schedule_refresh(self, delay: float) -> None:
+        current = asyncio.current_task()
+        if self._refresh_task is not None and self._refresh_task is not current:
+            self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._refresh_later(delay))
+
+    async def _refresh_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        async with self._lock:
+            try:
+                await self._renew()
+            except Exception as exc:
+                logger.warning("Background JWT refresh failed: %s", exc)
+                self._schedule_refresh(self.retry_delay)
+
+
+class OneshotTokenPool:
+    """Keep oneshot tokens pre-fetched for websocket connects and downloads."""
+
+    def __init__(
+        self,
+        client: MoonrakerClient,
+        size: int = 4,
+        ttl: float = 5.0,
+        safety_margin: float = 1.0,
+        idle_timeout: Optional[float] = 30.0,
+    ) -> None:
+        """
+        Initialize the OneshotTokenPool.
+
+        Args:
+            client: The client used to request tokens.
+            size: The number of tokens to keep ready.
+            ttl: The lifetime of a oneshot token in Moonraker.
+            safety_margin: The number of seconds before expiry at which a
+                           token is discarded.
+            idle_timeout: Stop refilling after this many seconds without an
+                          acquire, until the next one, so idle printers are
+                          not polled. None keeps the pool full at all times,
+                          at a cost of about size / (ttl - safety_margin)
+                          requests per second.
+        """
+        self._auth = AuthorizationTools(client)
+        self.size = size
+        self.lifetime = ttl - safety_margin
+        self.idle_timeout = idle_timeout
+        self._tokens: Deque[Tuple[str, float]] = deque()
+        self._last_acquire = time.monotonic()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        self._discard_expired()
+        return len(self._tokens)
+
+    async def start(self) -> None:
+        """Start filling the pool in the background."""
+        if self._task is None:
+            self._closed = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._refill())
+
+    async def acquire(self) -> str:
+        """
+        Take a token from the pool, or request one if the pool is empty.
+
+        Returns:
+            A oneshot token.
+        """
+        self._last_acquire = time.monotonic()
+        self._discard_expired()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._tokens:
+            return self._tokens.popleft()[0]
+        return await self._fetch()
+
+    async def authorize_url(self, url: str) -> str:
+        """
+        Add a oneshot token to the query string of a URL.
+
+        Args:
+            url: The URL of a websocket or download endpoint.
+
+        Returns:
+            The URL with a token parameter.
+        """
+        token = await self.acquire()
+        parts = urlsplit(url)
+        query = "&".join(filter(None, [parts.query, urlencode({"token": token})]))
+        return urlunsplit(parts._replace(query=query))
+
+    async def close(self) -> None:
+        """Stop refilling and drop the pooled tokens."""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._tokens.clear()
+
+    async def _fetch(self) -> str:
+        response = await self._auth.generate_oneshot_token()
+        return response["result"]
+
+    def _discard_expired(self) -> None:
+        now = time.monotonic()
+        while self._tokens and self._tokens[0][1] <= now:
+            self._tokens.popleft()
+
+    async def _refill(self) -> None:
+        while not self._closed:
+            self._discard_expired()
+            idle = (
+                self.idle_timeout is not None
+                and time.monotonic() - self._last_acquire > self.idle_timeout
+            )
+            missing = 0 if idle else self.size - len(self._tokens)
+            if missing > 0:
+                # Moonraker's clock starts before the response arrives.
+                expires_at = time.monotonic() + self.lifetime
+                results = await asyncio.gather(
+                    *(self._fetch() for _ in range(missing)), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        logger.warning("Oneshot token request failed: %s", result)
+                    else:
+                        self._tokens.append((result, expires_at))
+
+            self._wakeup.clear()
+            timeout = None
+            if self._tokens:
+                timeout = max(self._tokens[0][1] - time.monotonic(), 0.0)
+            elif not idle:
+                # Every request failed; back off before trying again.
+                timeout = self.lifetime
+            # asyncio.wait never swallows a cancellation, unlike wait_for on
+            # Python 3.10 and 3.11 when the event is set at the same time.
+            waiter = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=timeout)
+            finally:
+                waiter.cancel()
@@ -0,0 +1,182 @@
+"""A per-host circuit breaker for requests to Moonraker."""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional
+
+import httpx
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Urgent commands that are always sent, even to a host whose circuit is open.
+BYPASS_ENDPOINTS = frozenset(
+    {
+        "/printer/emergency_stop",
+        "/printer/print/pause",
+        "/printer/print/cancel",
+    }
+)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of contacting a host that is known to be down."""
+
+
+class _HostState:
+    """The failure history of one host."""
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.last_error: Optional[str] = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Fail fast for hosts with consecutive failures until a probe succeeds."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        probe_endpoint: str = "/server/info",
+        bypass_endpoints: Iterable[str] = BYPASS_ENDPOINTS,
+    ) -> None:
+        """
+        Initialize the CircuitBreaker.
+
+        Args:
+            failure_threshold: The number of consecutive failures after which
+                               the circuit of a host opens.
+            reset_timeout: The number of seconds an open circuit waits before
+                           probing the host.
+            probe_endpoint: The endpoint requested to check whether a host
+                            has recovered.
+            bypass_endpoints: The endpoints sent regardless of the circuit.
+                              Their outcome is still recorded.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_endpoint = probe_endpoint
+        self.bypass_endpoints: FrozenSet[str] = frozenset(bypass_endpoints)
+        self._hosts: Dict[str, _HostState] = {}
+
+    def bypasses(self, endpoint: str) -> bool:
+        """
+        Check whether requests to an endpoint are sent while the circuit is open.
+
+        Args:
+            endpoint: The API endpoint.
+
+        Returns:
+            Whether the endpoint bypasses the circuit.
+        """
+        return endpoint in self.bypass_endpoints
+
+    async def guard(self, host: str, probe: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Check that a request to a host may be sent.
+
+        Once the reset timeout has passed, a single caller probes the host
+        while the others keep failing fast.
+
+        Args:
+            host: The base URL of the host.
+            probe: A coroutine function requesting the probe endpoint.
+        """
+        state = self._hosts.get(host)
+        if state is None or state.state == CLOSED:
+            return
+        if state.probing or time.monotonic() - state.opened_at < self.reset_timeout:
+            raise CircuitOpenError(
+                f"Circuit for {host} is open after {state.failures} failures: "
+                f"{state.last_error}"
+            )
+        state.state = HALF_OPEN
+        state.probing = True
+        try:
+            await probe()
+        except Exception as exc:
+            self.record_failure(host, exc)
+            raise CircuitOpenError(f"Probe of {host} failed: {exc}") from exc
+        finally:
+            state.probing = False
+        self.record_success(host)
+
+    def record(self, host: str, error: Optional[Exception]) -> None:
+        """
+        Record the outcome of a request.
+
+        Only transport errors and 5xx responses count as host failures.
+
+        Args:
+            host: The base URL of the host.
+            error: The error raised by the request, or None if it succeeded.
+        """
+        if isinstance(error, httpx.TransportError) or (
+            isinstance(error, httpx.HTTPStatusError)
+            and error.response.status_code >= 500
+        ):
+            self.record_failure(host, error)
+        else:
+            self.record_success(host)
+
+    def record_success(self, host: str) -> None:
+        """
+        Close the circuit of a host.
+
+        Args:
+            host: The base URL of the host.
+        """
+        state = self._hosts.get(host)
+        if state is not None:
+            state.state = CLOSED
+            state.failures = 0
+
+    def record_failure(self, host: str, error: Exception) -> None:
+        """
+        Count a failure and open the circuit past the threshold.
+
+        Args:
+            host: The base URL of the host.
+            error: The error raised by the request.
+        """
+        state = self._hosts.setdefault(host, _HostState())
+        state.failures += 1
+        state.last_error = str(error) or type(error).__name__
+        if state.state == HALF_OPEN or state.failures >= self.failure_threshold:
+            state.state = OPEN
+            state.opened_at = time.monotonic()
+
+    def health(self, host: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Report the circuit state of one host or of every host seen.
+
+        Args:
+            host: The base URL of the host. Defaults to every host.
+
+        Returns:
+            A dictionary of hosts to their "state", consecutive "failures",
+            "last_error" and the number of seconds until the next probe.
+        """
+        hosts = list(self._hosts) if host is None else [host]
+        report = {}
+        for name in hosts:
+            state = self._hosts.get(name, _HostState())
+            retry_in = 0.0
+            if state.state == OPEN:
+                elapsed = time.monotonic() - state.opened_at
+                retry_in = max(self.reset_timeout - elapsed, 0.0)
+            report[name] = {
+                "state": state.state,
+                "failures": state.failures,
+                "last_error": state.last_error,
+                "retry_in": retry_in,
+            }
+        return report
+
+
+# Shared by default so every client of a host sees the same circuit.
+DEFAULT_CIRCUIT_BREAKER = CircuitBreaker()
@@ -1,9 +1,29 @@
 """A client for interacting with the Moonraker API."""
 
-from typing import Any, Dict, Optional
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+)
 
 import httpx
 
+from .circuit_breaker import DEFAULT_CIRCUIT_BREAKER, CircuitBreaker
+from .rate_limit import RateLimiter
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .tracing import HTTP, span
+from .transport import PayloadStats, TransportConfig
+
+if TYPE_CHECKING:
+    from .auth import TokenManager
+
 
 class MoonrakerClient:
     """A client for interacting with the Moonraker API."""
@@ -13,6 +33,11 @@ class MoonrakerClient:
         host: str,
         port: int = 7125,
         api_key: Optional[str] = None,
+        token_manager: Optional["TokenManager"] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        circuit_breaker: Optional[CircuitBreaker] = DEFAULT_CIRCUIT_BREAKER,
+        transport_config: Optional[TransportConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """
         Initialize the MoonrakerClient.
@@ -21,29 +46,151 @@ class MoonrakerClient:
             host: The hostname or IP address of the Moonraker instance.
             port: The port number for the Moonraker API.
             api_key: The API key for authentication, if required.
+            token_manager: A TokenManager providing a JWT for each request.
+                           It may be shared between clients.
+            retry_policy: The policy for retrying failed requests. The default
+                          policy is shared so retry budgets apply per host.
+                          None disables retries.
+            circuit_breaker: The circuit breaker failing fast for hosts that
+                             are down. The default one is shared by all
+                             clients. None disables it.
+            transport_config: Timeouts, connection limits, compression and
+                              protocol options. Defaults to TransportConfig().
+            rate_limiter: A RateLimiter delaying requests to stay within the
+                          host's budgets. Share it between clients of the same
+                          host.
         """
         self.base_url = f"http://{host}:{port}"
         self.api_key = api_key
-        self._client = httpx.AsyncClient(base_url=self.base_url)
+        self.token_manager = token_manager
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.transport_config = transport_config or TransportConfig()
+        self.rate_limiter = rate_limiter
+        # The bytes received per endpoint, compressed and decompressed.
+        self.payloads = PayloadStats()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url, **self.transport_config.client_kwargs()
+        )
 
-    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Send a GET request to a Moonraker API endpoint.
 
         Args:
             endpoint: The API endpoint to request.
             params: Optional dictionary of query parameters.
+            timeout: The timeout in seconds for this request, overriding the
+                     transport configuration.
 
         Returns:
             The JSON response from the API.
         """
-        headers = self._get_headers()
-        response = await self._client.get(endpoint, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", endpoint, timeout=timeout, params=params)
+
+    async def get_model(
+        self,
+        endpoint: str,
+        model: Any,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Send a GET request and decode the result into a typed model.
+
+        The body is decoded straight from bytes, with msgspec if installed.
+
+        Args:
+            endpoint: The API endpoint to request.
+            model: The type of the response's "result", such as
+                   List[FileEntry].
+            params: Optional dictionary of query parameters.
+            timeout: The timeout in seconds for this request, overriding the
+                     transport configuration.
+
+        Returns:
+            The decoded result.
+        """
+        # Imported on first use, as most sessions never decode typed models.
+        from .models import decode_result
+
+        return await self._request(
+            "GET",
+            endpoint,
+            timeout=timeout,
+            decode=partial(decode_result, model),
+            params=params,
+        )
+
+    async def stream_items(
+        self,
+        endpoint: str,
+        path: Sequence[str] = ("result",),
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Send a GET request and yield the items of an array in the response.
+
+        Items are parsed as the body arrives, so memory stays flat for large
+        listings. Streams are not retried, since items may already have been
+        consumed when they fail.
+
+        Args:
+            endpoint: The API endpoint to request.
+            path: The object keys leading to the array, such as
+                  ("result", "jobs").
+            params: Optional dictionary of query parameters.
+            timeout: The timeout in seconds for this request, overriding the
+                     transport configuration.
+
+        Yields:
+            The items of the array.
+        """
+        from .streaming import JSONItemStream
+
+        kwargs: Dict[str, Any] = {"params": params}
+        request_timeout = self._resolve_timeout(endpoint, timeout)
+        if request_timeout is not None:
+            kwargs["timeout"] = request_timeout
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            await breaker.guard(self.base_url, self._probe)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.base_url, endpoint)
+        parser = JSONItemStream(path)
+        decoded_bytes = 0
+        try:
+            async with self._open_stream("GET", endpoint, **kwargs) as response:
+                response.raise_for_status()
+                # Compressed bodies are decompressed chunk by chunk.
+                async for chunk in response.aiter_bytes():
+                    decoded_bytes += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+                    if parser.done:
+                        break
+                self.payloads.record(
+                    endpoint, response.num_bytes_downloaded, decoded_bytes
+                )
+        except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+            if breaker is not None:
+                breaker.record(self.base_url, exc)
+            raise
+        if breaker is not None:
+            breaker.record_success(self.base_url)
+        parser.close()
 
     async def post(
-        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Send a POST request to a Moonraker API endpoint.
@@ -51,17 +198,19 @@ class MoonrakerClient:
         Args:
             endpoint: The API endpoint to request.
             data: Optional dictionary of data to send in the request body.
+            timeout: The timeout in seconds for this request, overriding the
+                     transport configuration.
 
         Returns:
             The JSON response from the API.
         """
-        headers = self._get_headers()
-        response = await self._client.post(endpoint, json=data, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return await self._request("POST", endpoint, timeout=timeout, json=data)
 
     async def delete(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Send a DELETE request to a Moonraker API endpoint.
@@ -69,14 +218,194 @@ class MoonrakerClient:
         Args:
             endpoint: The API endpoint to request.
             params: Optional dictionary of query parameters.
+            timeout: The timeout in seconds for this request, overriding the
+                     transport configuration.
 
         Returns:
             The JSON response from the API.
         """
-        headers = self._get_headers()
-        response = await self._client.delete(endpoint, params=params, headers=headers)
+        return await self._request("DELETE", endpoint, timeout=timeout, params=params)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        timeout: Optional[float] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Send a request and decode the JSON response.
+
+        Failed requests are retried according to the retry policy. While the
+        host's circuit is open, a CircuitOpenError is raised without sending
+        anything, except for the breaker's bypass endpoints such as
+        emergency_stop. The request and its retries are traced as one "http"
+        span.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The API endpoint to request.
+            timeout: The timeout in seconds, overriding the one configured for
+                     the endpoint.
+            decode: A function decoding the raw body instead of response.json().
+            **kwargs: Additional arguments for httpx.
+
+        Returns:
+            The JSON response from the API.
+        """
+        request_timeout = self._resolve_timeout(endpoint, timeout)
+        if request_timeout is not None:
+            kwargs["timeout"] = request_timeout
+        policy = self.retry_policy
+        breaker = self.circuit_breaker
+        if policy is not None:
+            policy.budget(self.base_url).record_request()
+        with span(
+            f"{method} {endpoint}",
+            HTTP,
+            method=method,
+            endpoint=endpoint,
+            printer=self.base_url,
+        ) as current:
+            attempt = 1
+            while True:
+                if current is not None:
+                    current.attributes["attempts"] = attempt
+                if breaker is not None and not breaker.bypasses(endpoint):
+                    await breaker.guard(self.base_url, self._probe)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(self.base_url, endpoint)
+                try:
+                    response = await self._send(method, endpoint, **kwargs)
+                    self.payloads.record(
+                        endpoint, response.num_bytes_downloaded, len(response.content)
+                    )
+                    if current is not None:
+                        current.attributes.update(
+                            status_code=response.status_code,
+                            request_bytes=len(response.request.content),
+                            response_bytes=len(response.content),
+                            wire_bytes=response.num_bytes_downloaded,
+                        )
+                    response.raise_for_status()
+                    if breaker is not None:
+                        breaker.record_success(self.base_url)
+                    if decode is not None:
+                        return decode(response.content)
+                    return response.json()
+                except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                    if breaker is not None:
+                        breaker.record(self.base_url, exc)
+                    if (
+                        policy is None
+                        or not policy.should_retry(method, endpoint, exc, attempt)
+                        or not policy.budget(self.base_url).try_spend()
+                    ):
+                        raise
+                    delay = policy.delay(attempt, exc)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _resolve_timeout(
+        self, endpoint: str, timeout: Optional[float]
+    ) -> Optional[httpx.Timeout]:
+        """
+        Get the timeout of a request.
+
+        Args:
+            endpoint: The API endpoint to request.
+            timeout: The timeout in seconds given by the caller, if any.
+
+        Returns:
+            The timeout, or None to use the client's default.
+        """
+        if timeout is None:
+            timeout = self.transport_config.timeout_for(endpoint)
+        if timeout is None:
+            return None
+        return httpx.Timeout(timeout, connect=self.transport_config.connect_timeout)
+
+    async def _send(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request with authentication headers.
+
+        A token rejected with a 401 is dropped and the request is sent once
+        more with a fresh one.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The API endpoint to request.
+            **kwargs: Additional arguments for httpx.
+
+        Returns:
+            The HTTP response.
+        """
+        token = None
+        if self.token_manager is not None:
+            token = await self.token_manager.ensure_token()
+        response = await self._client.request(
+            method, endpoint, headers=self._get_headers(), **kwargs
+        )
+        if response.status_code == 401 and token is not None:
+            self.token_manager.invalidate(token)
+            await self.token_manager.ensure_token()
+            response = await self._client.request(
+                method, endpoint, headers=self._get_headers(), **kwargs
+            )
+        return response
+
+    @asynccontextmanager
+    async def _open_stream(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed response with authentication headers.
+
+        Like _send, a token rejected with a 401 is replaced once.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The API endpoint to request.
+            **kwargs: Additional arguments for httpx.
+
+        Yields:
+            The HTTP response, with its body not yet read.
+        """
+        token = None
+        if self.token_manager is not None:
+            token = await self.token_manager.ensure_token()
+        async with self._client.stream(
+            method, endpoint, headers=self._get_headers(), **kwargs
+        ) as response:
+            if response.status_code != 401 or token is None:
+                yield response
+                return
+        self.token_manager.invalidate(token)
+        await self.token_manager.ensure_token()
+        async with self._client.stream(
+            method, endpoint, headers=self._get_headers(), **kwargs
+        ) as response:
+            yield response
+
+    async def _probe(self) -> None:
+        """Check whether the host has recovered, for the circuit breaker."""
+        response = await self._client.get(
+            self.circuit_breaker.probe_endpoint, headers=self._get_headers()
+        )
         response.raise_for_status()
-        return response.json()
+
+    def health(self) -> Dict[str, Any]:
+        """
+        Report the health of the host as seen by the circuit breaker.
+
+        Returns:
+            A dictionary with the circuit "state", consecutive "failures",
+            "last_error" and the number of seconds until the next probe.
+        """
+        if self.circuit_breaker is None:
+            return {"state": "closed", "failures": 0, "last_error": None}
+        return self.circuit_breaker.health(self.base_url)[self.base_url]
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -88,6 +417,8 @@ class MoonrakerClient:
         headers = {}
         if self.api_key:
             headers["X-Api-Key"] = self.api_key
+        if self.token_manager is not None and self.token_manager.token:
+            headers["Authorization"] = f"Bearer {self.token_manager.token}"
         return headers
 
     async def close(self) -> None:
@@ -0,0 +1,93 @@
+"""A named set of Moonraker instances addressed together."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from ..client import MoonrakerClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Fleet:
+    """A collection of MoonrakerClient instances keyed by printer name."""
+
+    def __init__(
+        self, clients: Dict[str, MoonrakerClient], max_concurrency: int = 16
+    ) -> None:
+        """
+        Initialize the Fleet.
+
+        Args:
+            clients: A dictionary of printer names to their clients.
+            max_concurrency: The maximum number of printers contacted at once.
+        """
+        self.clients = dict(clients)
+        self.max_concurrency = max_concurrency
+
+    @property
+    def names(self) -> List[str]:
+        """The names of the printers in the fleet."""
+        return list(self.clients)
+
+    def client(self, name: str) -> MoonrakerClient:
+        """
+        Get the client of a printer.
+
+        Args:
+            name: The name of the printer.
+
+        Returns:
+            The printer's MoonrakerClient.
+        """
+        try:
+            return self.clients[name]
+        except KeyError:
+            raise ValueError(f"Unknown printer: {name}") from None
+
+    async def gather(
+        self,
+        func: Callable[[str, MoonrakerClient], Awaitable[T]],
+        names: Optional[Iterable[str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Tuple[Dict[str, T], Dict[str, Exception]]:
+        """
+        Run a coroutine function for several printers in parallel.
+
+        A failing printer does not affect the others.
+
+        Args:
+            func: A coroutine function called with a printer name and client.
+            names: The printers to run it for. Defaults to the whole fleet.
+            max_concurrency: Overrides the fleet's concurrency limit.
+
+        Returns:
+            A tuple of the results and the errors, each keyed by printer name.
+        """
+        names = self.names if names is None else list(names)
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def run(name: str) -> T:
+            async with semaphore:
+                return await func(name, self.client(name))
+
+        outcomes = await asyncio.gather(
+            *(run(name) for name in names), return_exceptions=True
+        )
+        results: Dict[str, T] = {}
+        errors: Dict[str, Exception] = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Fleet call to %s failed: %s", name, outcome)
+                errors[name] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[name] = outcome
+        return results, errors
+
+    async def close(self) -> None:
+        """Close the clients of every printer."""
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
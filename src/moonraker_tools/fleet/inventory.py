@@ -0,0 +1,116 @@
+"""Collect system information across a fleet and report what changed."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ..client import MoonrakerClient
+from ..tools.machine import MachineTools
+from .base import Fleet
+
+
+def section_hashes(system_info: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Hash each section of a system_info payload.
+
+    Args:
+        system_info: The "system_info" dictionary of a system_info response.
+
+    Returns:
+        A dictionary of section names to SHA-256 hex digests.
+    """
+    return {
+        section: hashlib.sha256(
+            json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+        for section, value in system_info.items()
+    }
+
+
+class Inventory:
+    """A local store of system information that reports changed sections."""
+
+    def __init__(self, fleet: Fleet, path: str) -> None:
+        """
+        Initialize the Inventory.
+
+        Args:
+            fleet: The printers to collect from.
+            path: The path of the JSON file the inventory is kept in.
+        """
+        self.fleet = fleet
+        self.path = Path(path)
+        self._printers: Dict[str, Dict[str, Any]] = self._load()
+
+    def sections(self, name: str) -> Dict[str, Any]:
+        """
+        Get the stored system information of a printer.
+
+        Args:
+            name: The name of the printer.
+
+        Returns:
+            A dictionary of section names to their last collected values.
+        """
+        return self._printers.get(name, {}).get("sections", {})
+
+    async def collect(self) -> Dict[str, Any]:
+        """
+        Collect system information from every printer in parallel.
+
+        Only sections whose hash differs from the stored one are compared,
+        reported and rewritten.
+
+        Returns:
+            A dictionary with the "changed" sections and their new values, the
+            "removed" section names and the "errors", each keyed by printer.
+        """
+
+        async def fetch(name: str, client: MoonrakerClient) -> Dict[str, Any]:
+            response = await MachineTools(client).get_system_info()
+            return response.get("result", {}).get("system_info", {})
+
+        results, errors = await self.fleet.gather(fetch)
+        changed: Dict[str, Dict[str, Any]] = {}
+        removed: Dict[str, List[str]] = {}
+        for name, system_info in results.items():
+            hashes = section_hashes(system_info)
+            entry = self._printers.setdefault(name, {"hashes": {}, "sections": {}})
+            previous = entry["hashes"]
+            updates = {
+                section: system_info[section]
+                for section, digest in hashes.items()
+                if previous.get(section) != digest
+            }
+            gone = [section for section in previous if section not in hashes]
+            if updates:
+                changed[name] = updates
+            if gone:
+                removed[name] = gone
+            for section in gone:
+                entry["sections"].pop(section, None)
+            entry["sections"].update(updates)
+            entry["hashes"] = hashes
+            entry["collected_at"] = time.time()
+
+        if changed or removed:
+            self._save()
+        return {
+            "changed": changed,
+            "removed": removed,
+            "errors": {name: str(error) for name, error in errors.items()},
+        }
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text())
+
+    def _save(self) -> None:
+        # Write a temporary file first so a crash never truncates the store.
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps(self._printers))
+        os.replace(temporary, self.path)
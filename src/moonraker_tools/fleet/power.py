@@ -0,0 +1,153 @@
+"""Switch power devices across a fleet with one request per host."""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..client import MoonrakerClient
+from ..tools.devices import DevicesTools
+from .base import Fleet
+
+
+class FleetPower:
+    """Control the power devices of many printers at once."""
+
+    def __init__(self, fleet: Fleet) -> None:
+        """
+        Initialize the FleetPower.
+
+        Args:
+            fleet: The printers whose devices are controlled.
+        """
+        self.fleet = fleet
+
+    async def power_on(
+        self, targets: Iterable[Tuple[str, str]], stagger: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        Turn devices on, with one batch request per Moonraker host.
+
+        Args:
+            targets: Pairs of printer names and device names.
+            stagger: The number of seconds between the power-on of two hosts,
+                     to spread the inrush current.
+
+        Returns:
+            The aggregated device states, as returned by status.
+        """
+        return await self._switch(targets, "on", stagger)
+
+    async def power_off(self, targets: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Turn devices off, with one batch request per Moonraker host.
+
+        Args:
+            targets: Pairs of printer names and device names.
+
+        Returns:
+            The aggregated device states, as returned by status.
+        """
+        return await self._switch(targets, "off", 0.0)
+
+    async def status(self, targets: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+        """
+        Get the state of devices, with one batch request per Moonraker host.
+
+        Args:
+            targets: Pairs of printer names and device names.
+
+        Returns:
+            A dictionary with the "devices" states keyed by printer and device
+            name, and the "errors" keyed by printer name.
+        """
+        groups = self._group(targets)
+
+        async def fetch(name: str, client: MoonrakerClient) -> Dict[str, str]:
+            response = await DevicesTools(client).get_batch_device_status(
+                _devices(groups[name])
+            )
+            return response.get("result", {})
+
+        results, errors = await self.fleet.gather(fetch, names=list(groups))
+        return self._aggregate(groups, results, errors)
+
+    async def _switch(
+        self, targets: Iterable[Tuple[str, str]], action: str, stagger: float
+    ) -> Dict[str, Any]:
+        targets = list(targets)
+        groups = self._group(targets)
+        order = {name: index for index, name in enumerate(groups)}
+
+        async def switch(name: str, client: MoonrakerClient) -> Dict[str, str]:
+            if stagger:
+                await asyncio.sleep(order[name] * stagger)
+            devices = DevicesTools(client)
+            names = _devices(groups[name])
+            if action == "on":
+                response = await devices.batch_power_on(names)
+            else:
+                response = await devices.batch_power_off(names)
+            return response.get("result", {})
+
+        # Staggered hosts sleep inside the call, so none may wait for a slot.
+        limit = len(groups) if stagger else None
+        _, errors = await self.fleet.gather(
+            switch, names=list(groups), max_concurrency=limit
+        )
+        report = await self.status(targets)
+        for name, error in errors.items():
+            for printer in groups[name]:
+                report["errors"][printer] = str(error)
+        return report
+
+    def _group(
+        self, targets: Iterable[Tuple[str, str]]
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Group targets by the Moonraker host serving them.
+
+        Args:
+            targets: Pairs of printer names and device names.
+
+        Returns:
+            A dictionary keyed by the first printer name of each host, mapping
+            every printer on that host to its device names.
+        """
+        hosts: Dict[str, str] = {}
+        groups: Dict[str, Dict[str, List[str]]] = {}
+        for printer, device in targets:
+            base_url = self.fleet.client(printer).base_url
+            name = hosts.setdefault(base_url, printer)
+            devices = groups.setdefault(name, {}).setdefault(printer, [])
+            if device not in devices:
+                devices.append(device)
+        return groups
+
+    def _aggregate(
+        self,
+        groups: Dict[str, Dict[str, List[str]]],
+        results: Dict[str, Dict[str, str]],
+        errors: Dict[str, Exception],
+    ) -> Dict[str, Any]:
+        devices: Dict[str, Dict[str, Optional[str]]] = {}
+        failed: Dict[str, str] = {}
+        for name, printers in groups.items():
+            for printer, names in printers.items():
+                if name in errors:
+                    failed[printer] = str(errors[name])
+                else:
+                    states = results.get(name, {})
+                    devices[printer] = {device: states.get(device) for device in names}
+        return {"devices": devices, "errors": failed}
+
+
+def _devices(printers: Dict[str, List[str]]) -> List[str]:
+    """
+    Collect the device names of the printers sharing a host.
+
+    Args:
+        printers: A dictionary of printer names to their device names.
+
+    Returns:
+        The sorted, unique device names.
+    """
+    return sorted({device for names in printers.values() for device in names})
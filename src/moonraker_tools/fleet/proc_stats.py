@@ -0,0 +1,348 @@
+"""Sample process statistics across a fleet into fixed-size ring buffers."""
+
+import asyncio
+import logging
+import math
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from ..client import MoonrakerClient
+from ..tools.machine import MachineTools
+from .base import Fleet
+
+logger = logging.getLogger(__name__)
+
+# The metrics kept for every printer.
+METRICS = (
+    "system_cpu",
+    "moonraker_cpu",
+    "memory_used",
+    "cpu_temp",
+    "throttled",
+    "websocket_connections",
+)
+
+
+class RingBuffer:
+    """A preallocated buffer of floats that overwrites its oldest values."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the RingBuffer.
+
+        Args:
+            capacity: The number of values kept.
+        """
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> None:
+        """
+        Add a value, overwriting the oldest one once the buffer is full.
+
+        Args:
+            value: The value to add.
+        """
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    def values(self) -> List[float]:
+        """
+        Get the stored values.
+
+        Returns:
+            The values from oldest to newest.
+        """
+        if self._count < len(self._values):
+            return self._values[: self._count].tolist()
+        return (self._values[self._next :] + self._values[: self._next]).tolist()
+
+    def last(self) -> float:
+        """
+        Get the newest value.
+
+        Returns:
+            The newest value, or NaN if the buffer is empty.
+        """
+        if not self._count:
+            return math.nan
+        return self._values[self._next - 1]
+
+    def percentile(self, percent: float) -> float:
+        """
+        Compute a percentile of the stored values, ignoring missing ones.
+
+        Args:
+            percent: The percentile, between 0 and 100.
+
+        Returns:
+            The linearly interpolated percentile, or NaN if there are no values.
+        """
+        return _percentile(sorted(self._present()), percent)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the stored values, ignoring missing ones.
+
+        Returns:
+            A dictionary with the count, min, mean, p50, p95, max and last value.
+        """
+        values = sorted(self._present())
+        if not values:
+            return {"count": 0}
+        return {
+            "count": len(values),
+            "min": values[0],
+            "mean": math.fsum(values) / len(values),
+            "p50": _percentile(values, 50),
+            "p95": _percentile(values, 95),
+            "max": values[-1],
+            "last": self.last(),
+        }
+
+    def _present(self) -> List[float]:
+        return [value for value in self.values() if not math.isnan(value)]
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """
+    Compute a percentile of sorted values.
+
+    Args:
+        values: The values in ascending order.
+        percent: The percentile, between 0 and 100.
+
+    Returns:
+        The linearly interpolated percentile, or NaN if there are no values.
+    """
+    if not values:
+        return math.nan
+    rank = (len(values) - 1) * percent / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+class ProcStatsSampler:
+    """Keep a time series of process statistics for every printer in a fleet."""
+
+    def __init__(
+        self, fleet: Fleet, capacity: int = 3600, interval: float = 1.0
+    ) -> None:
+        """
+        Initialize the ProcStatsSampler.
+
+        Args:
+            fleet: The printers to sample.
+            capacity: The number of samples kept per printer and metric.
+            interval: The number of seconds between two polls.
+        """
+        self.fleet = fleet
+        self.capacity = capacity
+        self.interval = interval
+        self._series: Dict[str, Dict[str, RingBuffer]] = {}
+        self._throttled: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start polling the fleet in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def sample(self) -> None:
+        """Poll every printer once and record the results."""
+
+        async def fetch(name: str, client: MoonrakerClient) -> Dict[str, Any]:
+            return await MachineTools(client).get_proc_stats()
+
+        results, _ = await self.fleet.gather(fetch)
+        for name, response in results.items():
+            self.record(name, response.get("result", {}))
+
+    def handler(self, name: str) -> Any:
+        """
+        Get a websocket notification handler recording a printer's updates.
+
+        Use it instead of polling by passing it to MoonrakerWebsocket.add_handler.
+
+        Args:
+            name: The name of the printer the websocket belongs to.
+
+        Returns:
+            A notification handler.
+        """
+
+        def handle(method: str, params: List[Any]) -> None:
+            if not params:
+                return
+            if method == "notify_proc_stat_update":
+                self.record(name, params[0])
+            elif method == "notify_cpu_throttled":
+                self._throttled[name] = float(params[0].get("bits", 0))
+
+        return handle
+
+    def record(self, name: str, stats: Dict[str, Any]) -> None:
+        """
+        Record one sample of process statistics.
+
+        Args:
+            name: The name of the printer.
+            stats: The result of a proc_stats request, or the parameters of a
+                   notify_proc_stat_update notification.
+        """
+        series = self._series.get(name)
+        if series is None:
+            series = {metric: RingBuffer(self.capacity) for metric in METRICS}
+            series["time"] = RingBuffer(self.capacity)
+            self._series[name] = series
+
+        moonraker = stats.get("moonraker_stats") or {}
+        if isinstance(moonraker, list):
+            # Requests return the recent history; the newest sample is last.
+            moonraker = moonraker[-1] if moonraker else {}
+        memory = stats.get("system_memory") or {}
+        throttled = stats.get("throttled_state")
+        if throttled is not None:
+            self._throttled[name] = float(throttled.get("bits", 0))
+
+        values = {
+            "system_cpu": _number((stats.get("system_cpu_usage") or {}).get("cpu")),
+            "moonraker_cpu": _number(moonraker.get("cpu_usage")),
+            "memory_used": _ratio(memory.get("used"), memory.get("total")),
+            "cpu_temp": _number(stats.get("cpu_temp")),
+            "throttled": self._throttled.get(name, math.nan),
+            "websocket_connections": _number(stats.get("websocket_connections")),
+        }
+        timestamp = _number(moonraker.get("time"))
+        series["time"].append(time.time() if math.isnan(timestamp) else timestamp)
+        for metric, value in values.items():
+            series[metric].append(value)
+
+    def series(self, name: str, metric: str) -> List[float]:
+        """
+        Get the recorded values of a metric.
+
+        Args:
+            name: The name of the printer.
+            metric: One of METRICS, or "time" for the sample timestamps.
+
+        Returns:
+            The values from oldest to newest, NaN where a sample lacked it.
+        """
+        return self._buffer(name, metric).values()
+
+    def percentile(self, name: str, metric: str, percent: float) -> float:
+        """
+        Compute a percentile of a metric.
+
+        Args:
+            name: The name of the printer.
+            metric: One of METRICS.
+            percent: The percentile, between 0 and 100.
+
+        Returns:
+            The percentile, or NaN if nothing was recorded.
+        """
+        return self._buffer(name, metric).percentile(percent)
+
+    def summary(self, name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize every metric of one printer or of the whole fleet.
+
+        Args:
+            name: The name of the printer. Defaults to every sampled printer.
+
+        Returns:
+            A dictionary of printer names to metric summaries.
+        """
+        names = list(self._series) if name is None else [name]
+        return {
+            printer: {
+                metric: self._buffer(printer, metric).summary() for metric in METRICS
+            }
+            for printer in names
+        }
+
+    def overloaded(
+        self, metric: str = "system_cpu", threshold: float = 90.0, percent: float = 95
+    ) -> List[str]:
+        """
+        Find the printers whose metric percentile exceeds a threshold.
+
+        Args:
+            metric: One of METRICS.
+            threshold: The value above which a printer is overloaded.
+            percent: The percentile compared against the threshold.
+
+        Returns:
+            The names of the overloaded printers.
+        """
+        return [
+            name
+            for name in self._series
+            if self.percentile(name, metric, percent) > threshold
+        ]
+
+    def _buffer(self, name: str, metric: str) -> RingBuffer:
+        try:
+            return self._series[name][metric]
+        except KeyError:
+            raise ValueError(f"No {metric} samples for printer: {name}") from None
+
+    async def _poll(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.sample()
+            except Exception:
+                logger.exception("Sampling proc stats failed.")
+            await asyncio.sleep(max(self.interval - (time.monotonic() - started), 0.0))
+
+
+def _number(value: Any) -> float:
+    """
+    Convert a value to a float.
+
+    Args:
+        value: A number or None.
+
+    Returns:
+        The value as a float, or NaN if it is missing.
+    """
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _ratio(part: Any, total: Any) -> float:
+    """
+    Compute a percentage.
+
+    Args:
+        part: The numerator.
+        total: The denominator.
+
+    Returns:
+        The percentage, or NaN if either value is missing or total is zero.
+    """
+    part, total = _number(part), _number(total)
+    if math.isnan(part) or math.isnan(total) or not total:
+        return math.nan
+    return 100.0 * part / total
@@ -0,0 +1,191 @@
+"""Dispatch a global backlog of print jobs across a fleet."""
+
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from ..client import MoonrakerClient
+from ..tools.file_manager import FileManagerTools
+from ..tools.job_queue import JobQueueTools
+from ..tools.printer import PrinterTools
+from .base import Fleet
+
+logger = logging.getLogger(__name__)
+
+# print_stats states in which a printer can start a new job.
+IDLE_STATES = frozenset({"standby", "complete", "cancelled"})
+
+_job_ids = itertools.count(1)
+
+
+@dataclass
+class Job:
+    """A print job waiting in the fleet backlog."""
+
+    filename: str
+    tags: FrozenSet[str] = frozenset()
+    estimated_time: Optional[float] = None
+    job_id: int = field(default_factory=lambda: next(_job_ids))
+
+
+@dataclass
+class PrinterState:
+    """What the scheduler knows about a printer after a poll."""
+
+    state: str
+    queued: int
+    queue_state: str
+
+    @property
+    def idle(self) -> bool:
+        """Whether the printer can take a job now."""
+        return (
+            self.state in IDLE_STATES
+            and self.queued == 0
+            and self.queue_state != "paused"
+        )
+
+
+class FleetJobScheduler:
+    """Send backlog jobs to the least loaded idle printer that can print them."""
+
+    def __init__(
+        self,
+        fleet: Fleet,
+        printer_tags: Optional[Dict[str, Iterable[str]]] = None,
+        interval: float = 10.0,
+    ) -> None:
+        """
+        Initialize the FleetJobScheduler.
+
+        The files must already be present on every printer that may print
+        them.
+
+        Args:
+            fleet: The printers to dispatch to.
+            printer_tags: The capabilities of each printer, such as a material
+                          or nozzle size. A job is only sent to printers that
+                          have all of its tags.
+            interval: The number of seconds between two dispatch rounds.
+        """
+        self.fleet = fleet
+        self.printer_tags = {
+            name: frozenset(tags) for name, tags in (printer_tags or {}).items()
+        }
+        self.interval = interval
+        self.backlog: List[Job] = []
+        # The estimated seconds of work sent to each printer so far.
+        self.load: Dict[str, float] = {name: 0.0 for name in fleet.names}
+        self._estimates: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, filename: str, tags: Iterable[str] = ()) -> Job:
+        """
+        Add a job to the backlog.
+
+        Args:
+            filename: The path of the file, relative to the gcodes root.
+            tags: The capabilities a printer needs to print it.
+
+        Returns:
+            The queued job.
+        """
+        job = Job(filename, frozenset(tags))
+        self.backlog.append(job)
+        return job
+
+    async def start(self) -> None:
+        """Start dispatching in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop dispatching."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def poll(self) -> Dict[str, PrinterState]:
+        """
+        Read the print and job queue state of every printer.
+
+        Returns:
+            A dictionary of the reachable printers' names to their state.
+        """
+
+        async def fetch(name: str, client: MoonrakerClient) -> PrinterState:
+            status, queue = await asyncio.gather(
+                PrinterTools(client).query_objects({"print_stats": ["state"]}),
+                JobQueueTools(client).get_status(),
+            )
+            objects = status.get("result", {}).get("status", {})
+            print_stats = objects.get("print_stats", {})
+            queue = queue.get("result", {})
+            return PrinterState(
+                state=print_stats.get("state", "error"),
+                queued=len(queue.get("queued_jobs", [])),
+                queue_state=queue.get("queue_state", "ready"),
+            )
+
+        states, _ = await self.fleet.gather(fetch)
+        return states
+
+    async def dispatch(self) -> List[Tuple[Job, str]]:
+        """
+        Run one dispatch round.
+
+        Each job in backlog order goes to the idle compatible printer with
+        the least estimated work sent to it so far.
+
+        Returns:
+            The dispatched jobs and the printers they were sent to.
+        """
+        if not self.backlog:
+            return []
+        idle = {name for name, state in (await self.poll()).items() if state.idle}
+        dispatched = []
+        for job in list(self.backlog):
+            candidates = [name for name in idle if self._compatible(job, name)]
+            if not candidates:
+                continue
+            printer = min(candidates, key=lambda name: (self.load[name], name))
+            try:
+                if job.estimated_time is None:
+                    job.estimated_time = await self._estimate(job.filename, printer)
+                await JobQueueTools(self.fleet.client(printer)).enqueue_job(
+                    [job.filename]
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Sending %s to %s failed: %s", job.filename, printer, exc
+                )
+                idle.discard(printer)
+                continue
+            self.backlog.remove(job)
+            idle.discard(printer)
+            self.load[printer] += job.estimated_time
+            dispatched.append((job, printer))
+        return dispatched
+
+    def _compatible(self, job: Job, name: str) -> bool:
+        return job.tags <= self.printer_tags.get(name, frozenset())
+
+    async def _estimate(self, filename: str, printer: str) -> float:
+        if filename not in self._estimates:
+            response = await FileManagerTools(self.fleet.client(printer)).get_metadata(
+                filename
+            )
+            metadata: Dict[str, Any] = response.get("result", {})
+            self._estimates[filename] = float(metadata.get("estimated_time") or 0.0)
+        return self._estimates[filename]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.dispatch()
+            except Exception:
+                logger.exception("Dispatching the fleet backlog failed.")
+            await asyncio.sleep(self.interval)
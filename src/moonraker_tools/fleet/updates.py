@@ -0,0 +1,190 @@
+"""Roll software updates out across a fleet in health-checked waves."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from ..client import MoonrakerClient
+from ..tools.printer import PrinterTools
+from ..tools.update_manager import UpdateManagerTools
+from .base import Fleet
+
+logger = logging.getLogger(__name__)
+
+
+def outdated_components(version_info: Dict[str, Any]) -> List[str]:
+    """
+    Find the components with an update available.
+
+    Args:
+        version_info: The "version_info" dictionary of an update status.
+
+    Returns:
+        The names of the outdated components.
+    """
+    names = []
+    for name, info in version_info.items():
+        if name == "system":
+            outdated = info.get("package_count", 0) > 0
+        elif "commits_behind" in info:
+            outdated = bool(info["commits_behind"])
+        else:
+            remote = info.get("remote_version")
+            outdated = remote not in (None, "?") and info.get("version") != remote
+        if outdated:
+            names.append(name)
+    return names
+
+
+class RollingUpdate:
+    """Refresh a fleet in parallel, then upgrade it in waves."""
+
+    def __init__(
+        self,
+        fleet: Fleet,
+        wave_size: int = 5,
+        max_failures: int = 1,
+        health_timeout: float = 120.0,
+        health_interval: float = 2.0,
+    ) -> None:
+        """
+        Initialize the RollingUpdate.
+
+        Args:
+            fleet: The printers to update.
+            wave_size: The number of printers upgraded at the same time.
+            max_failures: The number of failed upgrades after which the
+                          remaining waves are skipped.
+            health_timeout: The number of seconds an upgraded printer has to
+                            report Klippy as ready.
+            health_interval: The number of seconds between two health checks.
+        """
+        self.fleet = fleet
+        self.wave_size = wave_size
+        self.max_failures = max_failures
+        self.health_timeout = health_timeout
+        self.health_interval = health_interval
+
+    async def refresh(self) -> Dict[str, List[str]]:
+        """
+        Refresh the update status of every printer in parallel.
+
+        Returns:
+            A dictionary of printer names to their outdated components.
+            Printers that could not be refreshed are left out.
+        """
+
+        async def fetch(name: str, client: MoonrakerClient) -> List[str]:
+            response = await UpdateManagerTools(client).refresh()
+            return outdated_components(
+                response.get("result", {}).get("version_info", {})
+            )
+
+        results, _ = await self.fleet.gather(fetch)
+        return results
+
+    async def run(
+        self, components: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Upgrade every outdated printer, one wave at a time.
+
+        A printer whose upgrade fails, or whose Klippy is not ready afterwards,
+        has the upgraded components rolled back. Printers that cannot be
+        refreshed are reported as unreachable and do not count towards
+        max_failures.
+
+        Args:
+            components: Only upgrade these components. Defaults to all.
+
+        Returns:
+            A dictionary of printer names to a dictionary with the "status"
+            ("up_to_date", "updated", "rolled_back", "failed", "skipped" or
+            "unreachable"),
+            the upgraded "components" and an optional "error".
+        """
+        outdated = await self.refresh()
+        report: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for name in self.fleet.names:
+            if name not in outdated:
+                report[name] = {"status": "unreachable", "error": "Refresh failed."}
+                continue
+            names = [
+                component
+                for component in outdated[name]
+                if components is None or component in components
+            ]
+            if names:
+                pending.append((name, names))
+            else:
+                report[name] = {"status": "up_to_date", "components": []}
+
+        # Only upgrades spend the failure budget; an offline printer must not
+        # stop the others from being updated.
+        failures = 0
+        for start in range(0, len(pending), self.wave_size):
+            wave = pending[start : start + self.wave_size]
+            if failures >= self.max_failures:
+                for name, names in wave:
+                    report[name] = {"status": "skipped", "components": names}
+                continue
+            results = await asyncio.gather(
+                *(self._update(name, names) for name, names in wave)
+            )
+            for (name, _), result in zip(wave, results):
+                report[name] = result
+                if result["status"] != "updated":
+                    failures += 1
+        return report
+
+    async def _update(self, name: str, components: List[str]) -> Dict[str, Any]:
+        client = self.fleet.client(name)
+        updater = UpdateManagerTools(client)
+        upgraded: List[str] = []
+        try:
+            for component in components:
+                upgraded.append(component)
+                await updater.upgrade(component)
+            await self._wait_until_ready(client)
+        except Exception as exc:
+            logger.warning("Updating %s failed: %s", name, exc)
+            return await self._roll_back(name, updater, upgraded, exc)
+        return {"status": "updated", "components": upgraded}
+
+    async def _roll_back(
+        self,
+        name: str,
+        updater: UpdateManagerTools,
+        upgraded: List[str],
+        error: Exception,
+    ) -> Dict[str, Any]:
+        status = "rolled_back"
+        for component in reversed(upgraded):
+            if component == "system":
+                # OS packages cannot be rolled back.
+                continue
+            try:
+                await updater.rollback(component)
+            except Exception as exc:
+                logger.error("Rolling back %s on %s failed: %s", component, name, exc)
+                status = "failed"
+        return {"status": status, "components": upgraded, "error": str(error)}
+
+    async def _wait_until_ready(self, client: MoonrakerClient) -> None:
+        printer = PrinterTools(client)
+        deadline = time.monotonic() + self.health_timeout
+        state = None
+        while True:
+            try:
+                response = await printer.get_info()
+                state = response.get("result", {}).get("state")
+            except Exception as exc:
+                # Moonraker or Klippy may be restarting.
+                state = str(exc)
+            if state == "ready":
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Klippy is not ready: {state}")
+            await asyncio.sleep(self.health_interval)
@@ -0,0 +1,101 @@
+"""Typed, slotted models of Moonraker responses."""
+
+import dataclasses
+import importlib.util
+import json
+import typing
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# msgspec decodes straight from bytes into the models when it is installed.
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+
+@dataclass(slots=True)
+class FileEntry:
+    """A file returned by /server/files/list."""
+
+    path: str
+    modified: float = 0.0
+    size: int = 0
+    permissions: str = ""
+
+
+@dataclass(slots=True)
+class HistoryJob:
+    """A job returned by /server/history/list."""
+
+    job_id: str
+    filename: str = ""
+    status: str = ""
+    start_time: float = 0.0
+    end_time: Optional[float] = None
+    print_duration: float = 0.0
+    total_duration: float = 0.0
+    filament_used: float = 0.0
+    exists: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class HistoryJobList:
+    """A page of jobs returned by /server/history/list."""
+
+    count: int = 0
+    jobs: List[HistoryJob] = field(default_factory=list)
+
+
+def decode_result(model: Any, content: bytes) -> Any:
+    """
+    Decode the "result" of a Moonraker response into a model.
+
+    Fields the model does not declare are dropped.
+
+    Args:
+        model: The type of the result, such as List[FileEntry].
+        content: The raw response body.
+
+    Returns:
+        The decoded result.
+    """
+    return _decoder(model)(content)
+
+
+@lru_cache(maxsize=None)
+def _decoder(model: Any) -> Callable[[bytes], Any]:
+    if HAS_MSGSPEC:
+        import msgspec
+
+        envelope = msgspec.defstruct("Envelope", [("result", model)])
+        decoder = msgspec.json.Decoder(envelope)
+        return lambda content: decoder.decode(content).result
+    return lambda content: _convert(model, json.loads(content)["result"])
+
+
+@lru_cache(maxsize=None)
+def _fields(model: type) -> Dict[str, Any]:
+    hints = typing.get_type_hints(model)
+    return {f.name: hints[f.name] for f in dataclasses.fields(model)}
+
+
+def _convert(model: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    origin = typing.get_origin(model)
+    if origin is list:
+        (item,) = typing.get_args(model)
+        return [_convert(item, entry) for entry in value]
+    if origin is Union:
+        arg = next(a for a in typing.get_args(model) if a is not type(None))
+        return _convert(arg, value)
+    if dataclasses.is_dataclass(model):
+        fields = _fields(model)
+        return model(
+            **{
+                name: _convert(hint, value[name])
+                for name, hint in fields.items()
+                if name in value
+            }
+        )
+    return value
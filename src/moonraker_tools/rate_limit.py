@@ -0,0 +1,144 @@
+"""Client-side rate limiting of requests to Moonraker, per host."""
+
+import asyncio
+import time
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+READ = "read"
+MOTION = "motion"
+
+# Endpoints that make Klippy move or change state, sharing the motion budget.
+MOTION_ENDPOINTS = frozenset(
+    {
+        "/printer/gcode/script",
+        "/printer/print/start",
+        "/printer/print/pause",
+        "/printer/print/resume",
+        "/printer/print/cancel",
+        "/printer/restart",
+        "/printer/firmware_restart",
+    }
+)
+
+# Endpoints that are never delayed.
+EXEMPT_ENDPOINTS = frozenset({"/printer/emergency_stop"})
+
+
+class TokenBucket:
+    """A token bucket that schedules callers instead of rejecting them."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        Initialize the TokenBucket.
+
+        Args:
+            rate: The number of requests allowed per second.
+            burst: The number of requests allowed at once after a quiet period.
+        """
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+        # The time at which the bucket would be empty again.
+        self._full_at = 0.0
+
+    def reserve(self) -> float:
+        """
+        Take a token, reserving the next free slot if none is left.
+
+        Callers are served in the order they reserve.
+
+        Returns:
+            The number of seconds to wait before sending.
+        """
+        now = time.monotonic()
+        full_at = max(self._full_at, now)
+        self._full_at = full_at + self.interval
+        return max(full_at - self.tolerance - now, 0.0)
+
+
+class RateLimiter:
+    """Separate read and motion budgets for every Moonraker host."""
+
+    def __init__(
+        self,
+        read_rate: float = 20.0,
+        read_burst: int = 10,
+        motion_rate: float = 2.0,
+        motion_burst: int = 2,
+        motion_endpoints: Iterable[str] = MOTION_ENDPOINTS,
+        exempt_endpoints: Iterable[str] = EXEMPT_ENDPOINTS,
+    ) -> None:
+        """
+        Initialize the RateLimiter.
+
+        Share one instance between the clients of a fleet so that clients of
+        the same host share its budgets.
+
+        Args:
+            read_rate: The number of other requests per second and host.
+            read_burst: The number of other requests allowed at once.
+            motion_rate: The number of motion requests per second and host.
+            motion_burst: The number of motion requests allowed at once.
+            motion_endpoints: The endpoints using the motion budget.
+            exempt_endpoints: The endpoints that are never delayed.
+        """
+        self._limits = {
+            READ: (read_rate, read_burst),
+            MOTION: (motion_rate, motion_burst),
+        }
+        self.motion_endpoints: FrozenSet[str] = frozenset(motion_endpoints)
+        self.exempt_endpoints: FrozenSet[str] = frozenset(exempt_endpoints)
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def classify(self, endpoint: str) -> str:
+        """
+        Get the budget an endpoint is charged to.
+
+        Args:
+            endpoint: The API endpoint.
+
+        Returns:
+            "motion" or "read".
+        """
+        return MOTION if endpoint in self.motion_endpoints else READ
+
+    async def acquire(self, host: str, endpoint: str) -> float:
+        """
+        Wait until a request may be sent to a host.
+
+        Args:
+            host: The base URL of the host.
+            endpoint: The API endpoint.
+
+        Returns:
+            The number of seconds waited.
+        """
+        if endpoint in self.exempt_endpoints:
+            return 0.0
+        key = (host, self.classify(endpoint))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(*self._limits[key[1]])
+            self._stats[key] = {"requests": 0, "throttled": 0, "throttled_seconds": 0.0}
+        delay = bucket.reserve()
+        stats = self._stats[key]
+        stats["requests"] += 1
+        if delay > 0:
+            stats["throttled"] += 1
+            stats["throttled_seconds"] += delay
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Report how much each host's requests were delayed.
+
+        Returns:
+            A dictionary of hosts to budgets ("read", "motion") to the number
+            of "requests", how many were "throttled" and the total
+            "throttled_seconds".
+        """
+        report: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (host, budget), stats in self._stats.items():
+            report.setdefault(host, {})[budget] = dict(stats)
+        return report
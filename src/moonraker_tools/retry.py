@@ -0,0 +1,188 @@
+"""Retry policies for requests to Moonraker."""
+
+import random
+import time
+from typing import Dict, FrozenSet, Iterable, Optional
+
+import httpx
+
+# POST endpoints that may be sent twice without changing the outcome.
+SAFE_POST_ENDPOINTS = frozenset(
+    {
+        "/printer/objects/query",
+        "/server/database/item",
+        "/machine/device_power/on",
+        "/machine/device_power/off",
+        "/machine/update/refresh",
+    }
+)
+
+# Status codes returned while Moonraker or a proxy in front of it is
+# restarting or overloaded.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Errors raised before the request reached the server; retrying them is safe
+# for any method.
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryBudget:
+    """Limit retries to a fraction of the requests made to a host."""
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 20.0,
+    ) -> None:
+        """
+        Initialize the RetryBudget.
+
+        Args:
+            ratio: The number of retries earned by each request.
+            min_per_second: The number of retries earned per second regardless
+                            of traffic, so rare requests may still retry.
+            max_tokens: The maximum number of retries that can be saved up.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+
+    def record_request(self) -> None:
+        """Earn retries for a request."""
+        self._refill(self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Spend a retry if the budget allows it.
+
+        Returns:
+            Whether a retry may be made.
+        """
+        self._refill(0.0)
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _refill(self, amount: float) -> None:
+        now = time.monotonic()
+        amount += (now - self._updated) * self.min_per_second
+        self._updated = now
+        self._tokens = min(self._tokens + amount, self.max_tokens)
+
+
+class RetryPolicy:
+    """Decide which failed requests are retried and when."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.2,
+        max_backoff: float = 5.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        safe_posts: Iterable[str] = SAFE_POST_ENDPOINTS,
+        budget_ratio: float = 0.2,
+    ) -> None:
+        """
+        Initialize the RetryPolicy.
+
+        GET requests and the safe POST endpoints are retried after timeouts,
+        dropped connections and the retry statuses. Other requests are only
+        retried when they never reached the server.
+
+        Args:
+            max_attempts: The maximum number of attempts per request.
+            backoff: The base delay in seconds, doubled after every attempt.
+            max_backoff: The maximum delay in seconds.
+            retry_statuses: The HTTP status codes that are retried.
+            safe_posts: The POST endpoints that are safe to send twice.
+            budget_ratio: The number of retries earned by each request to a
+                          host.
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.safe_posts: FrozenSet[str] = frozenset(safe_posts)
+        self.budget_ratio = budget_ratio
+        self._budgets: Dict[str, RetryBudget] = {}
+
+    def budget(self, host: str) -> RetryBudget:
+        """
+        Get the retry budget of a host, shared by every client using the policy.
+
+        Args:
+            host: The base URL of the host.
+
+        Returns:
+            The host's RetryBudget.
+        """
+        budget = self._budgets.get(host)
+        if budget is None:
+            budget = self._budgets[host] = RetryBudget(ratio=self.budget_ratio)
+        return budget
+
+    def is_idempotent(self, method: str, endpoint: str) -> bool:
+        """
+        Check whether a request may be sent twice.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The API endpoint.
+
+        Returns:
+            Whether the request is idempotent.
+        """
+        return method == "GET" or (method == "POST" and endpoint in self.safe_posts)
+
+    def should_retry(
+        self, method: str, endpoint: str, error: Exception, attempt: int
+    ) -> bool:
+        """
+        Check whether a failed attempt should be retried, budget aside.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The API endpoint.
+            error: The error raised by the attempt.
+            attempt: The number of the failed attempt, starting at 1.
+
+        Returns:
+            Whether to retry.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if isinstance(error, _NOT_SENT):
+            return True
+        if not self.is_idempotent(method, endpoint):
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, httpx.TransportError)
+
+    def delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """
+        Get the delay before the next attempt, with full jitter.
+
+        Args:
+            attempt: The number of the failed attempt, starting at 1.
+            error: The error raised by the attempt. A Retry-After header is
+                   honoured up to max_backoff.
+
+        Returns:
+            The delay in seconds.
+        """
+        ceiling = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        delay = random.uniform(0, ceiling)
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = error.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.max_backoff))
+        return delay
+
+
+# Shared by default so retry budgets apply per host across clients.
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,179 @@
+"""Incremental parsing of the arrays in large Moonraker responses."""
+
+import codecs
+import json
+import re
+from typing import Any, List, Sequence
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may still extend a number, as in "1" + ".5e-3".
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+# Parser states.
+_VALUE = "value"
+_KEYS = "keys"
+_ITEMS = "items"
+_DONE = "done"
+
+# The last token read in the current object or array.
+_OPEN = "open"
+_COMMA = "comma"
+_MEMBER = "member"
+
+# Returned by _decode while the value continues in a later chunk.
+_INCOMPLETE = object()
+
+
+class JSONItemStream:
+    """
+    Yield the items of an array nested in a JSON document as bytes arrive.
+
+    Only the array's items are kept; the values of other keys met on the way
+    are parsed and dropped, and everything after the array is ignored.
+    """
+
+    def __init__(self, path: Sequence[str] = ("result",)) -> None:
+        """
+        Initialize the JSONItemStream.
+
+        Args:
+            path: The object keys leading to the array, such as
+                  ("result", "jobs").
+        """
+        self._path = list(path)
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _VALUE
+        self._last = _OPEN
+
+    @property
+    def done(self) -> bool:
+        """Whether the array has ended or is known to be missing."""
+        return self._state == _DONE
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the document.
+
+        Args:
+            data: The bytes received since the last call.
+
+        Returns:
+            The array items completed by this chunk.
+        """
+        self._buffer = self._buffer[self._pos :] + self._text.decode(data)
+        self._pos = 0
+        items: List[Any] = []
+        while self._state != _DONE and self._step(items):
+            pass
+        return items
+
+    def close(self) -> None:
+        """Check that the document did not end inside the array."""
+        if self._state != _DONE:
+            raise ValueError("The response ended before the array was complete.")
+
+    def _step(self, items: List[Any]) -> bool:
+        """Advance by one token, returning False when more data is needed."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos == len(self._buffer):
+            return False
+        char = self._buffer[self._pos]
+        if self._state == _VALUE:
+            expected = "{" if self._path else "["
+            if char != expected:
+                # The path leads to something else, such as null.
+                self._state = _DONE
+                return False
+            self._pos += 1
+            self._state = _KEYS if self._path else _ITEMS
+            self._last = _OPEN
+            return True
+        if char == ",":
+            self._expect(self._last == _MEMBER, char)
+            self._pos += 1
+            self._last = _COMMA
+            return True
+        if char == ("]" if self._state == _ITEMS else "}"):
+            self._expect(self._last != _COMMA, char)
+            self._state = _DONE
+            return False
+        self._expect(self._last != _MEMBER, char)
+        if self._state == _ITEMS:
+            item = self._decode()
+            if item is _INCOMPLETE:
+                return False
+            items.append(item)
+            self._last = _MEMBER
+            return True
+        return self._key()
+
+    def _expect(self, valid: bool, char: str) -> None:
+        """Raise if a separator or value is out of place."""
+        if not valid:
+            raise ValueError(f"Invalid JSON in the response: unexpected {char!r}.")
+
+    def _key(self) -> bool:
+        """Read a key and descend into its value or skip it."""
+        start = self._pos
+        key = self._decode()
+        if key is _INCOMPLETE:
+            return False
+        self._expect(isinstance(key, str), self._buffer[start])
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos == len(self._buffer):
+            self._pos = start
+            return False
+        if self._buffer[self._pos] != ":":
+            raise ValueError(f"Expected ':' after key {key!r}.")
+        self._pos += 1
+        if key == self._path[0]:
+            self._path.pop(0)
+            self._state = _VALUE
+            return True
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._decode() is _INCOMPLETE:
+            self._pos = start
+            return False
+        self._last = _MEMBER
+        return True
+
+    def _decode(self) -> Any:
+        """Decode the value at the current position if it is complete."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as exc:
+            if self._truncated(exc):
+                return _INCOMPLETE
+            raise ValueError(f"Invalid JSON in the response: {exc}") from None
+        # A number followed only by digits, signs or exponents may continue in
+        # the next chunk.
+        if type(value) in (int, float) and self._continues_number(end):
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _continues_number(self, pos: int) -> bool:
+        """Whether the rest of the buffer may be the end of a number."""
+        return _NUMBER_TAIL.match(self._buffer, pos).end() == len(self._buffer)
+
+    def _truncated(self, exc: json.JSONDecodeError) -> bool:
+        """Whether a decode error is caused by the end of the buffer."""
+        if exc.msg.startswith("Unterminated string"):
+            return True
+        rest = self._buffer[exc.pos :]
+        if exc.msg.startswith("Invalid \\uXXXX escape"):
+            # Room for a surrogate pair, as in "\ud83d\ude00".
+            return len(rest) < len("uXXXX\\uXXXX")
+        if not rest.strip():
+            return True
+        if any(literal.startswith(rest) for literal in _LITERALS):
+            return True
+        return (
+            exc.pos > 0
+            and self._buffer[exc.pos - 1] in "0123456789.eE+-"
+            and self._continues_number(exc.pos)
+        )
@@ -0,0 +1,228 @@
+"""Blocking access to the Moonraker tools for code without an event loop."""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterator, Optional, TypeVar
+
+from .client import MoonrakerClient
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """An event loop running forever in a daemon thread."""
+
+    def __init__(self, name: str = "moonraker-tools") -> None:
+        """
+        Initialize the EventLoopThread and start its thread.
+
+        Args:
+            name: The name of the thread.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine in the loop and wait for its result.
+
+        Calls from several threads run concurrently in the loop.
+
+        Args:
+            awaitable: The coroutine to run.
+            timeout: The number of seconds to wait before cancelling the
+                     coroutine. Defaults to no limit.
+
+        Returns:
+            The result of the coroutine.
+        """
+        if threading.current_thread() is self._thread:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("Blocking calls cannot be made from the loop thread.")
+        future = asyncio.run_coroutine_threadsafe(_await(awaitable), self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """
+        Iterate over an async iterator from a blocking caller.
+
+        Args:
+            iterator: The async iterator, such as an async generator.
+
+        Yields:
+            The items of the iterator.
+        """
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                self.run(aclose())
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to exit."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+_default_loop: Optional[EventLoopThread] = None
+_default_lock = threading.Lock()
+
+
+def default_loop() -> EventLoopThread:
+    """
+    Get the loop thread shared by facades that are not given one.
+
+    It is started on first use and lives as long as the process.
+
+    Returns:
+        The shared EventLoopThread.
+    """
+    global _default_loop
+    with _default_lock:
+        if _default_loop is None:
+            _default_loop = EventLoopThread()
+        return _default_loop
+
+
+class SyncTools:
+    """Blocking versions of the methods of a *Tools instance."""
+
+    def __init__(self, tools: Any, loop: EventLoopThread) -> None:
+        """
+        Initialize the SyncTools.
+
+        Args:
+            tools: The *Tools instance, bound to a client used by the loop.
+            loop: The loop thread running the calls.
+        """
+        self._tools = tools
+        self._loop = loop
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._tools, name)
+        if inspect.isasyncgenfunction(attr):
+
+            @functools.wraps(attr)
+            def iterate(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                return self._loop.iterate(attr(*args, **kwargs))
+
+            return iterate
+        if inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            def call(*args: Any, **kwargs: Any) -> Any:
+                return self._loop.run(attr(*args, **kwargs))
+
+            return call
+        return attr
+
+
+class SyncMoonraker:
+    """A persistent MoonrakerClient and its tools behind blocking methods."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 7125,
+        loop: Optional[EventLoopThread] = None,
+        **client_kwargs: Any,
+    ) -> None:
+        """
+        Initialize the SyncMoonraker.
+
+        Args:
+            host: The hostname or IP address of the Moonraker instance.
+            port: The port number for the Moonraker API.
+            loop: The loop thread running the requests. Defaults to one shared
+                  by every facade in the process.
+            **client_kwargs: Additional arguments for MoonrakerClient.
+        """
+        self.loop = loop or default_loop()
+        self.client = MoonrakerClient(host, port, **client_kwargs)
+        self._tools: Dict[type, SyncTools] = {}
+
+    def tools(self, tools_class: type) -> SyncTools:
+        """
+        Get blocking versions of a tools class bound to this facade's client.
+
+        Args:
+            tools_class: A *Tools class, such as PrinterTools.
+
+        Returns:
+            The SyncTools wrapping the class's instance.
+        """
+        if tools_class not in self._tools:
+            self._tools[tools_class] = SyncTools(tools_class(self.client), self.loop)
+        return self._tools[tools_class]
+
+    def get(self, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Send a GET request and wait for the response.
+
+        Args:
+            endpoint: The API endpoint to request.
+            **kwargs: Additional arguments for MoonrakerClient.get.
+
+        Returns:
+            The JSON response from the API.
+        """
+        return self.loop.run(self.client.get(endpoint, **kwargs))
+
+    def post(self, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Send a POST request and wait for the response.
+
+        Args:
+            endpoint: The API endpoint to request.
+            **kwargs: Additional arguments for MoonrakerClient.post.
+
+        Returns:
+            The JSON response from the API.
+        """
+        return self.loop.run(self.client.post(endpoint, **kwargs))
+
+    def delete(self, endpoint: str, **kwargs: Any) -> Any:
+        """
+        Send a DELETE request and wait for the response.
+
+        Args:
+            endpoint: The API endpoint to request.
+            **kwargs: Additional arguments for MoonrakerClient.delete.
+
+        Returns:
+            The JSON response from the API.
+        """
+        return self.loop.run(self.client.delete(endpoint, **kwargs))
+
+    def close(self) -> None:
+        """Close the client. The loop thread keeps running."""
+        self.loop.run(self.client.close())
+
+    def __enter__(self) -> "SyncMoonraker":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
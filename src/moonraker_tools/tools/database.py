@@ -1,8 +1,47 @@
 """Tools for interacting with the Moonraker database API."""
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import copy
+import json
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union
 
 from ..client import MoonrakerClient
+from ..websocket import NOTIFY_CONNECTED, NOTIFY_DISCONNECTED
+
+_MISSING = object()
+
+
+def _key_parts(key: Union[str, List[str]]) -> List[str]:
+    """
+    Split a key into its parts, as Moonraker resolves it.
+
+    Args:
+        key: A dotted key such as "general.theme", or a list of parts.
+
+    Returns:
+        The list of parts.
+    """
+    return key.split(".") if isinstance(key, str) else list(key)
+
+
+def _lookup(value: Any, key: Union[str, List[str]]) -> Any:
+    """
+    Find the value at a key, as Moonraker resolves it.
+
+    Args:
+        value: The value of a namespace.
+        key: A dotted key such as "general.theme", or a list of parts.
+
+    Returns:
+        The value at the key, or _MISSING if it does not exist.
+    """
+    for part in _key_parts(key):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
 
 
 class DatabaseTools:
@@ -76,3 +115,317 @@ class DatabaseTools:
         """
         params = {"namespace": namespace, "key": key}
         return await self._client.delete("/server/database/item", params=params)
+
+    async def get_namespace(self, namespace: str) -> Dict[str, Any]:
+        """
+        Read every item of a namespace in a single request.
+
+        Args:
+            namespace: The namespace to read.
+
+        Returns:
+            A dictionary of the items in the namespace.
+        """
+        response = await self.get_item(namespace)
+        return response.get("result", {}).get("value") or {}
+
+    async def put_items(
+        self,
+        namespace: str,
+        items: Dict[str, Any],
+        delete: Optional[List[str]] = None,
+        prune: bool = False,
+        max_concurrency: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Apply a batch of writes to a namespace and report what changed.
+
+        The namespace is read once, and only items whose value differs are
+        written, with a bounded number of requests in flight. Deletes are
+        sent once every write has completed.
+
+        Args:
+            namespace: The namespace to update.
+            items: A dictionary of keys, which may be dotted, to their values.
+            delete: Keys to remove from the namespace.
+            prune: Whether to also remove top level keys that no key in items
+                   starts with.
+            max_concurrency: The maximum number of concurrent requests.
+
+        Returns:
+            A dictionary with the "added", "changed", "unchanged" and "removed"
+            lists of keys, and "failed", a dictionary of the keys whose request
+            failed to the error. Failed keys are left out of the lists.
+        """
+        current = await self.get_namespace(namespace)
+        delete = list(delete or [])
+        if prune:
+            kept = {_key_parts(key)[0] for key in items}
+            delete.extend(key for key in current if key not in kept)
+        diff: Dict[str, Any] = {
+            "added": [],
+            "changed": [],
+            "unchanged": [],
+            "removed": [],
+            "failed": {},
+        }
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(request: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await request
+
+        async def apply(requests: List[Tuple[str, str, Awaitable[Any]]]) -> None:
+            results = await asyncio.gather(
+                *(send(request) for _, _, request in requests),
+                return_exceptions=True,
+            )
+            for (outcome, key, _), result in zip(requests, results):
+                if isinstance(result, Exception):
+                    diff["failed"][key] = str(result) or type(result).__name__
+                else:
+                    diff[outcome].append(key)
+
+        writes: List[Tuple[str, str, Awaitable[Any]]] = []
+        for key, value in items.items():
+            existing = _lookup(current, key)
+            if existing is _MISSING:
+                outcome = "added"
+            elif existing != value:
+                outcome = "changed"
+            else:
+                diff["unchanged"].append(key)
+                continue
+            writes.append((outcome, key, self.add_item(namespace, key, value)))
+        await apply(writes)
+        await apply(
+            [
+                ("removed", key, self.delete_item(namespace, key))
+                for key in delete
+                if _lookup(current, key) is not _MISSING
+            ]
+        )
+        return diff
+
+
+async def snapshot_namespace(
+    client: MoonrakerClient, namespace: str, path: str
+) -> Dict[str, Any]:
+    """
+    Save every item of a namespace to a local JSON file.
+
+    This is a function rather than a DatabaseTools method so that it is not
+    published as an MCP tool, which would let clients write files on the host.
+
+    Args:
+        client: An instance of MoonrakerClient.
+        namespace: The namespace to save.
+        path: The path of the file to write.
+
+    Returns:
+        A dictionary with the namespace, the path and the number of items.
+    """
+    value = await DatabaseTools(client).get_namespace(namespace)
+    Path(path).write_text(
+        json.dumps({"namespace": namespace, "value": value}, indent=2)
+    )
+    return {"namespace": namespace, "path": path, "items": len(value)}
+
+
+async def restore_namespace(
+    client: MoonrakerClient,
+    path: str,
+    namespace: Optional[str] = None,
+    prune: bool = False,
+    max_concurrency: int = 8,
+) -> Dict[str, Any]:
+    """
+    Restore a namespace from a file written by snapshot_namespace.
+
+    Args:
+        client: An instance of MoonrakerClient.
+        path: The path of the snapshot file.
+        namespace: The namespace to restore into. Defaults to the namespace
+                   the snapshot was taken from.
+        prune: Whether to delete items that are not in the snapshot.
+        max_concurrency: The maximum number of concurrent requests.
+
+    Returns:
+        The report of DatabaseTools.put_items.
+    """
+    snapshot = json.loads(Path(path).read_text())
+    return await DatabaseTools(client).put_items(
+        namespace or snapshot["namespace"],
+        snapshot["value"],
+        prune=prune,
+        max_concurrency=max_concurrency,
+    )
+
+
+class DatabaseCache:
+    """A local write-through mirror of chosen database namespaces."""
+
+    def __init__(
+        self,
+        client: MoonrakerClient,
+        namespaces: List[str],
+        max_age: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the DatabaseCache.
+
+        Reads of mirrored namespaces are served from memory once loaded, and
+        writes go to Moonraker before the mirror is updated. Pass
+        handle_notification to MoonrakerWebsocket.add_handler to drop a
+        namespace when it changes elsewhere.
+
+        Args:
+            client: An instance of MoonrakerClient.
+            namespaces: The namespaces to mirror.
+            max_age: The number of seconds after which a mirrored namespace is
+                     read again. None keeps it until it is invalidated.
+        """
+        self._database = DatabaseTools(client)
+        self.namespaces = set(namespaces)
+        self.max_age = max_age
+        self._mirror: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._loading: Dict[str, asyncio.Task] = {}
+        # Bumped on every write and invalidation, so a load that raced with
+        # one is not kept.
+        self._generations: Dict[str, int] = {}
+
+    async def get_item(
+        self, namespace: str, key: Optional[Union[str, List[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve an item, from memory if its namespace is mirrored.
+
+        Args:
+            namespace: The namespace of the item to retrieve.
+            key: The key indicating the field or fields within the namespace
+                 to retrieve.
+
+        Returns:
+            A dictionary containing the requested item, as returned by
+            DatabaseTools.get_item.
+        """
+        if namespace not in self.namespaces:
+            return await self._database.get_item(namespace, key)
+        value = await self._load(namespace)
+        if key is not None:
+            value = _lookup(value, key)
+            if value is _MISSING:
+                # Let Moonraker report the missing key.
+                return await self._database.get_item(namespace, key)
+        return {
+            "result": {
+                "namespace": namespace,
+                "key": key,
+                "value": copy.deepcopy(value),
+            }
+        }
+
+    async def add_item(
+        self, namespace: str, key: Union[str, List[str]], value: Any
+    ) -> Dict[str, Any]:
+        """
+        Insert an item into the database and the mirror.
+
+        Args:
+            namespace: The namespace where the value should be inserted.
+            key: The key indicating the field or fields where the value should
+                 be inserted.
+            value: The value to insert in the database.
+
+        Returns:
+            A dictionary containing the inserted item.
+        """
+        response = await self._database.add_item(namespace, key, value)
+        self._bump(namespace)
+        mirrored = self._mirror.get(namespace)
+        if mirrored is not None:
+            *parents, last = _key_parts(key)
+            target = mirrored[0]
+            for part in parents:
+                child = target.get(part)
+                if not isinstance(child, dict):
+                    child = target[part] = {}
+                target = child
+            target[last] = copy.deepcopy(value)
+        return response
+
+    async def delete_item(
+        self, namespace: str, key: Union[str, List[str]]
+    ) -> Dict[str, Any]:
+        """
+        Delete an item from the database and the mirror.
+
+        Args:
+            namespace: The namespace where the item should be removed.
+            key: The key indicating the field or fields where the item should
+                 be removed.
+
+        Returns:
+            A dictionary containing the removed item.
+        """
+        response = await self._database.delete_item(namespace, key)
+        self._bump(namespace)
+        mirrored = self._mirror.get(namespace)
+        if mirrored is not None:
+            *parents, last = _key_parts(key)
+            parent = _lookup(mirrored[0], parents) if parents else mirrored[0]
+            if isinstance(parent, dict):
+                parent.pop(last, None)
+        return response
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        Drop a mirrored namespace, or all of them, so it is read again.
+
+        Args:
+            namespace: The namespace to drop. Drops every namespace if None.
+        """
+        namespaces = self.namespaces if namespace is None else [namespace]
+        for name in namespaces:
+            self._bump(name)
+            self._mirror.pop(name, None)
+
+    def _bump(self, namespace: str) -> None:
+        """Discard the result of any load of a namespace still in flight."""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def handle_notification(self, method: str, params: List[Any]) -> None:
+        """
+        Drop mirrored namespaces changed elsewhere.
+
+        Args:
+            method: The notification method.
+            params: The notification parameters.
+        """
+        if method == "notify_database_changed":
+            item = params[0] if params and isinstance(params[0], dict) else {}
+            self.invalidate(item.get("namespace"))
+        elif method in (NOTIFY_CONNECTED, NOTIFY_DISCONNECTED):
+            # Changes may have been missed while disconnected.
+            self.invalidate()
+
+    async def _load(self, namespace: str) -> Dict[str, Any]:
+        mirrored = self._mirror.get(namespace)
+        if mirrored is not None and (
+            self.max_age is None or time.monotonic() - mirrored[1] < self.max_age
+        ):
+            return mirrored[0]
+        task = self._loading.get(namespace)
+        if task is None:
+            generation = self._generations.get(namespace, 0)
+            task = asyncio.ensure_future(self._fetch(namespace, generation))
+            self._loading[namespace] = task
+            task.add_done_callback(lambda _: self._loading.pop(namespace, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, namespace: str, generation: int) -> Dict[str, Any]:
+        loaded_at = time.monotonic()
+        value = await self._database.get_namespace(namespace)
+        if self._generations.get(namespace, 0) == generation:
+            self._mirror[namespace] = (value, loaded_at)
+        return value
@@ -1,8 +1,9 @@
 """Tools for interacting with the Moonraker file_manager API."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from ..client import MoonrakerClient
+from ..models import FileEntry
 
 
 class FileManagerTools:
@@ -17,19 +18,60 @@ class FileManagerTools:
         """
         self._client = client
 
-    async def list_files(self, root: str = "gcodes") -> List[Dict[str, Any]]:
+    async def list_files(
+        self, root: str = "gcodes", typed: bool = False
+    ) -> Union[List[Dict[str, Any]], List[FileEntry]]:
         """
         List available files in a root.
 
         Args:
             root: The root to list files from.
+            typed: Whether to return the files as FileEntry objects decoded
+                   straight from the response body instead of dictionaries.
 
         Returns:
-            A list of file information dictionaries.
+            A list of file information dictionaries, or the list of FileEntry
+            objects if typed.
         """
         params = {"root": root}
+        if typed:
+            return await self._client.get_model(
+                "/server/files/list", List[FileEntry], params=params
+            )
         return await self._client.get("/server/files/list", params=params)
 
+    async def iter_files(self, root: str = "gcodes") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the files in a root as the listing is downloaded.
+
+        Unlike list_files, the response is never held in memory at once.
+
+        Args:
+            root: The root to list files from.
+
+        Yields:
+            File information dictionaries.
+        """
+        params = {"root": root}
+        async for item in self._client.stream_items(
+            "/server/files/list", params=params
+        ):
+            yield item
+
+    async def get_metadata(self, filename: str) -> Dict[str, Any]:
+        """
+        Get the metadata of a gcode file.
+
+        Args:
+            filename: The path of the file, relative to the gcodes root.
+
+        Returns:
+            A dictionary containing the file's metadata, such as its
+            estimated_time in seconds.
+        """
+        params = {"filename": filename}
+        return await self._client.get("/server/files/metadata", params=params)
+
     async def get_directory_info(
         self, path: str = "gcodes", extended: bool = False
     ) -> Dict[str, Any]:
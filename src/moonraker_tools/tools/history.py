@@ -1,8 +1,9 @@
 """Tools for interacting with the Moonraker history API."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from ..client import MoonrakerClient
+from ..models import HistoryJobList
 
 
 class HistoryTools:
@@ -24,7 +25,8 @@ class HistoryTools:
         since: Optional[float] = None,
         before: Optional[float] = None,
         order: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        typed: bool = False,
+    ) -> Union[Dict[str, Any], HistoryJobList]:
         """
         Get the list of historical jobs.
 
@@ -34,9 +36,12 @@ class HistoryTools:
             since: A timestamp to limit jobs to after this date.
             before: A timestamp to limit jobs to before this date.
             order: The order of the returned list (asc or desc).
+            typed: Whether to return a HistoryJobList decoded straight from
+                   the response body instead of dictionaries.
 
         Returns:
-            A dictionary containing the list of jobs and the total count.
+            A dictionary containing the list of jobs and the total count, or
+            a HistoryJobList if typed.
         """
         params: Dict[str, Any] = {}
         if limit is not None:
@@ -49,8 +54,43 @@ class HistoryTools:
             params["before"] = before
         if order is not None:
             params["order"] = order
+        if typed:
+            return await self._client.get_model(
+                "/server/history/list", HistoryJobList, params=params
+            )
         return await self._client.get("/server/history/list", params=params)
 
+    async def iter_jobs(
+        self,
+        limit: Optional[int] = None,
+        start: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield historical jobs as the listing is downloaded.
+
+        Unlike list_jobs, the response is never held in memory at once.
+
+        Args:
+            limit: The maximum number of jobs to return.
+            start: The starting record number.
+            order: The order of the returned list (asc or desc).
+
+        Yields:
+            Job dictionaries.
+        """
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if start is not None:
+            params["start"] = start
+        if order is not None:
+            params["order"] = order
+        async for job in self._client.stream_items(
+            "/server/history/list", path=("result", "jobs"), params=params
+        ):
+            yield job
+
     async def get_totals(self) -> Dict[str, Any]:
         """
         Get the job totals.
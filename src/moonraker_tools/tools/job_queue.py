@@ -1,6 +1,6 @@
 """Tools for interacting with the Moonraker job_queue API."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..client import MoonrakerClient
 
@@ -92,5 +92,154 @@ class JobQueueTools:
         Returns:
             A dictionary containing the updated job queue status.
         """
-        params = {"job_id": job_id}
-        return await self._client.post("/server/job_queue/jump", params=params)
+        data = {"job_id": job_id}
+        return await self._client.post("/server/job_queue/jump", data=data)
+
+    async def enqueue_jobs(
+        self, filenames: List[str], reset: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Enqueue an ordered batch of jobs in a single request.
+
+        Args:
+            filenames: The filenames to enqueue, in print order.
+            reset: Whether to clear the queue before adding the new jobs.
+
+        Jobs are matched to their files among the queued jobs that were not
+        queued before, since a job that starts right away leaves the queue.
+
+        Returns:
+            A dictionary with the "queue_state", the new "jobs", one
+            dictionary with the filename and job_id per matched file, and the
+            "unmatched" filenames, whose jobs were no longer queued.
+        """
+        before = set()
+        if not reset:
+            status = await self.get_status()
+            queued = status.get("result", {}).get("queued_jobs", [])
+            before = {job.get("job_id") for job in queued}
+        response = await self.enqueue_job(filenames, reset=reset)
+        result = response.get("result", {})
+        added = [
+            job
+            for job in result.get("queued_jobs", [])
+            if job.get("job_id") not in before
+        ]
+        job_ids = _match_jobs(filenames, added)
+        return {
+            "queue_state": result.get("queue_state"),
+            "jobs": [
+                {"filename": filename, "job_id": job_id}
+                for filename, job_id in zip(filenames, job_ids)
+                if job_id is not None
+            ],
+            "unmatched": [
+                filename
+                for filename, job_id in zip(filenames, job_ids)
+                if job_id is None
+            ],
+        }
+
+    async def remove_jobs(self, job_ids: List[str]) -> Dict[str, Any]:
+        """
+        Remove a batch of jobs, skipping those no longer queued.
+
+        Args:
+            job_ids: The IDs of the jobs to remove.
+
+        Returns:
+            A dictionary with the "queue_state", the "removed" job IDs and the
+            "not_found" job IDs.
+        """
+        status = await self.get_status()
+        result = status.get("result", {})
+        queued = {job["job_id"] for job in result.get("queued_jobs", [])}
+        removed = [job_id for job_id in job_ids if job_id in queued]
+        not_found = [job_id for job_id in job_ids if job_id not in queued]
+        queue_state = result.get("queue_state")
+        if removed:
+            response = await self._client.delete(
+                "/server/job_queue/job", params={"job_ids": ",".join(removed)}
+            )
+            queue_state = response.get("result", {}).get("queue_state")
+        return {"queue_state": queue_state, "removed": removed, "not_found": not_found}
+
+    async def reorder_jobs(self, job_ids: List[str]) -> Dict[str, Any]:
+        """
+        Move jobs to the front of the queue in the given order.
+
+        The queue is replaced in a single request, so no job can start in
+        between. Moonraker assigns new job IDs to every queued job.
+
+        Args:
+            job_ids: The IDs of the jobs to move, in their new order. Other jobs
+                     keep their relative order behind them.
+
+        Returns:
+            A dictionary with the "queue_state", "job_ids", mapping each old
+            job ID to its new one, and the "unmatched" old job IDs, whose jobs
+            started as soon as the queue was replaced.
+        """
+        status = await self.get_status()
+        queued = status.get("result", {}).get("queued_jobs", [])
+        by_id = {job["job_id"]: job for job in queued}
+        missing = [job_id for job_id in job_ids if job_id not in by_id]
+        if missing:
+            raise ValueError(f"Jobs not in the queue: {', '.join(missing)}")
+        moved = dict.fromkeys(job_ids)
+        order = [by_id[job_id] for job_id in moved]
+        order += [job for job in queued if job["job_id"] not in moved]
+        response = await self.enqueue_job(
+            [job["filename"] for job in order], reset=True
+        )
+        result = response.get("result", {})
+        new_ids = _match_jobs(
+            [job["filename"] for job in order], result.get("queued_jobs", [])
+        )
+        return {
+            "queue_state": result.get("queue_state"),
+            "job_ids": {
+                old["job_id"]: new_id
+                for old, new_id in zip(order, new_ids)
+                if new_id is not None
+            },
+            "unmatched": [
+                old["job_id"] for old, new_id in zip(order, new_ids) if new_id is None
+            ],
+        }
+
+
+def _match_jobs(
+    filenames: List[str], added: List[Dict[str, Any]]
+) -> List[Optional[str]]:
+    """
+    Match enqueued files to the new queued jobs, in the same order.
+
+    The files are matched from the end, since the jobs missing from the queue
+    are the ones that started first. Jobs added by others are skipped.
+
+    Args:
+        filenames: The enqueued filenames, in order.
+        added: The queued jobs that were not queued before, in order.
+
+    Returns:
+        The job ID of each file, or None if its job is no longer queued.
+    """
+    job_ids: List[Optional[str]] = []
+    remaining = list(added)
+    for filename in reversed(filenames):
+        index = next(
+            (
+                i
+                for i in range(len(remaining) - 1, -1, -1)
+                if remaining[i].get("filename") == filename
+            ),
+            None,
+        )
+        if index is None:
+            job_ids.append(None)
+            continue
+        job_ids.append(remaining[index].get("job_id"))
+        del remaining[index:]
+    job_ids.reverse()
+    return job_ids
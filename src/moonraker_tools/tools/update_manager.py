@@ -1,6 +1,8 @@
 """Tools for interacting with the Moonraker update_manager API."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from ..client import MoonrakerClient
 
@@ -16,30 +18,31 @@ class UpdateManagerTools:
             client: An instance of MoonrakerClient.
         """
         self._client = client
+        self._cache = UpdateStatusCache(client)
 
     async def get_status(self) -> Dict[str, Any]:
         """
-        Get the update status.
+        Get the update status, from memory if it was fetched within a minute.
 
         Returns:
             A dictionary containing the update status.
         """
-        return await self._client.get("/machine/update/status")
+        return await self._cache.get_status()
 
-    async def refresh(self, name: Optional[str] = None) -> Dict[str, Any]:
+    async def refresh(
+        self, name: Optional[str] = None, force: bool = False
+    ) -> Dict[str, Any]:
         """
-        Refresh the update status.
+        Refresh the update status unless it was refreshed within the hour.
 
         Args:
             name: The name of the software to refresh.
+            force: Whether to refresh even if it was refreshed recently.
 
         Returns:
             A dictionary containing the updated status.
         """
-        data = {}
-        if name is not None:
-            data["name"] = name
-        return await self._client.post("/machine/update/refresh", data=data)
+        return await self._cache.refresh(name, force=force)
 
     async def upgrade(self, name: Optional[str] = None) -> str:
         """
@@ -54,7 +57,10 @@ class UpdateManagerTools:
         data = {}
         if name is not None:
             data["name"] = name
-        return await self._client.post("/machine/update/upgrade", data=data)
+        try:
+            return await self._client.post("/machine/update/upgrade", data=data)
+        finally:
+            self._cache.invalidate()
 
     async def recover(self, name: str, hard: bool = False) -> str:
         """
@@ -68,7 +74,10 @@ class UpdateManagerTools:
             A string confirming the action.
         """
         data = {"name": name, "hard": hard}
-        return await self._client.post("/machine/update/recover", data=data)
+        try:
+            return await self._client.post("/machine/update/recover", data=data)
+        finally:
+            self._cache.invalidate()
 
     async def rollback(self, name: str) -> str:
         """
@@ -81,4 +90,147 @@ class UpdateManagerTools:
             A string confirming the action.
         """
         data = {"name": name}
-        return await self._client.post("/machine/update/rollback", data=data)
+        try:
+            return await self._client.post("/machine/update/rollback", data=data)
+        finally:
+            self._cache.invalidate()
+
+
+class UpdateStatusCache:
+    """Serve update status from memory and skip refreshes that are too recent."""
+
+    def __init__(
+        self,
+        client: MoonrakerClient,
+        refresh_window: float = 3600.0,
+        status_max_age: float = 60.0,
+    ) -> None:
+        """
+        Initialize the UpdateStatusCache.
+
+        Args:
+            client: An instance of MoonrakerClient.
+            refresh_window: The number of seconds after a refresh during which
+                            the same component is not refreshed again.
+            status_max_age: The number of seconds a fetched status is served
+                            from memory.
+        """
+        self._client = client
+        self.refresh_window = refresh_window
+        self.status_max_age = status_max_age
+        self._status: Optional[Dict[str, Any]] = None
+        self._status_at = 0.0
+        # Monotonic times of the last refresh of each component.
+        self._refreshed: Dict[str, float] = {}
+        self._in_flight: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+        # Bumped by invalidate, so that requests already in flight do not
+        # store a status from before an upgrade.
+        self._generation = 0
+
+    @property
+    def last_refresh(self) -> Dict[str, float]:
+        """The Unix time of the last refresh of each component."""
+        offset = time.time() - time.monotonic()
+        return {name: at + offset for name, at in self._refreshed.items()}
+
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get the update status, from memory if it is recent enough.
+
+        Returns:
+            A dictionary containing the update status.
+        """
+        if (
+            self._status is not None
+            and time.monotonic() - self._status_at < self.status_max_age
+        ):
+            return self._status
+        return await self._coalesce(
+            ("status", None), lambda: self._fetch_status(self._generation)
+        )
+
+    async def refresh(
+        self, name: Optional[str] = None, force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Refresh the update status unless it was refreshed within the window.
+
+        Concurrent refreshes of the same component share one request, and a
+        component refresh waits for a refresh of everything in flight.
+
+        Args:
+            name: The name of the software to refresh. Refreshes everything
+                  if None.
+            force: Whether to refresh even within the window.
+
+        Returns:
+            A dictionary containing the update status.
+        """
+        everything = self._in_flight.get(("refresh", None))
+        if name is not None and everything is not None:
+            return await asyncio.shield(everything)
+        if not force and self._status is not None and self._is_fresh(name):
+            return self._status
+        return await self._coalesce(
+            ("refresh", name), lambda: self._refresh(name, self._generation)
+        )
+
+    def invalidate(self) -> None:
+        """Forget the status and refresh times, after the software changed."""
+        self._generation += 1
+        self._status = None
+        self._refreshed.clear()
+        self._in_flight.clear()
+
+    def _is_fresh(self, name: Optional[str]) -> bool:
+        if name is None:
+            names = list(self._status.get("result", {}).get("version_info", {}))
+        else:
+            names = [name]
+        now = time.monotonic()
+        return bool(names) and all(
+            component in self._refreshed
+            and now - self._refreshed[component] < self.refresh_window
+            for component in names
+        )
+
+    async def _coalesce(
+        self,
+        key: Tuple[str, Optional[str]],
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Tuple[str, Optional[str]], future: asyncio.Future) -> None:
+        # A request from before invalidate must not drop its replacement.
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+    async def _fetch_status(self, generation: int) -> Dict[str, Any]:
+        status = await self._client.get("/machine/update/status")
+        if generation == self._generation:
+            self._store(status)
+        return status
+
+    async def _refresh(self, name: Optional[str], generation: int) -> Dict[str, Any]:
+        data = {}
+        if name is not None:
+            data["name"] = name
+        status = await self._client.post("/machine/update/refresh", data=data)
+        if generation != self._generation:
+            return status
+        self._store(status)
+        now = time.monotonic()
+        names = status.get("result", {}).get("version_info", {})
+        for component in [name] if name is not None else names:
+            self._refreshed[component] = now
+        return status
+
+    def _store(self, status: Dict[str, Any]) -> None:
+        self._status = status
+        self._status_at = time.monotonic()
@@ -0,0 +1,261 @@
+"""Spans tracing MCP tool calls down to the HTTP requests they send."""
+
+import contextvars
+import functools
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+logger = logging.getLogger(__name__)
+
+TOOL = "tool"
+AGENT = "agent"
+HTTP = "http"
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass
+class Span:
+    """A timed operation, nested under the span that was current when it began."""
+
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """The duration in seconds, or 0.0 while the span is running."""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class SpanHook:
+    """Receives spans as they start and end. Subclasses override either."""
+
+    def on_start(self, span: Span) -> None:
+        """
+        Handle a span that has just started.
+
+        Args:
+            span: The span, without its end time.
+        """
+
+    def on_end(self, span: Span) -> None:
+        """
+        Handle a span that has just ended.
+
+        Args:
+            span: The finished span.
+        """
+
+
+class InMemoryExporter(SpanHook):
+    """Keep finished spans in a list, for tests and profiling sessions."""
+
+    def __init__(self) -> None:
+        """Initialize the InMemoryExporter."""
+        self.spans: List[Span] = []
+
+    def on_end(self, span: Span) -> None:
+        """
+        Store a finished span.
+
+        Args:
+            span: The finished span.
+        """
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        """Drop the stored spans."""
+        self.spans.clear()
+
+
+class OpenTelemetryHook(SpanHook):
+    """Mirror spans into OpenTelemetry, keeping their nesting."""
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        """
+        Initialize the OpenTelemetryHook.
+
+        Args:
+            tracer_provider: The OpenTelemetry TracerProvider to use. Defaults
+                             to the global one.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetry export requires the 'opentelemetry-api' package. "
+                "Install it with `pip install opentelemetry-api`."
+            ) from None
+        self._trace = trace
+        self._tracer = trace.get_tracer(
+            "moonraker_tools", tracer_provider=tracer_provider
+        )
+        self._spans: Dict[str, Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        """
+        Start the matching OpenTelemetry span.
+
+        Args:
+            span: The span, without its end time.
+        """
+        parent = self._spans.get(span.parent_id) if span.parent_id else None
+        context = None
+        if parent is not None:
+            context = self._trace.set_span_in_context(parent)
+        kinds = self._trace.SpanKind
+        self._spans[span.span_id] = self._tracer.start_span(
+            span.name,
+            context=context,
+            kind=kinds.CLIENT if span.kind == HTTP else kinds.INTERNAL,
+            start_time=span.start_ns,
+        )
+
+    def on_end(self, span: Span) -> None:
+        """
+        End the matching OpenTelemetry span with the span's attributes.
+
+        Args:
+            span: The finished span.
+        """
+        otel_span = self._spans.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        otel_span.set_attribute("moonraker.kind", span.kind)
+        for key, value in span.attributes.items():
+            if value is not None:
+                otel_span.set_attribute(key, value)
+        if span.error is not None:
+            otel_span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, span.error)
+            )
+        otel_span.end(end_time=span.end_ns)
+
+
+_hooks: List[SpanHook] = []
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "moonraker_span", default=None
+)
+
+
+def add_hook(hook: SpanHook) -> None:
+    """
+    Start sending spans to a hook. Spans are only recorded while one is set.
+
+    Args:
+        hook: The hook, such as an InMemoryExporter.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: SpanHook) -> None:
+    """
+    Stop sending spans to a hook.
+
+    Args:
+        hook: A hook previously added.
+    """
+    _hooks.remove(hook)
+
+
+def current_span() -> Optional[Span]:
+    """
+    Get the span of the operation in progress.
+
+    Returns:
+        The innermost running span, or None.
+    """
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, kind: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Trace the enclosed block as a span.
+
+    Args:
+        name: The name of the span.
+        kind: "tool", "agent" or "http".
+        **attributes: Attributes of the span, such as the printer.
+
+    Yields:
+        The span, so attributes can be added, or None if tracing is off.
+    """
+    if not _hooks:
+        yield None
+        return
+    parent = _current.get()
+    new = Span(
+        name=name,
+        kind=kind,
+        trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+        span_id=f"{random.getrandbits(64):016x}",
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes=attributes,
+    )
+    _notify("on_start", new)
+    token = _current.set(new)
+    try:
+        yield new
+    except BaseException as exc:
+        new.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current.reset(token)
+        new.end_ns = time.time_ns()
+        _notify("on_end", new)
+
+
+def traced(function: F) -> F:
+    """
+    Trace every call of an agent function as an "agent" span.
+
+    Args:
+        function: The async function to trace.
+
+    Returns:
+        The wrapped function, with the same signature.
+    """
+    name = f"agent {function.__name__}"
+
+    @functools.wraps(function)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _hooks:
+            return await function(*args, **kwargs)
+        with span(name, AGENT, function=function.__qualname__):
+            return await function(*args, **kwargs)
+
+    return cast(F, wrapper)
+
+
+def _notify(event: str, record: Span) -> None:
+    """Call a hook method on every hook, logging their failures."""
+    for hook in list(_hooks):
+        try:
+            getattr(hook, event)(record)
+        except Exception:
+            logger.exception("Tracing hook %r failed.", hook)
@@ -0,0 +1,141 @@
+"""Connection settings for the HTTP client used by MoonrakerClient."""
+
+import importlib.util
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import httpx
+
+# Endpoints that routinely take longer than a status request, by path prefix.
+SLOW_ENDPOINTS: Dict[str, float] = {
+    "/server/files/upload": 300.0,
+    "/server/files/gcodes/": 300.0,
+    "/machine/update/upgrade": 600.0,
+    "/machine/update/refresh": 120.0,
+    "/printer/gcode/script": 120.0,
+}
+
+
+def accept_encoding() -> str:
+    """
+    Get the content codings httpx can decode in this environment.
+
+    Brotli is only offered when the brotli or brotlicffi package is installed.
+
+    Returns:
+        The value of the Accept-Encoding header.
+    """
+    codings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")):
+        codings.insert(0, "br")
+    return ", ".join(codings)
+
+
+@dataclass
+class TransportConfig:
+    """Timeouts, connection limits and protocol options for a client."""
+
+    timeout: float = 10.0
+    connect_timeout: Optional[float] = 5.0
+    endpoint_timeouts: Dict[str, float] = field(
+        default_factory=lambda: dict(SLOW_ENDPOINTS)
+    )
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 5.0
+    http2: bool = False
+    compression: bool = True
+    proxy: Optional[str] = None
+    transport: Optional[httpx.AsyncBaseTransport] = None
+
+    def timeout_for(self, endpoint: str) -> Optional[float]:
+        """
+        Get the timeout configured for an endpoint.
+
+        Args:
+            endpoint: The API endpoint.
+
+        Returns:
+            The timeout in seconds of the longest matching prefix in
+            endpoint_timeouts, or None to use the default timeout.
+        """
+        matches = [
+            prefix for prefix in self.endpoint_timeouts if endpoint.startswith(prefix)
+        ]
+        if not matches:
+            return None
+        return self.endpoint_timeouts[max(matches, key=len)]
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for httpx.AsyncClient.
+
+        Returns:
+            A dictionary of keyword arguments.
+        """
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 requires the 'h2' package. "
+                "Install it with `pip install httpx[http2]`."
+            )
+        kwargs: Dict[str, Any] = {
+            "timeout": httpx.Timeout(self.timeout, connect=self.connect_timeout),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+            "headers": {
+                "Accept-Encoding": accept_encoding() if self.compression else "identity"
+            },
+        }
+        if self.proxy is not None:
+            kwargs["proxy"] = self.proxy
+        if self.transport is not None:
+            kwargs["transport"] = self.transport
+        return kwargs
+
+
+class PayloadStats:
+    """The bytes received per endpoint, on the wire and once decompressed."""
+
+    def __init__(self) -> None:
+        """Initialize empty PayloadStats."""
+        self._endpoints: Dict[str, Dict[str, int]] = {}
+
+    def record(self, endpoint: str, wire_bytes: int, decoded_bytes: int) -> None:
+        """
+        Count a response.
+
+        Args:
+            endpoint: The API endpoint.
+            wire_bytes: The size of the body as received.
+            decoded_bytes: The size of the body after decompression.
+        """
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = {
+                "responses": 0,
+                "wire_bytes": 0,
+                "decoded_bytes": 0,
+            }
+        stats["responses"] += 1
+        stats["wire_bytes"] += wire_bytes
+        stats["decoded_bytes"] += decoded_bytes
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Report the bytes received per endpoint.
+
+        Returns:
+            A dictionary of endpoints to the number of "responses", their
+            "wire_bytes" and "decoded_bytes", and the compression "ratio" of
+            wire to decoded bytes.
+        """
+        report: Dict[str, Dict[str, float]] = {}
+        for endpoint, stats in self._endpoints.items():
+            decoded = stats["decoded_bytes"]
+            ratio = stats["wire_bytes"] / decoded if decoded else 1.0
+            report[endpoint] = {**stats, "ratio": ratio}
+        return report
@@ -0,0 +1,214 @@
+"""A client for the Moonraker websocket API."""
+
+import asyncio
+import inspect
+import itertools
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from .auth import OneshotTokenPool
+
+logger = logging.getLogger(__name__)
+
+# Dispatched locally after every (re)connect and disconnect. Notifications
+# may have been missed while the connection was down.
+NOTIFY_CONNECTED = "notify_websocket_connected"
+NOTIFY_DISCONNECTED = "notify_websocket_disconnected"
+
+NotificationHandler = Callable[[str, List[Any]], Union[None, Awaitable[None]]]
+
+
+class MoonrakerWebsocket:
+    """A JSON-RPC connection to Moonraker that dispatches notifications."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 7125,
+        api_key: Optional[str] = None,
+        reconnect_delay: float = 5.0,
+        max_reconnect_delay: float = 60.0,
+        token_pool: Optional["OneshotTokenPool"] = None,
+    ) -> None:
+        """
+        Initialize the MoonrakerWebsocket.
+
+        Args:
+            host: The hostname or IP address of the Moonraker instance.
+            port: The port number for the Moonraker API.
+            api_key: The API key for authentication, if required.
+            reconnect_delay: The number of seconds to wait before reconnecting,
+                             doubled after every failed connect.
+            max_reconnect_delay: The maximum number of seconds to wait before
+                                 reconnecting.
+            token_pool: A pool of oneshot tokens used to authorize each
+                        connect, for instances that require a login.
+        """
+        self.url = f"ws://{host}:{port}/websocket"
+        self.api_key = api_key
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.token_pool = token_pool
+        self._handlers: List[NotificationHandler] = []
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._connection: Any = None
+        self._notifications: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def connected(self) -> bool:
+        """Whether the websocket is currently connected."""
+        return self._connection is not None
+
+    def add_handler(self, handler: NotificationHandler) -> None:
+        """
+        Register a handler called with the method and params of notifications.
+
+        Handlers run in order on a single task, so they may await calls on
+        this websocket without blocking the connection.
+
+        Args:
+            handler: A function or coroutine function.
+        """
+        self._handlers.append(handler)
+
+    def remove_handler(self, handler: NotificationHandler) -> None:
+        """
+        Remove a previously registered handler.
+
+        Args:
+            handler: The handler to remove.
+        """
+        self._handlers.remove(handler)
+
+    async def start(self) -> None:
+        """Start connecting in the background."""
+        if self._tasks:
+            return
+        self._notifications = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._run()),
+            asyncio.create_task(self._dispatch()),
+        ]
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Call a JSON-RPC method.
+
+        Args:
+            method: The name of the method.
+            params: Optional parameters for the method.
+
+        Returns:
+            The result of the call.
+        """
+        if self._connection is None:
+            raise ConnectionError("The Moonraker websocket is not connected.")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": request_id}
+        if params is not None:
+            message["params"] = params
+        try:
+            await self._connection.send(json.dumps(message))
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        """Close the connection and stop reconnecting."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _connect(self) -> Any:
+        try:
+            import websockets
+        except ImportError as exc:
+            raise ImportError(
+                "The websocket feed requires the 'websockets' package. "
+                "Install it with `pip install moonraker_tools[websocket]`."
+            ) from exc
+        url = self.url
+        if self.token_pool is not None:
+            url = await self.token_pool.authorize_url(url)
+        return await websockets.connect(url, max_size=None)
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                connection = await self._connect()
+            except ImportError:
+                logger.exception("Cannot open the Moonraker websocket.")
+                return
+            except Exception as exc:
+                # Refused connections, rejected handshakes and failed token
+                # requests are all retried; only the delay grows.
+                logger.warning("Websocket connect to %s failed: %s", self.url, exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            delay = self.reconnect_delay
+            self._connection = connection
+            self._notifications.put_nowait((NOTIFY_CONNECTED, []))
+            try:
+                async for message in connection:
+                    self._handle_message(message)
+            except Exception as exc:
+                logger.warning("Websocket to %s closed: %s", self.url, exc)
+            finally:
+                self._connection = None
+                self._notifications.put_nowait((NOTIFY_DISCONNECTED, []))
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(
+                            ConnectionError("The Moonraker websocket was closed.")
+                        )
+                await connection.close()
+            await asyncio.sleep(delay)
+
+    def _handle_message(self, message: Union[str, bytes]) -> None:
+        data = json.loads(message)
+        if "id" in data:
+            future = self._pending.get(data["id"])
+            if future is None or future.done():
+                return
+            if "error" in data:
+                error = data["error"]
+                future.set_exception(RuntimeError(error.get("message", str(error))))
+            else:
+                future.set_result(data.get("result"))
+        elif "method" in data:
+            self._notifications.put_nowait((data["method"], data.get("params", [])))
+
+    async def _dispatch(self) -> None:
+        while True:
+            method, params = await self._notifications.get()
+            if method == NOTIFY_CONNECTED and self.api_key:
+                try:
+                    await self.call(
+                        "server.connection.identify",
+                        {
+                            "client_name": "moonraker-tools",
+                            "version": "0.1.0",
+                            "type": "agent",
+                            "url": "https://github.com/shifusen329/moonraker-tools",
+                            "api_key": self.api_key,
+                        },
+                    )
+                except Exception:
+                    logger.exception("Failed to identify the websocket connection.")
+            for handler in list(self._handlers):
+                try:
+                    result = handler(method, params)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception("Websocket notification handler failed.")
@@ -0,0 +1,115 @@
+"""Tests for the context shared by the agent tools."""
+
+import asyncio
+from pathlib import Path
+from typing import Generator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from moonraker_tools.agent.context import AgentContext, get_context, set_context
+from moonraker_tools.agent.job_queue import enqueue_jobs
+from moonraker_tools.agent.printer_status import get_printer_status
+from moonraker_tools.agent.webcam import download_snapshot
+from moonraker_tools.tools.printer import PrinterTools
+
+
+@pytest.fixture
+def mock_client() -> Generator[AsyncMock, None, None]:
+    """Fixture for a mocked MoonrakerClient."""
+    with patch("moonraker_tools.client.MoonrakerClient", autospec=True) as mock:
+        yield mock
+
+
+@pytest.fixture
+def context(mock_client: AsyncMock) -> Generator[AgentContext, None, None]:
+    """Fixture installing a context around the mocked client."""
+    context = AgentContext(mock_client)
+    set_context(context)
+    yield context
+    set_context(None)
+
+
+@pytest.mark.asyncio
+async def test_agent_functions_use_the_context(
+    context: AgentContext, mock_client: AsyncMock
+) -> None:
+    """Test that agent functions call the context's cached tools."""
+    # Arrange
+    mock_client.get.return_value = {"result": {"state": "ready"}}
+    mock_client.post.return_value = {"result": {"queue_state": "ready"}}
+
+    # Act
+    status = await get_printer_status()
+    await get_printer_status()
+    await enqueue_jobs(["a.gcode"], reset=True)
+
+    # Assert
+    assert status == {"result": {"state": "ready"}}
+    assert mock_client.get.await_count == 2
+    assert context.tools(PrinterTools) is context.tools(PrinterTools)
+    mock_client.close.assert_not_called()
+
+
+def test_from_env_requires_host_and_port(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing host is reported when the context is created."""
+    # Arrange
+    monkeypatch.delenv("MOONRAKER_HOST", raising=False)
+    monkeypatch.setenv("MOONRAKER_PORT", "7125")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="MOONRAKER_HOST"):
+        AgentContext.from_env()
+
+
+def test_env_context_is_created_once_per_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the environment is read once for every event loop."""
+    # Arrange
+    monkeypatch.setenv("MOONRAKER_HOST", "printer")
+    monkeypatch.setenv("MOONRAKER_PORT", "7125")
+
+    async def two_lookups() -> AgentContext:
+        first = get_context()
+        assert get_context() is first
+        await first.close()
+        return first
+
+    # Act
+    first = asyncio.run(two_lookups())
+    second = asyncio.run(two_lookups())
+
+    # Assert
+    assert first is not second
+    assert first.client.base_url == "http://printer:7125"
+
+
+@pytest.mark.asyncio
+async def test_snapshots_share_one_client(
+    context: AgentContext, mock_client: AsyncMock, tmp_path: Path
+) -> None:
+    """Test that snapshots reuse one HTTP client, closed with the context."""
+    # Arrange
+    mock_client.base_url = "http://printer:7125"
+    mock_client.get.return_value = {
+        "result": {"webcams": [{"name": "cam", "snapshot_url": "/snapshot"}]}
+    }
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, content=b"jpeg")
+
+    snapshot_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    context._snapshot_client = snapshot_client
+    output = tmp_path / "snapshot.jpg"
+
+    # Act
+    await download_snapshot(output_path=str(output))
+    await download_snapshot("cam", output_path=str(output))
+    await context.close()
+
+    # Assert
+    assert requests == ["http://printer:7125/snapshot"] * 2
+    assert output.read_bytes() == b"jpeg"
+    assert snapshot_client.is_closed
+    assert context._snapshot_client is None
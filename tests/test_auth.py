@@ -0,0 +1,214 @@
+"""Tests for the authentication helpers."""
+
+import asyncio
+import base64
+import json
+import time
+from typing import Generator, List
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from moonraker_tools.auth import OneshotTokenPool, TokenManager, jwt_expiry
+from moonraker_tools.client import MoonrakerClient
+
+
+def make_jwt(lifetime: float, skew: float = 0.0) -> str:
+    """Build an unsigned JWT from a printer whose clock is off by skew seconds."""
+    issued = time.time() + skew
+    claims = {"iat": issued, "exp": issued + lifetime}
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    return f"header.{payload.rstrip('=')}.signature"
+
+
+@pytest.fixture
+def mock_client() -> Generator[AsyncMock, None, None]:
+    """Fixture for a mocked MoonrakerClient."""
+    with patch("moonraker_tools.client.MoonrakerClient", autospec=True) as mock:
+        yield mock
+
+
+def test_jwt_expiry() -> None:
+    """Test reading the expiry of a token."""
+    assert jwt_expiry(make_jwt(100)) == pytest.approx(time.time() + 100, abs=5)
+    assert jwt_expiry("not-a-token") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_login(mock_client: AsyncMock) -> None:
+    """Test that concurrent callers trigger a single login."""
+    # Arrange
+    token = make_jwt(3600)
+    mock_client.post.return_value = {
+        "result": {"token": token, "refresh_token": "refresh"}
+    }
+    manager = TokenManager(mock_client, "user", "secret")
+
+    # Act
+    tokens = await asyncio.gather(*(manager.ensure_token() for _ in range(10)))
+
+    # Assert
+    assert tokens == [token] * 10
+    mock_client.post.assert_called_once_with(
+        "/access/login", data={"username": "user", "password": "secret"}
+    )
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_token_is_refreshed_before_expiry(mock_client: AsyncMock) -> None:
+    """Test the background refresh ahead of expiry."""
+    # Arrange
+    first, second = make_jwt(3600), make_jwt(7200)
+    mock_client.post.side_effect = [
+        {"result": {"token": first, "refresh_token": "refresh"}},
+        {"result": {"token": second}},
+    ]
+    manager = TokenManager(
+        mock_client, "user", "secret", refresh_margin=3600, retry_delay=0
+    )
+
+    # Act
+    await manager.ensure_token()
+    await asyncio.sleep(0.01)
+
+    # Assert
+    mock_client.post.assert_called_with(
+        "/access/refresh_jwt", data={"refresh_token": "refresh"}
+    )
+    assert manager.token == second
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_token_lifetime_ignores_clock_skew(mock_client: AsyncMock) -> None:
+    """Test that a token from a printer with a skewed clock stays usable."""
+    # Arrange
+    token = make_jwt(3600, skew=-7200)
+    mock_client.post.return_value = {
+        "result": {"token": token, "refresh_token": "refresh"}
+    }
+    manager = TokenManager(mock_client, "user", "secret")
+
+    # Act
+    await manager.ensure_token()
+    await asyncio.sleep(0.05)
+
+    # Assert
+    assert manager.token == token
+    mock_client.post.assert_called_once()
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_client_sends_bearer_token() -> None:
+    """Test that the client attaches the managed token."""
+    # Arrange
+    manager = AsyncMock(spec=TokenManager)
+    manager.token = "abc"
+    manager.ensure_token.return_value = "abc"
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"result": "ok"})
+
+    client = MoonrakerClient("printer", token_manager=manager)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    # Act
+    result = await client.get("/printer/info")
+
+    # Assert
+    assert result == {"result": "ok"}
+    assert seen == ["Bearer abc"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_resends_after_rejected_token() -> None:
+    """Test that a 401 drops the token and the request is sent once more."""
+    # Arrange
+    manager = AsyncMock(spec=TokenManager)
+    manager.token = "old"
+    manager.ensure_token.side_effect = ["old", "new"]
+    manager.invalidate.side_effect = lambda token: setattr(manager, "token", "new")
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer old":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"result": "ok"})
+
+    client = MoonrakerClient("printer", token_manager=manager)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    # Act
+    result = await client.get("/printer/info")
+
+    # Assert
+    assert result == {"result": "ok"}
+    assert seen == ["Bearer old", "Bearer new"]
+    manager.invalidate.assert_called_once_with("old")
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_oneshot_pool_serves_prefetched_tokens(mock_client: AsyncMock) -> None:
+    """Test that acquires are served from tokens fetched in the background."""
+    # Arrange
+    mock_client.get.side_effect = [{"result": f"token-{i}"} for i in range(10)]
+    pool = OneshotTokenPool(mock_client, size=2)
+    await pool.start()
+    await asyncio.sleep(0.01)
+    fetched = mock_client.get.call_count
+
+    # Act
+    url = await pool.authorize_url("ws://printer:7125/websocket")
+
+    # Assert
+    assert fetched == 2
+    assert url == "ws://printer:7125/websocket?token=token-0"
+    mock_client.get.assert_called_with("/access/oneshot_token")
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_oneshot_pool_discards_expiring_tokens(mock_client: AsyncMock) -> None:
+    """Test that tokens close to expiry are never handed out."""
+    # Arrange
+    mock_client.get.side_effect = [{"result": "stale"}, {"result": "fresh"}]
+    pool = OneshotTokenPool(mock_client, size=1, ttl=0.02, safety_margin=0.01)
+    await pool.start()
+    await asyncio.sleep(0.005)
+    await pool.close()
+    pool._tokens.append(("stale", 0.0))
+
+    # Act
+    token = await pool.acquire()
+
+    # Assert
+    assert token == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_oneshot_pool_stops_refilling_when_idle(mock_client: AsyncMock) -> None:
+    """Test that an idle pool stops polling the printer."""
+    # Arrange
+    mock_client.get.side_effect = [{"result": f"token-{i}"} for i in range(100)]
+    pool = OneshotTokenPool(
+        mock_client, size=1, ttl=0.02, safety_margin=0.01, idle_timeout=0.0
+    )
+
+    # Act
+    await pool.start()
+    await asyncio.sleep(0.05)
+
+    # Assert
+    mock_client.get.assert_not_called()
+    await pool.close()
@@ -0,0 +1,115 @@
+"""Tests for the circuit breaker."""
+
+from typing import List
+
+import httpx
+import pytest
+from moonraker_tools.circuit_breaker import CircuitBreaker, CircuitOpenError
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.tools.printer import PrinterTools
+
+
+def make_client(handler, breaker: CircuitBreaker) -> MoonrakerClient:
+    """Build a client without retries that sends its requests to a handler."""
+    client = MoonrakerClient("printer", retry_policy=None, circuit_breaker=breaker)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast() -> None:
+    """Test that a host is not contacted while its circuit is open."""
+    # Arrange
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        raise httpx.ConnectError("unreachable", request=request)
+
+    client = make_client(handler, CircuitBreaker(failure_threshold=2))
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await client.get("/printer/info")
+
+    # Act
+    with pytest.raises(CircuitOpenError):
+        await client.get("/printer/info")
+
+    # Assert
+    assert len(seen) == 2
+    assert client.health()["state"] == "open"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_circuit() -> None:
+    """Test that a successful probe closes the circuit."""
+    # Arrange
+    up = False
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if not up:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"result": "ok"})
+
+    client = make_client(handler, CircuitBreaker(failure_threshold=1, reset_timeout=0))
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("/printer/info")
+    up = True
+
+    # Act
+    result = await client.get("/printer/info")
+
+    # Assert
+    assert result == {"result": "ok"}
+    assert seen == ["/printer/info", "/server/info", "/printer/info"]
+    assert client.health()["state"] == "closed"
+    await client.close()
+
+
+def test_client_errors_do_not_count() -> None:
+    """Test that 4xx responses leave the circuit closed."""
+    # Arrange
+    breaker = CircuitBreaker(failure_threshold=1)
+    request = httpx.Request("GET", "http://printer/server/files/metadata")
+    error = httpx.HTTPStatusError(
+        "not found", request=request, response=httpx.Response(404, request=request)
+    )
+
+    # Act
+    breaker.record("http://printer", error)
+
+    # Assert
+    assert breaker.health("http://printer")["http://printer"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_urgent_commands_bypass_open_circuit() -> None:
+    """Test that an emergency stop is sent to a host whose circuit is open."""
+    # Arrange
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path == "/printer/emergency_stop":
+            return httpx.Response(200, json={"result": "ok"})
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = make_client(handler, CircuitBreaker(failure_threshold=3))
+    for _ in range(3):
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get("/server/files/list")
+    assert client.health()["state"] == "open"
+
+    # Act
+    result = await PrinterTools(client).emergency_stop()
+
+    # Assert
+    assert result == {"result": "ok"}
+    assert seen[-1] == "/printer/emergency_stop"
+    assert client.health()["state"] == "closed"
+    await client.close()
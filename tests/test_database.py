@@ -1,11 +1,17 @@
 """Tests for the database tools."""
 
+import asyncio
 from typing import Any, Dict, Generator, List
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from moonraker_tools.client import MoonrakerClient
-from moonraker_tools.tools.database import DatabaseTools
+from moonraker_tools.tools.database import (
+    DatabaseCache,
+    DatabaseTools,
+    restore_namespace,
+    snapshot_namespace,
+)
 
 
 @pytest.fixture
@@ -38,3 +44,175 @@ async def test_list_namespaces(
     # Assert
     mock_client.get.assert_called_once_with("/server/database/list")
     assert result == mock_response
+
+
+@pytest.mark.asyncio
+async def test_put_items_writes_only_changes(
+    database_tools: DatabaseTools, mock_client: AsyncMock
+) -> None:
+    """Test that a batch reads the namespace once and reports a diff."""
+    # Arrange
+    mock_client.get.return_value = {
+        "result": {
+            "namespace": "fleet",
+            "key": None,
+            "value": {"theme": "dark", "general": {"units": "mm"}, "old": 1},
+        }
+    }
+
+    # Act
+    diff = await database_tools.put_items(
+        "fleet",
+        {"theme": "dark", "general.units": "in", "nozzle": 0.4},
+        delete=["old", "absent"],
+    )
+
+    # Assert
+    assert diff == {
+        "added": ["nozzle"],
+        "changed": ["general.units"],
+        "unchanged": ["theme"],
+        "removed": ["old"],
+        "failed": {},
+    }
+    mock_client.get.assert_called_once()
+    assert mock_client.post.call_count == 2
+    mock_client.delete.assert_called_once_with(
+        "/server/database/item", params={"namespace": "fleet", "key": "old"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_put_items_prunes_by_top_level_key_after_writes(
+    database_tools: DatabaseTools, mock_client: AsyncMock
+) -> None:
+    """Test that pruning keeps namespaces holding dotted keys."""
+    # Arrange
+    mock_client.get.return_value = {
+        "result": {"value": {"general": {"theme": "dark", "lang": "en"}, "x": 1}}
+    }
+    order: List[str] = []
+    mock_client.post.side_effect = lambda *args, **kwargs: order.append("post")
+    mock_client.delete.side_effect = lambda *args, **kwargs: order.append("delete")
+
+    # Act
+    diff = await database_tools.put_items(
+        "mainsail", {"general.theme": "light"}, prune=True
+    )
+
+    # Assert
+    assert diff["changed"] == ["general.theme"]
+    assert diff["removed"] == ["x"]
+    assert order == ["post", "delete"]
+
+
+@pytest.mark.asyncio
+async def test_put_items_reports_failed_keys(
+    database_tools: DatabaseTools, mock_client: AsyncMock
+) -> None:
+    """Test that one failed write is reported without losing the others."""
+    # Arrange
+    mock_client.get.return_value = {"result": {"value": {}}}
+
+    async def post(endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        if data["key"] == "b":
+            raise RuntimeError("write failed")
+        return {"result": data}
+
+    mock_client.post.side_effect = post
+
+    # Act
+    diff = await database_tools.put_items("fleet", {"a": 1, "b": 2, "c": 3})
+
+    # Assert
+    assert diff["added"] == ["a", "c"]
+    assert diff["failed"] == {"b": "write failed"}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_and_restore_namespace(
+    mock_client: AsyncMock, tmp_path: Any
+) -> None:
+    """Test restoring a namespace from a snapshot file."""
+    # Arrange
+    path = str(tmp_path / "fleet.json")
+    mock_client.get.return_value = {"result": {"value": {"theme": "dark"}}}
+    await snapshot_namespace(mock_client, "fleet", path)
+    mock_client.get.return_value = {"result": {"value": {"extra": True}}}
+
+    # Act
+    diff = await restore_namespace(mock_client, path, prune=True)
+
+    # Assert
+    assert diff["added"] == ["theme"] and diff["removed"] == ["extra"]
+    mock_client.post.assert_called_once_with(
+        "/server/database/item",
+        data={"namespace": "fleet", "key": "theme", "value": "dark"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_reads_from_memory(mock_client: AsyncMock) -> None:
+    """Test that mirrored namespaces are read once and written through."""
+    # Arrange
+    mock_client.get.return_value = {"result": {"value": {"general": {"theme": "x"}}}}
+    cache = DatabaseCache(mock_client, ["mainsail"])
+
+    # Act
+    first = await cache.get_item("mainsail", "general.theme")
+    await cache.add_item("mainsail", "general.theme", "dark")
+    second = await cache.get_item("mainsail", "general.theme")
+
+    # Assert
+    assert first["result"]["value"] == "x"
+    assert second["result"]["value"] == "dark"
+    mock_client.get.assert_called_once()
+    mock_client.post.assert_called_once_with(
+        "/server/database/item",
+        data={"namespace": "mainsail", "key": "general.theme", "value": "dark"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_by_notification(mock_client: AsyncMock) -> None:
+    """Test that a database change notification drops the namespace."""
+    # Arrange
+    mock_client.get.return_value = {"result": {"value": {"theme": "x"}}}
+    cache = DatabaseCache(mock_client, ["mainsail", "fluidd"])
+    await cache.get_item("mainsail")
+    await cache.get_item("fluidd")
+
+    # Act
+    cache.handle_notification("notify_database_changed", [{"namespace": "mainsail"}])
+    await cache.get_item("mainsail")
+    await cache.get_item("fluidd")
+
+    # Assert
+    assert mock_client.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_drops_load_racing_with_write(mock_client: AsyncMock) -> None:
+    """Test that a namespace read before a write completes is not kept."""
+    # Arrange
+    release = asyncio.Event()
+    values = iter([{"theme": "old"}, {"theme": "new"}])
+
+    async def get(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        await release.wait()
+        return {"result": {"value": next(values)}}
+
+    mock_client.get.side_effect = get
+    cache = DatabaseCache(mock_client, ["mainsail"])
+    read = asyncio.ensure_future(cache.get_item("mainsail", "theme"))
+    await asyncio.sleep(0)
+
+    # Act
+    await cache.add_item("mainsail", "theme", "new")
+    release.set()
+    await read
+    after = await cache.get_item("mainsail", "theme")
+
+    # Assert
+    assert after["result"]["value"] == "new"
+    assert mock_client.get.call_count == 2
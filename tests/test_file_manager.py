@@ -45,3 +45,24 @@ async def test_list_files(
         "/server/files/list", params={"root": "gcodes"}
     )
     assert result == mock_response
+
+
+@pytest.mark.asyncio
+async def test_get_metadata(
+    file_manager_tools: FileManagerTools, mock_client: AsyncMock
+) -> None:
+    """Test getting the metadata of a file."""
+    # Arrange
+    mock_response: Dict[str, Any] = {
+        "result": {"filename": "test.gcode", "estimated_time": 3600}
+    }
+    mock_client.get.return_value = mock_response
+
+    # Act
+    result = await file_manager_tools.get_metadata("test.gcode")
+
+    # Assert
+    mock_client.get.assert_called_once_with(
+        "/server/files/metadata", params={"filename": "test.gcode"}
+    )
+    assert result == mock_response
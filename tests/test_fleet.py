@@ -0,0 +1,244 @@
+"""Tests for the fleet helpers."""
+
+import math
+from typing import Any, Dict
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.fleet.base import Fleet
+from moonraker_tools.fleet.inventory import Inventory
+from moonraker_tools.fleet.power import FleetPower
+from moonraker_tools.fleet.proc_stats import ProcStatsSampler, RingBuffer
+from moonraker_tools.fleet.scheduler import FleetJobScheduler
+from moonraker_tools.fleet.updates import RollingUpdate
+
+
+@pytest.fixture
+def clients() -> Dict[str, AsyncMock]:
+    """Fixture for the mocked clients of three printers."""
+    return {
+        name: create_autospec(MoonrakerClient, instance=True)
+        for name in ("alpha", "beta", "gamma")
+    }
+
+
+@pytest.fixture
+def fleet(clients: Dict[str, AsyncMock]) -> Fleet:
+    """Fixture for a Fleet of mocked clients."""
+    return Fleet(clients, max_concurrency=2)
+
+
+@pytest.mark.asyncio
+async def test_gather_separates_failures(
+    fleet: Fleet, clients: Dict[str, AsyncMock]
+) -> None:
+    """Test that one failing printer does not affect the others."""
+    # Arrange
+    clients["alpha"].get.return_value = {"result": 1}
+    clients["beta"].get.side_effect = ConnectionError("offline")
+    clients["gamma"].get.return_value = {"result": 3}
+
+    async def info(name: str, client: MoonrakerClient) -> int:
+        return (await client.get("/server/info"))["result"]
+
+    # Act
+    results, errors = await fleet.gather(info)
+
+    # Assert
+    assert results == {"alpha": 1, "gamma": 3}
+    assert list(errors) == ["beta"]
+
+
+def test_ring_buffer_overwrites_oldest() -> None:
+    """Test the ring buffer order and percentiles."""
+    # Arrange
+    buffer = RingBuffer(4)
+
+    # Act
+    for value in range(1, 7):
+        buffer.append(float(value))
+
+    # Assert
+    assert buffer.values() == [3.0, 4.0, 5.0, 6.0]
+    assert buffer.percentile(50) == 4.5
+    assert buffer.summary()["last"] == 6.0
+
+
+@pytest.mark.asyncio
+async def test_sampler_records_proc_stats(
+    fleet: Fleet, clients: Dict[str, AsyncMock]
+) -> None:
+    """Test polling the fleet and flagging an overloaded printer."""
+    # Arrange
+    for name, cpu in (("alpha", 20.0), ("beta", 97.0), ("gamma", 40.0)):
+        clients[name].get.return_value = {
+            "result": {
+                "moonraker_stats": [{"time": 1.0, "cpu_usage": 2.5, "memory": 1}],
+                "throttled_state": {"bits": 0, "flags": []},
+                "system_cpu_usage": {"cpu": cpu},
+                "system_memory": {"total": 1000, "used": 250},
+                "websocket_connections": 3,
+            }
+        }
+    sampler = ProcStatsSampler(fleet, capacity=8)
+
+    # Act
+    await sampler.sample()
+    sampler.handler("alpha")("notify_proc_stat_update", [{"cpu_temp": 55.0}])
+
+    # Assert
+    assert sampler.overloaded(threshold=90) == ["beta"]
+    assert sampler.summary("beta")["beta"]["memory_used"]["last"] == 25.0
+    assert math.isnan(sampler.series("alpha", "system_cpu")[-1])
+    assert sampler.series("alpha", "cpu_temp")[-1] == 55.0
+
+
+@pytest.mark.asyncio
+async def test_inventory_reports_changed_sections(
+    fleet: Fleet, clients: Dict[str, AsyncMock], tmp_path: Any
+) -> None:
+    """Test that a second collection reports only the changed sections."""
+    # Arrange
+    for client in clients.values():
+        client.get.return_value = {
+            "result": {
+                "system_info": {
+                    "cpu_info": {"cpu_count": 4},
+                    "service_state": {"klipper": {"active_state": "active"}},
+                }
+            }
+        }
+    path = str(tmp_path / "inventory.json")
+    await Inventory(fleet, path).collect()
+    clients["beta"].get.return_value = {
+        "result": {
+            "system_info": {
+                "cpu_info": {"cpu_count": 4},
+                "service_state": {"klipper": {"active_state": "failed"}},
+            }
+        }
+    }
+
+    # Act
+    report = await Inventory(fleet, path).collect()
+
+    # Assert
+    assert report["changed"] == {
+        "beta": {"service_state": {"klipper": {"active_state": "failed"}}}
+    }
+    assert report["removed"] == {} and report["errors"] == {}
+
+
+@pytest.mark.asyncio
+async def test_rolling_update_rolls_back_unhealthy_printer(
+    fleet: Fleet, clients: Dict[str, AsyncMock]
+) -> None:
+    """Test that a printer not ready after its upgrade is rolled back."""
+    # Arrange
+    version_info = {
+        "klipper": {"version": "v0.12.0", "commits_behind": [{"sha": "abc"}]},
+        "mainsail": {"version": "v2.1.0", "remote_version": "v2.1.0"},
+    }
+    for name, client in clients.items():
+        client.post.return_value = {"result": {"version_info": version_info}}
+        state = "error" if name == "beta" else "ready"
+        client.get.return_value = {"result": {"state": state}}
+    updater = RollingUpdate(
+        fleet, wave_size=1, max_failures=1, health_timeout=0, health_interval=0
+    )
+
+    # Act
+    report = await updater.run()
+
+    # Assert
+    assert report["alpha"] == {"status": "updated", "components": ["klipper"]}
+    assert report["beta"]["status"] == "rolled_back"
+    assert report["gamma"]["status"] == "skipped"
+    clients["beta"].post.assert_called_with(
+        "/machine/update/rollback", data={"name": "klipper"}
+    )
+    clients["gamma"].post.assert_called_once_with("/machine/update/refresh", data={})
+
+
+@pytest.mark.asyncio
+async def test_rolling_update_ignores_unreachable_printers(
+    fleet: Fleet, clients: Dict[str, AsyncMock]
+) -> None:
+    """Test that an offline printer does not use up the failure budget."""
+    # Arrange
+    version_info = {"klipper": {"version": "v0.12.0", "commits_behind": [{}]}}
+    for client in clients.values():
+        client.post.return_value = {"result": {"version_info": version_info}}
+        client.get.return_value = {"result": {"state": "ready"}}
+    clients["alpha"].post.side_effect = ConnectionError("offline")
+    updater = RollingUpdate(fleet, wave_size=1, max_failures=1, health_interval=0)
+
+    # Act
+    report = await updater.run()
+
+    # Assert
+    assert report["alpha"]["status"] == "unreachable"
+    assert report["beta"]["status"] == "updated"
+    assert report["gamma"]["status"] == "updated"
+
+
+@pytest.mark.asyncio
+async def test_power_on_batches_per_host(clients: Dict[str, AsyncMock]) -> None:
+    """Test that printers sharing a Moonraker host share one request."""
+    # Arrange
+    clients["alpha"].base_url = clients["beta"].base_url = "http://farm-a:7125"
+    clients["gamma"].base_url = "http://farm-b:7125"
+    clients["alpha"].post.return_value = {"result": {"psu_a": "on", "psu_b": "on"}}
+    clients["alpha"].get.return_value = {"result": {"psu_a": "on", "psu_b": "on"}}
+    clients["gamma"].post.side_effect = ConnectionError("offline")
+    clients["gamma"].get.side_effect = ConnectionError("offline")
+    power = FleetPower(Fleet(clients))
+
+    # Act
+    report = await power.power_on(
+        [("alpha", "psu_a"), ("beta", "psu_b"), ("gamma", "psu_c")], stagger=0.001
+    )
+
+    # Assert
+    clients["alpha"].post.assert_called_once_with(
+        "/machine/device_power/on", data={"psu_a": None, "psu_b": None}
+    )
+    clients["beta"].post.assert_not_called()
+    assert report["devices"] == {"alpha": {"psu_a": "on"}, "beta": {"psu_b": "on"}}
+    assert list(report["errors"]) == ["gamma"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_balances_idle_compatible_printers(
+    fleet: Fleet, clients: Dict[str, AsyncMock]
+) -> None:
+    """Test that jobs go to idle compatible printers by estimated load."""
+    # Arrange
+    states = {"alpha": "standby", "beta": "printing", "gamma": "complete"}
+    for name, client in clients.items():
+        client.post.return_value = {
+            "result": {"status": {"print_stats": {"state": states[name]}}}
+        }
+        client.get.side_effect = lambda endpoint, params=None: (
+            {"result": {"estimated_time": 600}}
+            if endpoint == "/server/files/metadata"
+            else {"result": {"queued_jobs": [], "queue_state": "ready"}}
+        )
+    scheduler = FleetJobScheduler(
+        fleet, printer_tags={"alpha": ["pla"], "beta": ["pla"], "gamma": ["petg"]}
+    )
+    scheduler.load["alpha"] = 100.0
+    first = scheduler.submit("part.gcode", tags=["pla"])
+    second = scheduler.submit("other.gcode", tags=["pla"])
+
+    # Act
+    dispatched = await scheduler.dispatch()
+
+    # Assert
+    assert dispatched == [(first, "alpha")]
+    assert scheduler.backlog == [second]
+    assert scheduler.load["alpha"] == 700.0
+    clients["alpha"].post.assert_called_with(
+        "/server/job_queue/job", data={"filenames": ["part.gcode"], "reset": False}
+    )
@@ -1,10 +1,11 @@
 """Tests for the history tools."""
 
-from typing import Any, Dict, Generator, List
+from typing import Any, AsyncIterator, Dict, Generator, List
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.models import HistoryJobList
 from moonraker_tools.tools.history import HistoryTools
 
 
@@ -52,3 +53,42 @@ async def test_list_jobs(history_tools: HistoryTools, mock_client: AsyncMock) ->
     # Assert
     mock_client.get.assert_called_once_with("/server/history/list", params={})
     assert result == mock_response
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_typed(
+    history_tools: HistoryTools, mock_client: AsyncMock
+) -> None:
+    """Test listing jobs as typed models."""
+    # Arrange
+    mock_client.get_model.return_value = HistoryJobList(count=0)
+
+    # Act
+    result = await history_tools.list_jobs(limit=5, typed=True)
+
+    # Assert
+    mock_client.get_model.assert_called_once_with(
+        "/server/history/list", HistoryJobList, params={"limit": 5}
+    )
+    assert result == HistoryJobList(count=0)
+
+
+@pytest.mark.asyncio
+async def test_iter_jobs(history_tools: HistoryTools, mock_client: AsyncMock) -> None:
+    """Test streaming jobs from the history listing."""
+
+    # Arrange
+    async def stream(*args: Any, **kwargs: Any) -> AsyncIterator[Dict[str, Any]]:
+        yield {"job_id": "000001"}
+        yield {"job_id": "000002"}
+
+    mock_client.stream_items.side_effect = stream
+
+    # Act
+    jobs = [job async for job in history_tools.iter_jobs(order="desc")]
+
+    # Assert
+    mock_client.stream_items.assert_called_once_with(
+        "/server/history/list", path=("result", "jobs"), params={"order": "desc"}
+    )
+    assert jobs == [{"job_id": "000001"}, {"job_id": "000002"}]
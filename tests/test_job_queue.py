@@ -39,3 +39,115 @@ async def test_get_status(
     # Assert
     mock_client.get.assert_called_once_with("/server/job_queue/status")
     assert result == mock_response
+
+
+def queue_status(*jobs: str) -> Dict[str, Any]:
+    """Build a job queue status with one job per filename."""
+    return {
+        "result": {
+            "queued_jobs": [
+                {"filename": filename, "job_id": f"id-{filename}"} for filename in jobs
+            ],
+            "queue_state": "ready",
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_jump_to_job(
+    job_queue_tools: JobQueueTools, mock_client: AsyncMock
+) -> None:
+    """Test jumping a job to the front of the queue."""
+    # Act
+    await job_queue_tools.jump_to_job("0001")
+
+    # Assert
+    mock_client.post.assert_called_once_with(
+        "/server/job_queue/jump", data={"job_id": "0001"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_jobs_reports_job_ids(
+    job_queue_tools: JobQueueTools, mock_client: AsyncMock
+) -> None:
+    """Test that a batch is enqueued in one request with per-item job IDs."""
+    # Arrange
+    mock_client.get.return_value = queue_status("old.gcode")
+    mock_client.post.return_value = queue_status("old.gcode", "a.gcode", "b.gcode")
+
+    # Act
+    result = await job_queue_tools.enqueue_jobs(["a.gcode", "b.gcode"])
+
+    # Assert
+    mock_client.post.assert_called_once()
+    assert result["jobs"] == [
+        {"filename": "a.gcode", "job_id": "id-a.gcode"},
+        {"filename": "b.gcode", "job_id": "id-b.gcode"},
+    ]
+    assert result["unmatched"] == []
+
+
+@pytest.mark.asyncio
+async def test_enqueue_jobs_reports_started_jobs_as_unmatched(
+    job_queue_tools: JobQueueTools, mock_client: AsyncMock
+) -> None:
+    """Test that a job that left the queue at once is not given another's ID."""
+    # Arrange
+    mock_client.get.return_value = queue_status("a.gcode")
+    mock_client.post.return_value = queue_status("a.gcode", "a.gcode", "b.gcode")
+    queued = mock_client.post.return_value["result"]["queued_jobs"]
+    queued[1]["job_id"] = "new-a"
+
+    # Act
+    result = await job_queue_tools.enqueue_jobs(["a.gcode", "a.gcode", "b.gcode"])
+
+    # Assert
+    assert result["jobs"] == [
+        {"filename": "a.gcode", "job_id": "new-a"},
+        {"filename": "b.gcode", "job_id": "id-b.gcode"},
+    ]
+    assert result["unmatched"] == ["a.gcode"]
+
+
+@pytest.mark.asyncio
+async def test_remove_jobs_skips_missing(
+    job_queue_tools: JobQueueTools, mock_client: AsyncMock
+) -> None:
+    """Test that queued jobs are removed in one request."""
+    # Arrange
+    mock_client.get.return_value = queue_status("a", "b", "c")
+    mock_client.delete.return_value = queue_status("b")
+
+    # Act
+    result = await job_queue_tools.remove_jobs(["id-a", "id-c", "id-z"])
+
+    # Assert
+    mock_client.delete.assert_called_once_with(
+        "/server/job_queue/job", params={"job_ids": "id-a,id-c"}
+    )
+    assert result["removed"] == ["id-a", "id-c"]
+    assert result["not_found"] == ["id-z"]
+
+
+@pytest.mark.asyncio
+async def test_reorder_jobs_replaces_queue_once(
+    job_queue_tools: JobQueueTools, mock_client: AsyncMock
+) -> None:
+    """Test that a reorder replaces the queue in a single request."""
+    # Arrange
+    mock_client.get.return_value = queue_status("a", "b", "c")
+    reordered = [{"filename": name, "job_id": f"new-{name}"} for name in "cab"]
+    mock_client.post.return_value = {
+        "result": {"queued_jobs": reordered, "queue_state": "ready"}
+    }
+
+    # Act
+    result = await job_queue_tools.reorder_jobs(["id-c"])
+
+    # Assert
+    mock_client.post.assert_called_once_with(
+        "/server/job_queue/job", data={"filenames": ["c", "a", "b"], "reset": True}
+    )
+    assert result["job_ids"] == {"id-c": "new-c", "id-a": "new-a", "id-b": "new-b"}
+    assert result["unmatched"] == []
@@ -0,0 +1,74 @@
+"""Tests for the typed response models."""
+
+import json
+from typing import List
+
+import httpx
+import pytest
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.models import FileEntry, HistoryJob, HistoryJobList, decode_result
+
+
+def test_decode_result_builds_models() -> None:
+    """Test decoding a result into slotted models, dropping unknown fields."""
+    # Arrange
+    content = json.dumps(
+        {
+            "result": {
+                "count": 1,
+                "jobs": [
+                    {
+                        "job_id": "000001",
+                        "filename": "cube.gcode",
+                        "status": "completed",
+                        "end_time": None,
+                        "print_duration": 18.5,
+                        "user": "testuser",
+                    }
+                ],
+            }
+        }
+    ).encode()
+
+    # Act
+    result = decode_result(HistoryJobList, content)
+
+    # Assert
+    assert result == HistoryJobList(
+        count=1,
+        jobs=[
+            HistoryJob(
+                job_id="000001",
+                filename="cube.gcode",
+                status="completed",
+                print_duration=18.5,
+            )
+        ],
+    )
+    assert not hasattr(result.jobs[0], "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_get_model_decodes_response_body() -> None:
+    """Test that the client decodes typed results from the raw body."""
+
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"result": [{"path": "a.gcode", "size": 10, "permissions": "rw"}]},
+        )
+
+    client = MoonrakerClient("printer", retry_policy=None, circuit_breaker=None)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    # Act
+    result = await client.get_model(
+        "/server/files/list", List[FileEntry], params={"root": "gcodes"}
+    )
+
+    # Assert
+    assert result == [FileEntry(path="a.gcode", size=10, permissions="rw")]
+    await client.close()
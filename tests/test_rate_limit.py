@@ -0,0 +1,67 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+
+import httpx
+import pytest
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.rate_limit import RateLimiter, TokenBucket
+
+
+def test_bucket_allows_burst_then_spaces_requests() -> None:
+    """Test that requests past the burst are scheduled one interval apart."""
+    # Arrange
+    bucket = TokenBucket(rate=10, burst=3)
+
+    # Act
+    delays = [bucket.reserve() for _ in range(5)]
+
+    # Assert
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_motion_budget_is_separate_and_estop_exempt() -> None:
+    """Test that motion commands wait while reads and emergency stops do not."""
+    # Arrange
+    limiter = RateLimiter(motion_rate=20, motion_burst=1)
+    host = "http://printer:7125"
+
+    # Act
+    delays = await asyncio.gather(
+        limiter.acquire(host, "/printer/gcode/script"),
+        limiter.acquire(host, "/printer/gcode/script"),
+        limiter.acquire(host, "/printer/info"),
+        limiter.acquire(host, "/printer/emergency_stop"),
+    )
+
+    # Assert
+    assert delays[0] == 0.0 and delays[1] > 0.0
+    assert delays[2:] == [0.0, 0.0]
+    stats = limiter.stats()[host]
+    assert stats["motion"]["throttled"] == 1
+    assert stats["read"] == {"requests": 1, "throttled": 0, "throttled_seconds": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_client_waits_for_rate_limiter() -> None:
+    """Test that the client acquires from its limiter before sending."""
+    # Arrange
+    limiter = RateLimiter(read_rate=20, read_burst=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"result": "ok"})
+
+    client = MoonrakerClient("printer", rate_limiter=limiter, circuit_breaker=None)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    # Act
+    await asyncio.gather(*(client.get("/server/info") for _ in range(3)))
+
+    # Assert
+    assert limiter.stats()[client.base_url]["read"]["throttled"] == 2
+    await client.close()
@@ -0,0 +1,65 @@
+"""Tests for the MCP tool registry."""
+
+from typing import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from moonraker_mcp.registry import ToolRegistry
+
+
+@pytest.fixture
+def mock_client() -> Generator[AsyncMock, None, None]:
+    """Fixture for a mocked MoonrakerClient."""
+    with patch("moonraker_tools.client.MoonrakerClient", autospec=True) as mock:
+        yield mock
+
+
+@pytest.fixture
+def registry(mock_client: AsyncMock) -> ToolRegistry:
+    """Fixture for a ToolRegistry bound to a mocked client."""
+    return ToolRegistry.build(client_factory=lambda: mock_client)
+
+
+def test_generated_schema(registry: ToolRegistry) -> None:
+    """Test that schemas are generated from signatures and docstrings."""
+    # Act
+    tools = {tool.name: tool for tool in registry.tools}
+
+    # Assert
+    assert "get_printer_status" in tools
+    tool = tools["history_delete_job"]
+    assert tool.description == "Delete one or all jobs."
+    assert tool.inputSchema["properties"]["uid"]["type"] == "string"
+    assert tool.inputSchema["properties"]["all_jobs"]["default"] is False
+    assert "required" not in tool.inputSchema
+    assert "typed" not in tools["history_list_jobs"].inputSchema["properties"]
+    assert "database_snapshot_namespace" not in tools
+    assert tools["machine_restart_service"].inputSchema["required"] == ["service"]
+    assert registry.tools is registry.tools
+
+
+@pytest.mark.asyncio
+async def test_call_dispatches_to_tools_method(
+    registry: ToolRegistry, mock_client: AsyncMock
+) -> None:
+    """Test calling a tool generated from a tools class."""
+    # Arrange
+    mock_client.post.return_value = {"result": "ok"}
+
+    # Act
+    result = await registry.call("machine_restart_service", {"service": "klipper"})
+
+    # Assert
+    mock_client.post.assert_called_once_with(
+        "/machine/services/restart", data={"service": "klipper"}
+    )
+    assert result == {"result": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_call_rejects_invalid_arguments(registry: ToolRegistry) -> None:
+    """Test that unknown tools and invalid arguments are rejected."""
+    with pytest.raises(ValueError, match="Unknown tool"):
+        await registry.call("does_not_exist", {})
+    with pytest.raises(ValueError, match="Input validation error"):
+        await registry.call("machine_restart_service", {"service": 1})
@@ -0,0 +1,116 @@
+"""Tests for the MCP resource hub."""
+
+import asyncio
+import json
+from typing import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from moonraker_mcp.resources import JOB_QUEUE_URI, PRINTER_STATUS_URI, ResourceHub
+from moonraker_tools.websocket import NOTIFY_CONNECTED
+
+
+@pytest.fixture
+def mock_client() -> Generator[AsyncMock, None, None]:
+    """Fixture for a mocked MoonrakerClient."""
+    with patch("moonraker_tools.client.MoonrakerClient", autospec=True) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_feed() -> MagicMock:
+    """Fixture for a mocked MoonrakerWebsocket."""
+    feed = MagicMock()
+    feed.start = AsyncMock()
+    feed.close = AsyncMock()
+    feed.call = AsyncMock(
+        return_value={"status": {"print_stats": {"state": "standby"}}}
+    )
+    return feed
+
+
+@pytest.mark.asyncio
+async def test_read_without_feed_fetches(mock_client: AsyncMock) -> None:
+    """Test that reads are fetched while no feed is connected."""
+    # Arrange
+    hub = ResourceHub(client_factory=lambda: mock_client)
+    mock_client.get.return_value = {"result": {"queue_state": "ready"}}
+
+    # Act
+    first = await hub.read(JOB_QUEUE_URI)
+    await hub.read(JOB_QUEUE_URI)
+
+    # Assert
+    assert json.loads(first) == {"result": {"queue_state": "ready"}}
+    assert mock_client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_notifications_update_cache_and_notify(
+    mock_client: AsyncMock, mock_feed: MagicMock
+) -> None:
+    """Test that status updates are merged and pushed to subscribers."""
+    # Arrange
+    hub = ResourceHub(
+        client_factory=lambda: mock_client,
+        feed_factory=lambda: mock_feed,
+        min_interval=0,
+    )
+    session = AsyncMock()
+    await hub.subscribe(PRINTER_STATUS_URI, session)
+    await hub.handle_notification(NOTIFY_CONNECTED, [])
+    await asyncio.sleep(0)
+    session.send_resource_updated.reset_mock()
+
+    # Act
+    await hub.handle_notification(
+        "notify_status_update", [{"print_stats": {"state": "printing"}}, 1.0]
+    )
+    await asyncio.sleep(0)
+    status = json.loads(await hub.read(PRINTER_STATUS_URI))
+
+    # Assert
+    mock_feed.start.assert_awaited_once()
+    session.send_resource_updated.assert_awaited_once()
+    assert status == {"status": {"print_stats": {"state": "printing"}}}
+    mock_client.post.assert_not_called()
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_notification_during_fetch_is_not_lost(
+    mock_client: AsyncMock, mock_feed: MagicMock
+) -> None:
+    """Test that a fetch racing with a change notification is not cached."""
+    # Arrange
+    hub = ResourceHub(
+        client_factory=lambda: mock_client,
+        feed_factory=lambda: mock_feed,
+        min_interval=0,
+    )
+    await hub.subscribe(JOB_QUEUE_URI, AsyncMock())
+    await hub.handle_notification(NOTIFY_CONNECTED, [])
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_get(*args, **kwargs):
+        fetched.set()
+        await release.wait()
+        return {"result": {"queue_state": "ready"}}
+
+    mock_client.get.side_effect = slow_get
+
+    # Act
+    read = asyncio.create_task(hub.read(JOB_QUEUE_URI))
+    await fetched.wait()
+    await hub.handle_notification("notify_job_queue_changed", [])
+    release.set()
+    await read
+    mock_client.get.side_effect = None
+    mock_client.get.return_value = {"result": {"queue_state": "paused"}}
+    second = json.loads(await hub.read(JOB_QUEUE_URI))
+
+    # Assert
+    assert second == {"result": {"queue_state": "paused"}}
+    assert mock_client.get.call_count == 2
+    await hub.close()
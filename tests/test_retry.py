@@ -0,0 +1,95 @@
+"""Tests for retrying failed requests."""
+
+from typing import List
+
+import httpx
+import pytest
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.retry import RetryBudget, RetryPolicy
+
+
+def make_client(handler, policy: RetryPolicy) -> MoonrakerClient:
+    """Build a client that sends its requests to a handler."""
+    client = MoonrakerClient("printer", retry_policy=policy, circuit_breaker=None)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried_after_server_error() -> None:
+    """Test that a GET is retried after a 503."""
+    # Arrange
+    statuses = [503, 503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json={"result": "ok"})
+
+    client = make_client(handler, RetryPolicy(backoff=0))
+
+    # Act
+    result = await client.get("/server/info")
+
+    # Assert
+    assert result == {"result": "ok"}
+    assert statuses == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_unsafe_post_is_not_retried() -> None:
+    """Test that a G-code script is never sent twice after a timeout."""
+    # Arrange
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = make_client(handler, RetryPolicy(backoff=0))
+
+    # Act
+    with pytest.raises(httpx.ReadTimeout):
+        await client.post("/printer/gcode/script", data={"script": "G28"})
+
+    # Assert
+    assert seen == ["/printer/gcode/script"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_error_is_retried_for_any_method() -> None:
+    """Test that requests which never reached the server are retried."""
+    # Arrange
+    attempts: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(200, json={"result": "ok"})
+
+    client = make_client(handler, RetryPolicy(backoff=0))
+
+    # Act
+    result = await client.post("/printer/print/pause")
+
+    # Assert
+    assert result == {"result": "ok"} and len(attempts) == 2
+    await client.close()
+
+
+def test_budget_limits_retries() -> None:
+    """Test that an exhausted budget refuses retries."""
+    # Arrange
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+
+    # Act
+    spent = [budget.try_spend() for _ in range(3)]
+    budget.record_request()
+    budget.record_request()
+
+    # Assert
+    assert spent == [True, True, False]
+    assert budget.try_spend()
@@ -0,0 +1,73 @@
+"""Tests for the MCP tool scheduler."""
+
+import asyncio
+from typing import List
+
+import pytest
+from moonraker_mcp.scheduler import BULK, NORMAL, URGENT, ToolScheduler, classify
+
+
+def test_classify() -> None:
+    """Test the priority of safety, bulk and regular tools."""
+    assert classify("printer_emergency_stop") == URGENT
+    assert classify("printer_pause_print") == URGENT
+    assert classify("list_files") == BULK
+    assert classify("history_list_jobs") == BULK
+    assert classify("printer_get_info") == NORMAL
+
+
+@pytest.mark.asyncio
+async def test_urgent_calls_bypass_a_full_lane() -> None:
+    """Test that urgent calls run while the printer's slots are taken."""
+    # Arrange
+    scheduler = ToolScheduler(max_concurrency=1)
+    release = asyncio.Event()
+
+    async def listing() -> None:
+        async with scheduler.slot("printer", BULK):
+            await release.wait()
+
+    task = asyncio.create_task(listing())
+    await asyncio.sleep(0)
+
+    # Act
+    async with scheduler.slot("printer", URGENT):
+        stats = scheduler.stats()
+
+    # Assert
+    assert stats == {"printer": {"active": 1, "waiting": 0}}
+    release.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_waiters_run_in_priority_order_and_cancel_cleanly() -> None:
+    """Test priority ordering and removal of cancelled waiters."""
+    # Arrange
+    scheduler = ToolScheduler(max_concurrency=1)
+    order: List[str] = []
+    release = asyncio.Event()
+
+    async def call(name: str, priority: int) -> None:
+        async with scheduler.slot("printer", priority):
+            order.append(name)
+            if name == "first":
+                await release.wait()
+
+    first = asyncio.create_task(call("first", NORMAL))
+    await asyncio.sleep(0)
+    bulk = asyncio.create_task(call("bulk", BULK))
+    cancelled = asyncio.create_task(call("cancelled", NORMAL))
+    normal = asyncio.create_task(call("normal", NORMAL))
+    await asyncio.sleep(0)
+
+    # Act
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, bulk, normal)
+
+    # Assert
+    assert cancelled.cancelled()
+    assert order == ["first", "normal", "bulk"]
+    assert scheduler.stats() == {"printer": {"active": 0, "waiting": 0}}
@@ -0,0 +1,30 @@
+"""Tests for the cold start of the MCP server."""
+
+import json
+import subprocess
+import sys
+
+_PROBE = """
+import json, sys
+import moonraker_mcp.server
+loaded = [
+    name for name in sys.modules
+    if name.startswith(("moonraker_tools.agent", "moonraker_tools.tools"))
+    or name in ("moonraker_tools.models", "moonraker_tools.streaming")
+]
+print(json.dumps(loaded))
+"""
+
+
+def test_server_import_defers_tools_modules() -> None:
+    """Test that importing the server loads no tools, agent or model modules."""
+    # Act
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    # Assert
+    assert json.loads(output.strip().splitlines()[-1]) == []
@@ -0,0 +1,135 @@
+"""Tests for streaming JSON parsing."""
+
+import json
+import random
+from typing import AsyncIterator, List
+
+import httpx
+import pytest
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.streaming import JSONItemStream
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_items_are_parsed_across_chunks(chunk_size: int) -> None:
+    """Test that items split across chunks are yielded once complete."""
+    # Arrange
+    jobs = [{"job_id": str(i), "filename": "é ]}.gcode"} for i in range(3)] + [123]
+    document = json.dumps(
+        {"result": {"count": 4, "meta": {"a": [1, "]"]}, "jobs": jobs, "z": 1}}
+    ).encode()
+    parser = JSONItemStream(("result", "jobs"))
+
+    # Act
+    items = []
+    for i in range(0, len(document), chunk_size):
+        items.extend(parser.feed(document[i : i + chunk_size]))
+    parser.close()
+
+    # Assert
+    assert items == jobs
+    assert parser.done
+
+
+def test_missing_array_yields_nothing() -> None:
+    """Test that a path leading to null ends the stream without items."""
+    # Arrange
+    parser = JSONItemStream()
+
+    # Act
+    items = parser.feed(b'{"result": null}')
+
+    # Assert
+    assert items == []
+    assert parser.done
+
+
+def test_truncated_document_is_rejected() -> None:
+    """Test that a document ending inside the array raises on close."""
+    # Arrange
+    parser = JSONItemStream()
+    parser.feed(b'{"result": [{"path": "a.gcode"}, {"pa')
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_items_survive_random_chunking(seed: int) -> None:
+    """Test that numbers, escapes and literals split anywhere are kept whole."""
+    # Arrange
+    rng = random.Random(seed)
+    items = [
+        1.5,
+        -0.25e-3,
+        12345,
+        6.02e23,
+        True,
+        None,
+        '\U0001f600 \\ "',
+        {"filament_used": 1234.5678, "exists": False},
+    ]
+    document = json.dumps({"skip": [3.75e2, "x"], "result": items}).encode()
+    parser = JSONItemStream()
+
+    # Act
+    parsed = []
+    pos = 0
+    while pos < len(document):
+        size = rng.randint(1, 6)
+        parsed.extend(parser.feed(document[pos : pos + size]))
+        pos += size
+    parser.close()
+
+    # Assert
+    assert parsed == items
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"result": [1, x]}',
+        b'{"result": [1 2]}',
+        b'{"result": [1,]}',
+        b'{"skip": tru, "res',
+        b'{1: 2, "result": []}',
+    ],
+)
+def test_malformed_document_is_rejected(body: bytes) -> None:
+    """Test that text that cannot become valid JSON raises instead of buffering."""
+    # Arrange
+    parser = JSONItemStream()
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        parser.feed(body)
+
+
+@pytest.mark.asyncio
+async def test_stream_items_yields_before_download_completes() -> None:
+    """Test that the client yields items while the body is still arriving."""
+    # Arrange
+    sent: List[bytes] = []
+
+    async def body() -> AsyncIterator[bytes]:
+        for chunk in (b'{"result": [{"path": "a.gcode"},', b' {"path": "b.gcode"}]}'):
+            sent.append(chunk)
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    client = MoonrakerClient("printer", retry_policy=None, circuit_breaker=None)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    # Act
+    seen = []
+    async for item in client.stream_items("/server/files/list"):
+        seen.append((item["path"], len(sent)))
+
+    # Assert
+    assert seen == [("a.gcode", 1), ("b.gcode", 2)]
+    await client.close()
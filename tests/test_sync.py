@@ -0,0 +1,82 @@
+"""Tests for the synchronous facade."""
+
+import threading
+from typing import Generator, List
+
+import httpx
+import pytest
+from moonraker_tools.sync import EventLoopThread, SyncMoonraker
+from moonraker_tools.tools.file_manager import FileManagerTools
+from moonraker_tools.tools.printer import PrinterTools
+
+
+@pytest.fixture
+def loop() -> Generator[EventLoopThread, None, None]:
+    """Fixture for a loop thread stopped after the test."""
+    loop = EventLoopThread()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def threads() -> List[str]:
+    """Fixture collecting the names of the threads that sent requests."""
+    return []
+
+
+@pytest.fixture
+def facade(
+    loop: EventLoopThread, threads: List[str]
+) -> Generator[SyncMoonraker, None, None]:
+    """Fixture for a facade whose client answers from a mock transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        threads.append(threading.current_thread().name)
+        if request.url.path == "/server/files/list":
+            return httpx.Response(200, json={"result": [{"path": "a.gcode"}]})
+        return httpx.Response(200, json={"result": {"state": "ready"}})
+
+    facade = SyncMoonraker(
+        "printer", loop=loop, retry_policy=None, circuit_breaker=None
+    )
+    facade.client._client = httpx.AsyncClient(
+        base_url=facade.client.base_url, transport=httpx.MockTransport(handler)
+    )
+    yield facade
+    facade.close()
+
+
+def test_tools_methods_block_until_done(
+    facade: SyncMoonraker, threads: List[str]
+) -> None:
+    """Test calling tools methods without an event loop in the caller."""
+    # Act
+    info = facade.tools(PrinterTools).get_info()
+    raw = facade.get("/printer/info")
+
+    # Assert
+    assert info == {"result": {"state": "ready"}}
+    assert raw == info
+    assert facade.tools(PrinterTools) is facade.tools(PrinterTools)
+    assert threads == ["moonraker-tools", "moonraker-tools"]
+
+
+def test_async_generators_become_iterators(facade: SyncMoonraker) -> None:
+    """Test iterating over a streamed listing from blocking code."""
+    # Act
+    files = list(facade.tools(FileManagerTools).iter_files())
+
+    # Assert
+    assert files == [{"path": "a.gcode"}]
+
+
+def test_calls_from_the_loop_thread_are_rejected(loop: EventLoopThread) -> None:
+    """Test that blocking inside the loop raises instead of deadlocking."""
+
+    # Arrange
+    async def nested() -> None:
+        loop.run(nested())
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        loop.run(nested())
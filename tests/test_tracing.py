@@ -0,0 +1,102 @@
+"""Tests for request tracing."""
+
+import importlib.util
+from typing import Generator
+
+import httpx
+import pytest
+from moonraker_tools import tracing
+from moonraker_tools.agent.context import AgentContext, set_context
+from moonraker_tools.agent.printer_status import get_printer_status
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.tracing import InMemoryExporter, OpenTelemetryHook
+
+
+@pytest.fixture
+def exporter() -> Generator[InMemoryExporter, None, None]:
+    """Fixture for an exporter receiving spans during the test."""
+    exporter = InMemoryExporter()
+    tracing.add_hook(exporter)
+    yield exporter
+    tracing.remove_hook(exporter)
+
+
+@pytest.fixture
+def client() -> Generator[MoonrakerClient, None, None]:
+    """Fixture for an agent context whose client answers from a mock transport."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/printer/info":
+            return httpx.Response(200, json={"result": {"state": "ready"}})
+        return httpx.Response(404, json={"error": "not found"})
+
+    client = MoonrakerClient("printer", retry_policy=None, circuit_breaker=None)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    set_context(AgentContext(client))
+    yield client
+    set_context(None)
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_from_tool_to_http(
+    exporter: InMemoryExporter, client: MoonrakerClient
+) -> None:
+    """Test that a tool call, its agent function and its request nest."""
+    # Act
+    with tracing.span("tool get_printer_status", tracing.TOOL, printer="printer"):
+        await get_printer_status()
+
+    # Assert
+    http, agent, tool = exporter.spans
+    assert [span.kind for span in (tool, agent, http)] == ["tool", "agent", "http"]
+    assert http.parent_id == agent.span_id
+    assert agent.parent_id == tool.span_id
+    assert tool.parent_id is None
+    assert {span.trace_id for span in exporter.spans} == {tool.trace_id}
+    assert http.attributes["endpoint"] == "/printer/info"
+    assert http.attributes["printer"] == "http://printer:7125"
+    assert http.attributes["status_code"] == 200
+    assert http.attributes["response_bytes"] > 0
+    assert tool.duration >= http.duration > 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_marked(
+    exporter: InMemoryExporter, client: MoonrakerClient
+) -> None:
+    """Test that an error raised inside a span is recorded on it."""
+    # Act
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("/server/missing")
+
+    # Assert
+    (span,) = exporter.spans
+    assert span.attributes["status_code"] == 404
+    assert span.error is not None and span.error.startswith("HTTPStatusError")
+    assert tracing.current_span() is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_no_spans_without_hooks(client: MoonrakerClient) -> None:
+    """Test that nothing is recorded while no hook is installed."""
+    # Act
+    with tracing.span("tool", tracing.TOOL) as span:
+        await get_printer_status()
+
+    # Assert
+    assert span is None
+    await client.close()
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("opentelemetry") is not None,
+    reason="opentelemetry is installed",
+)
+def test_opentelemetry_hook_requires_the_api() -> None:
+    """Test that the OpenTelemetry hook explains what to install."""
+    with pytest.raises(ImportError, match="opentelemetry-api"):
+        OpenTelemetryHook()
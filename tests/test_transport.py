@@ -0,0 +1,104 @@
+"""Tests for the client transport configuration."""
+
+import gzip
+import importlib.util
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from moonraker_tools.client import MoonrakerClient
+from moonraker_tools.transport import TransportConfig
+
+
+def test_timeout_for_uses_longest_prefix() -> None:
+    """Test matching endpoint timeouts by prefix."""
+    # Arrange
+    config = TransportConfig(endpoint_timeouts={"/server": 20.0, "/server/files": 60.0})
+
+    # Act & Assert
+    assert config.timeout_for("/server/files/upload") == 60.0
+    assert config.timeout_for("/server/info") == 20.0
+    assert config.timeout_for("/printer/info") is None
+
+
+@pytest.mark.asyncio
+async def test_per_call_timeout_overrides_config() -> None:
+    """Test that timeouts reach the transport per endpoint and per call."""
+    # Arrange
+    seen: List[Dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"result": "ok"})
+
+    config = TransportConfig(
+        timeout=3.0,
+        endpoint_timeouts={"/machine/update/upgrade": 600.0},
+        transport=httpx.MockTransport(handler),
+    )
+    client = MoonrakerClient(
+        "printer", transport_config=config, retry_policy=None, circuit_breaker=None
+    )
+
+    # Act
+    await client.get("/server/info")
+    await client.post("/machine/update/upgrade")
+    await client.get("/server/info", timeout=1.0)
+
+    # Assert
+    assert [timeout["read"] for timeout in seen] == [3.0, 600.0, 1.0]
+    await client.close()
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("h2") is not None, reason="h2 is installed"
+)
+def test_http2_requires_h2() -> None:
+    """Test that enabling HTTP/2 without h2 explains what to install."""
+    with pytest.raises(ImportError, match="h2"):
+        TransportConfig(http2=True).client_kwargs()
+
+
+@pytest.mark.asyncio
+async def test_compressed_responses_are_counted() -> None:
+    """Test negotiating gzip and recording wire and decoded sizes."""
+    # Arrange
+    body = json.dumps({"result": [{"path": f"{i}.gcode"} for i in range(200)]})
+    seen: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Accept-Encoding"])
+        return httpx.Response(
+            200,
+            content=gzip.compress(body.encode()),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    config = TransportConfig(transport=httpx.MockTransport(handler))
+    client = MoonrakerClient(
+        "printer", transport_config=config, retry_policy=None, circuit_breaker=None
+    )
+
+    # Act
+    result = await client.get("/server/files/list")
+    streamed = [item async for item in client.stream_items("/server/files/list")]
+
+    # Assert
+    assert "gzip" in seen[0]
+    assert streamed == result["result"]
+    stats = client.payloads.stats()["/server/files/list"]
+    assert stats["responses"] == 2
+    assert stats["decoded_bytes"] == 2 * len(body)
+    assert stats["wire_bytes"] < stats["decoded_bytes"]
+    assert stats["ratio"] < 0.5
+    await client.close()
+
+
+def test_compression_can_be_disabled() -> None:
+    """Test asking for uncompressed responses."""
+    # Act
+    kwargs = TransportConfig(compression=False).client_kwargs()
+
+    # Assert
+    assert kwargs["headers"] == {"Accept-Encoding": "identity"}
@@ -1,11 +1,12 @@
 """Tests for the update_manager tools."""
 
+import asyncio
 from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from moonraker_tools.client import MoonrakerClient
-from moonraker_tools.tools.update_manager import UpdateManagerTools
+from moonraker_tools.tools.update_manager import UpdateManagerTools, UpdateStatusCache
 
 
 @pytest.fixture
@@ -42,3 +43,103 @@ async def test_get_status(
     # Assert
     mock_client.get.assert_called_once_with("/machine/update/status")
     assert result == mock_response
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_and_skips_recent_refresh(
+    mock_client: AsyncMock,
+) -> None:
+    """Test that refreshes share a request and are skipped within the window."""
+    # Arrange
+    status = {"result": {"version_info": {"klipper": {}, "moonraker": {}}}}
+
+    async def slow_post(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        await asyncio.sleep(0.01)
+        return status
+
+    mock_client.post.side_effect = slow_post
+    cache = UpdateStatusCache(mock_client, refresh_window=60)
+
+    # Act
+    results = await asyncio.gather(
+        cache.refresh(), cache.refresh(), cache.refresh("klipper")
+    )
+    again = await cache.refresh("moonraker")
+    cached = await cache.get_status()
+
+    # Assert
+    assert results == [status] * 3 and again is status and cached is status
+    mock_client.post.assert_called_once_with("/machine/update/refresh", data={})
+    mock_client.get.assert_not_called()
+    assert set(cache.last_refresh) == {"klipper", "moonraker"}
+
+
+@pytest.mark.asyncio
+async def test_cache_forced_refresh(mock_client: AsyncMock) -> None:
+    """Test that a forced refresh bypasses the window."""
+    # Arrange
+    mock_client.post.return_value = {"result": {"version_info": {"klipper": {}}}}
+    cache = UpdateStatusCache(mock_client)
+    await cache.refresh("klipper")
+
+    # Act
+    await cache.refresh("klipper", force=True)
+
+    # Assert
+    assert mock_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tools_serve_cached_status_until_upgrade(
+    update_manager_tools: UpdateManagerTools, mock_client: AsyncMock
+) -> None:
+    """Test that the tools cache the status and forget it after an upgrade."""
+    # Arrange
+    mock_client.get.return_value = {"result": {"version_info": {}}}
+    mock_client.post.return_value = {"result": {"version_info": {"klipper": {}}}}
+
+    # Act
+    await update_manager_tools.get_status()
+    await update_manager_tools.get_status()
+    await update_manager_tools.refresh("klipper")
+    await update_manager_tools.refresh("klipper")
+    await update_manager_tools.upgrade("klipper")
+    await update_manager_tools.get_status()
+    await update_manager_tools.refresh("klipper")
+
+    # Assert
+    assert mock_client.get.call_count == 2
+    assert [call.args[0] for call in mock_client.post.call_args_list] == [
+        "/machine/update/refresh",
+        "/machine/update/upgrade",
+        "/machine/update/refresh",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_drops_status_fetched_before_invalidate(
+    mock_client: AsyncMock,
+) -> None:
+    """Test that a status requested before an invalidate is not stored."""
+    # Arrange
+    release = asyncio.Event()
+
+    async def slow_get(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        await release.wait()
+        return {"result": {"stale": True}}
+
+    mock_client.get.side_effect = slow_get
+    cache = UpdateStatusCache(mock_client)
+    stale = asyncio.ensure_future(cache.get_status())
+    await asyncio.sleep(0)
+
+    # Act
+    cache.invalidate()
+    release.set()
+    await stale
+    mock_client.get.side_effect = None
+    mock_client.get.return_value = {"result": {"stale": False}}
+    status = await cache.get_status()
+
+    # Assert
+    assert status == {"result": {"stale": False}}
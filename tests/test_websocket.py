@@ -0,0 +1,165 @@
+"""Tests for the Moonraker websocket client."""
+
+import asyncio
+import json
+from typing import Any, List, Tuple
+
+import pytest
+from moonraker_tools.websocket import (
+    NOTIFY_CONNECTED,
+    NOTIFY_DISCONNECTED,
+    MoonrakerWebsocket,
+)
+
+
+class FakeConnection:
+    """A websocket connection fed from a queue."""
+
+    def __init__(self) -> None:
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.sent: List[dict] = []
+        self.closed = False
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def __aiter__(self) -> "FakeConnection":
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+@pytest.fixture
+def connection(monkeypatch: pytest.MonkeyPatch) -> FakeConnection:
+    """Fixture for a fake connection returned by every connect."""
+    fake = FakeConnection()
+
+    async def connect(self: MoonrakerWebsocket) -> Any:
+        return fake
+
+    monkeypatch.setattr(MoonrakerWebsocket, "_connect", connect)
+    return fake
+
+
+async def start(events: List[Tuple[str, list]]) -> MoonrakerWebsocket:
+    """Start a websocket that records its notifications."""
+    websocket = MoonrakerWebsocket("printer", reconnect_delay=3600)
+    websocket.add_handler(lambda method, params: events.append((method, params)))
+    await websocket.start()
+    await asyncio.sleep(0)
+    return websocket
+
+
+@pytest.mark.asyncio
+async def test_responses_and_notifications_are_routed(
+    connection: FakeConnection,
+) -> None:
+    """Test that responses resolve calls and notifications reach handlers."""
+    # Arrange
+    events: List[Tuple[str, list]] = []
+    websocket = await start(events)
+
+    # Act
+    call = asyncio.create_task(websocket.call("server.info"))
+    await asyncio.sleep(0)
+    request = connection.sent[-1]
+    connection.incoming.put_nowait(
+        json.dumps({"jsonrpc": "2.0", "method": "notify_klippy_ready"})
+    )
+    connection.incoming.put_nowait(
+        json.dumps({"jsonrpc": "2.0", "result": {"ok": 1}, "id": request["id"]})
+    )
+    result = await call
+    await asyncio.sleep(0)
+
+    # Assert
+    assert request["method"] == "server.info"
+    assert result == {"ok": 1}
+    assert events == [(NOTIFY_CONNECTED, []), ("notify_klippy_ready", [])]
+    await websocket.close()
+
+
+@pytest.mark.asyncio
+async def test_error_response_fails_the_call(connection: FakeConnection) -> None:
+    """Test that a JSON-RPC error is raised from the call."""
+    # Arrange
+    websocket = await start([])
+
+    # Act
+    call = asyncio.create_task(websocket.call("printer.info"))
+    await asyncio.sleep(0)
+    error = {"code": 503, "message": "Klippy"}
+    connection.incoming.put_nowait(
+        json.dumps({"error": error, "id": connection.sent[-1]["id"]})
+    )
+
+    # Assert
+    with pytest.raises(RuntimeError, match="Klippy"):
+        await call
+    await websocket.close()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_fails_pending_calls(connection: FakeConnection) -> None:
+    """Test that a disconnect fails pending calls and is dispatched."""
+    # Arrange
+    events: List[Tuple[str, list]] = []
+    websocket = await start(events)
+    call = asyncio.create_task(websocket.call("server.info"))
+    await asyncio.sleep(0)
+
+    # Act
+    connection.incoming.put_nowait(None)
+
+    # Assert
+    with pytest.raises(ConnectionError):
+        await call
+    await asyncio.sleep(0)
+    assert events == [(NOTIFY_CONNECTED, []), (NOTIFY_DISCONNECTED, [])]
+    assert connection.closed
+    assert not websocket.connected
+    await websocket.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_are_retried_with_backoff(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that any connect error is retried after a growing delay."""
+    # Arrange
+    fake = FakeConnection()
+    errors = [RuntimeError("401 Unauthorized"), ValueError("bad handshake")]
+    delays: List[float] = []
+    sleep = asyncio.sleep
+
+    async def connect(self: MoonrakerWebsocket) -> Any:
+        if errors:
+            raise errors.pop(0)
+        return fake
+
+    async def record_sleep(delay: float) -> None:
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(MoonrakerWebsocket, "_connect", connect)
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+    websocket = MoonrakerWebsocket(
+        "printer", reconnect_delay=1, max_reconnect_delay=1.5
+    )
+
+    # Act
+    await websocket.start()
+    for _ in range(5):
+        await sleep(0)
+
+    # Assert
+    assert websocket.connected
+    assert delays[:2] == [1, 1.5]
+    await websocket.close()